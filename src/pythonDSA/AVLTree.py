@@ -9,8 +9,12 @@
 #  - If balance factor < -1 or > 1 → tree is unbalanced
 #  - To fix imbalance, we perform rotations: LL, RR, LR, RL
 #  - Time Complexity: O(log n) for search, insert, delete
+#  - Each node also stores its subtree size, so rank/select are O(log n)
 # ================================================================
 
+from BinarySearchTrees import iter_range, iter_from
+
+
 class TreeNode:
     """Node class for AVL Tree"""
     def __init__(self, data):
@@ -18,6 +22,15 @@ class TreeNode:
         self.left = None
         self.right = None
         self.height = 1  # Default height when node created
+        self.size = 1    # Number of nodes in this subtree (order statistics)
+
+    def update(self):
+        """Recompute the fields derived from the children (height, subtree size)"""
+        left, right = self.left, self.right
+        leftHeight = left.height if left else 0
+        rightHeight = right.height if right else 0
+        self.height = 1 + (leftHeight if leftHeight > rightHeight else rightHeight)
+        self.size = 1 + (left.size if left else 0) + (right.size if right else 0)
 
 
 # ==============================
@@ -29,6 +42,12 @@ def getHeight(node):
         return 0
     return node.height
 
+def getSize(node):
+    """Return number of nodes in the subtree rooted at node"""
+    if not node:
+        return 0
+    return node.size
+
 def getBalance(node):
     """Balance factor = height(left) - height(right)"""
     if not node:
@@ -39,9 +58,10 @@ def getBalance(node):
 # ==============================
 # Rotations
 # ==============================
-def rightRotate(y):
+def rightRotate(y, verbose=True):
     """Right rotation (LL case fix)"""
-    print(f"\n➡️ Performing RIGHT rotation on node [{y.data}] (LL case)")
+    if verbose:
+        print(f"\n➡️ Performing RIGHT rotation on node [{y.data}] (LL case)")
     x = y.left
     T2 = x.right
 
@@ -49,15 +69,16 @@ def rightRotate(y):
     x.right = y
     y.left = T2
 
-    # Update heights
-    y.height = 1 + max(getHeight(y.left), getHeight(y.right))
-    x.height = 1 + max(getHeight(x.left), getHeight(x.right))
+    # Update heights and subtree sizes (child first, then new root)
+    y.update()
+    x.update()
 
     return x
 
-def leftRotate(x):
+def leftRotate(x, verbose=True):
     """Left rotation (RR case fix)"""
-    print(f"\n➡️ Performing LEFT rotation on node [{x.data}] (RR case)")
+    if verbose:
+        print(f"\n➡️ Performing LEFT rotation on node [{x.data}] (RR case)")
     y = x.right
     T2 = y.left
 
@@ -65,9 +86,9 @@ def leftRotate(x):
     y.left = x
     x.right = T2
 
-    # Update heights
-    x.height = 1 + max(getHeight(x.left), getHeight(x.right))
-    y.height = 1 + max(getHeight(y.left), getHeight(y.right))
+    # Update heights and subtree sizes (child first, then new root)
+    x.update()
+    y.update()
 
     return y
 
@@ -91,8 +112,8 @@ def insert(node, data):
         print(f"⚠️ Duplicate value [{data}] ignored (AVL only supports unique values)")
         return node
 
-    # Update height
-    node.height = 1 + max(getHeight(node.left), getHeight(node.right))
+    # Update height and subtree size
+    node.update()
 
     # Get balance factor
     balance = getBalance(node)
@@ -161,8 +182,8 @@ def delete(node, data):
     if node is None:
         return node
 
-    # Update height
-    node.height = 1 + max(getHeight(node.left), getHeight(node.right))
+    # Update height and subtree size
+    node.update()
     balance = getBalance(node)
 
     # Balance cases
@@ -200,6 +221,274 @@ def preOrderTraversal(node):
     preOrderTraversal(node.right)
 
 
+# ==============================
+# Order Statistics (uses subtree sizes)
+# ==============================
+def select(node, k):
+    """Return the k-th smallest key (0-based) in the subtree rooted at node"""
+    if not 0 <= k < getSize(node):
+        raise IndexError("select index out of range")
+    while True:
+        leftSize = getSize(node.left)
+        if k < leftSize:
+            node = node.left
+        elif k == leftSize:
+            return node.data
+        else:
+            k -= leftSize + 1
+            node = node.right
+
+def countBelow(node, data, inclusive=False):
+    """Count keys < data (or <= data when inclusive) in the subtree rooted at node"""
+    count = 0
+    while node is not None:
+        if data < node.data or (data == node.data and not inclusive):
+            node = node.left
+        else:
+            count += getSize(node.left) + 1
+            node = node.right
+    return count
+
+def rank(node, data):
+    """Number of keys smaller than data (= position data has/would have in sorted order)"""
+    return countBelow(node, data)
+
+def count_range(node, lo, hi):
+    """Number of keys in the closed range [lo, hi]"""
+    if hi < lo:
+        return 0
+    return countBelow(node, hi, inclusive=True) - countBelow(node, lo)
+
+
+# ==============================
+# Quiet, Iterative AVL Tree
+# ==============================
+def rebalance(node):
+    """Update height/size and fix any imbalance at node (no printing); returns new subtree root"""
+    node.update()
+    balance = getBalance(node)
+
+    # Left heavy: LL (single rotation) or LR (double rotation)
+    if balance > 1:
+        if getBalance(node.left) < 0:
+            node.left = leftRotate(node.left, verbose=False)
+        return rightRotate(node, verbose=False)
+
+    # Right heavy: RR (single rotation) or RL (double rotation)
+    if balance < -1:
+        if getBalance(node.right) > 0:
+            node.right = rightRotate(node.right, verbose=False)
+        return leftRotate(node, verbose=False)
+
+    return node
+
+
+class AVLTree:
+    """AVL Tree with iterative insert/delete/search and no printing (for large key sets)"""
+
+    nodeClass = TreeNode  # subclasses may use a node with extra augmented fields
+
+    def __init__(self):
+        self.root = None
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, data):
+        return self.search(data) is not None
+
+    def __iter__(self):
+        return iter_range(self.root)
+
+    def __reversed__(self):
+        return iter_range(self.root, reverse=True)
+
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        """Lazily yield keys in [lo, hi], ascending (or descending when reverse)"""
+        return iter_range(self.root, lo, hi, reverse)
+
+    def iter_from(self, data, reverse=False):
+        """Lazily yield keys >= data ascending (or <= data descending when reverse)"""
+        return iter_from(self.root, data, reverse)
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from ascending keys in O(n) (duplicates are skipped)"""
+        keys = []
+        for data in iterable:
+            if keys and not keys[-1] < data:
+                if data < keys[-1]:
+                    raise ValueError("from_sorted() expects keys in ascending order")
+                continue
+            keys.append(data)
+
+        def build(lo, hi):
+            # Recursion depth is only log2(n): the middle key becomes the subtree root
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = cls.nodeClass(keys[mid])
+            node.left = build(lo, mid - 1)
+            node.right = build(mid + 1, hi)
+            node.update()
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(keys) - 1)
+        tree.count = len(keys)
+        return tree
+
+    def search(self, data):
+        """Return the node holding data, or None if not found"""
+        node = self.root
+        while node is not None:
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def select(self, k):
+        """Return the k-th smallest key (0-based) in O(log n)"""
+        return select(self.root, k)
+
+    def rank(self, data):
+        """Return how many keys are smaller than data in O(log n)"""
+        return rank(self.root, data)
+
+    def count_range(self, lo, hi):
+        """Return how many keys lie in [lo, hi] in O(log n)"""
+        return count_range(self.root, lo, hi)
+
+    def insert(self, data):
+        """Insert data; returns False if it was already present"""
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if data < node.data:
+                node = node.left
+            elif data > node.data:
+                node = node.right
+            else:
+                return False
+
+        newNode = self.nodeClass(data)
+        if not path:
+            self.root = newNode
+        elif data < path[-1].data:
+            path[-1].left = newNode
+        else:
+            path[-1].right = newNode
+        self.count += 1
+        self._rebalancePath(path)
+        return True
+
+    def delete(self, data):
+        """Delete data; returns False if it was not found"""
+        path = []
+        node = self.root
+        while node is not None:
+            if data < node.data:
+                path.append(node)
+                node = node.left
+            elif data > node.data:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        if node is None:
+            return False
+
+        # Two children: copy the inorder successor up, then unlink the successor instead
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self.count -= 1
+        self._rebalancePath(path)
+        return True
+
+    def _rebalancePath(self, path):
+        """Walk back up the search path, rebalancing and relinking rotated subtrees"""
+        balanced = False
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            if balanced:
+                node.update()
+                continue
+            oldHeight = node.height
+            newRoot = rebalance(node)
+            if newRoot is not node:
+                if i == 0:
+                    self.root = newRoot
+                elif path[i - 1].left is node:
+                    path[i - 1].left = newRoot
+                else:
+                    path[i - 1].right = newRoot
+            # Same subtree height → above this point only the augmented fields can change
+            if newRoot.height == oldHeight:
+                balanced = True
+
+
+# ==============================
+# Benchmark
+# ==============================
+def benchmark(n=100_000, seed=42):
+    """Compare the printing, recursive insert() with the quiet AVLTree class"""
+    import os
+    import random
+    import time
+    from contextlib import redirect_stdout
+
+    keys = random.Random(seed).sample(range(n * 10), n)
+
+    start = time.perf_counter()
+    root = None
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        for key in keys:
+            root = insert(root, key)
+    legacyInsert = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = AVLTree()
+    for key in keys:
+        tree.insert(key)
+    classInsert = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = AVLTree.from_sorted(sorted(keys))
+    bulkLoad = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for key in keys:
+        tree.search(key)
+    searchAll = time.perf_counter() - start
+
+    print(f"Benchmark with {n:,} random keys:")
+    print(f"  insert() (recursive, printing)  : {legacyInsert:8.3f} s")
+    print(f"  AVLTree.insert (iterative)      : {classInsert:8.3f} s")
+    print(f"  AVLTree.from_sorted (bulk load) : {bulkLoad:8.3f} s")
+    print(f"  AVLTree.search (all keys)       : {searchAll:8.3f} s")
+    print(f"  Heights → insert(): {getHeight(root)}, AVLTree: {getHeight(tree.root)}, "
+          f"from_sorted: {getHeight(bulk.root)}")
+
+
 # ==============================
 # DEMONSTRATION
 # ==============================
@@ -242,3 +531,39 @@ if __name__ == "__main__":
     print("3. Four imbalance cases: LL, RR, LR, RL → fixed by rotations.")
     print("4. Compared to unbalanced BST (O(n)), AVL is much faster for large data.")
     print("5. Rotations maintain BST property + sorted InOrder traversal.\n")
+
+    print("\n==============================")
+    print(" DEMO: Quiet AVLTree class ")
+    print("==============================\n")
+
+    tree = AVLTree()
+    for letter in letters:
+        tree.insert(letter)
+    tree.delete('H')
+    tree.delete('C')
+    print("✅ Same operations, no printing. PreOrder Traversal:")
+    preOrderTraversal(tree.root)
+    print(f"\nSize: {len(tree)}, 'D' in tree: {'D' in tree}, 'H' in tree: {'H' in tree}")
+
+    bulk = AVLTree.from_sorted(range(1, 16))
+    print("\n✅ from_sorted(1..15) builds a perfect tree, PreOrder:")
+    preOrderTraversal(bulk.root)
+    print("\n")
+
+    print("✅ Order statistics (no traversal needed):")
+    print("select(0) =", bulk.select(0), "| select(7) =", bulk.select(7))
+    print("rank(10) =", bulk.rank(10), "| count_range(4, 11) =", bulk.count_range(4, 11))
+    print("Module-level tree root size =", getSize(root), "| select(root, 2) =", select(root, 2), "\n")
+
+    print("✅ Lazy iterators (stream keys instead of printing them):")
+    print("iter_range(5, 9) =", list(bulk.iter_range(5, 9)))
+    print("reversed(tree)   =", list(reversed(tree)))
+    page = []
+    for key in bulk.iter_from(12):
+        if len(page) == 3:
+            break  # paginated scan: stop early, remaining nodes are never visited
+        page.append(key)
+    print("First page from 12 =", page, "\n")
+
+    benchmark()
+    print()
@@ -0,0 +1,264 @@
+"""
+Array-Backed Binary Search Tree (Struct-of-Arrays Node Pool)
+------------------------------------------------------------
+This program demonstrates:
+- Storing BST nodes in parallel typed arrays (key / left / right)
+- Integer slot indices instead of object pointers (NIL = -1)
+- A free list that recycles the slots of deleted nodes
+- Insert, Search, Delete and Minimum Node without recursion
+- Memory/throughput comparison with the object-based BST
+
+Why? Every TreeNode object in BinarySearchTrees.py costs a full Python
+object plus a __dict__ (well over 100 bytes). Here a node is three
+int64 entries (24 bytes) packed next to its neighbours in memory.
+"""
+
+from array import array
+
+NIL = -1  # "null pointer" for slot indices
+
+
+class ArrayBST:
+    """BST of int64 keys whose nodes live in parallel array('q') columns"""
+
+    def __init__(self):
+        self.key = array('q')
+        self.left = array('q')
+        self.right = array('q')
+        self.root = NIL
+        self.freeHead = NIL  # free slots are chained through self.left
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key) != NIL
+
+    def __iter__(self):
+        """In-order (sorted) keys using an explicit stack of slot indices"""
+        keys, left, right = self.key, self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield keys[i]
+            i = right[i]
+
+    def nbytes(self):
+        """Bytes used by the three node columns (including free slots)"""
+        return sum(column.itemsize * len(column) for column in (self.key, self.left, self.right))
+
+    # -------------------------
+    # Slot allocation
+    # -------------------------
+    def _allocate(self, key):
+        i = self.freeHead
+        if i != NIL:
+            self.freeHead = self.left[i]
+            self.key[i] = key
+            self.left[i] = NIL
+            self.right[i] = NIL
+        else:
+            i = len(self.key)
+            self.key.append(key)
+            self.left.append(NIL)
+            self.right.append(NIL)
+        return i
+
+    def _free(self, i):
+        self.left[i] = self.freeHead
+        self.right[i] = NIL
+        self.freeHead = i
+
+    # -------------------------
+    # BST operations
+    # -------------------------
+    def search(self, key):
+        """Return the slot index holding key, or NIL if not found"""
+        keys, left, right = self.key, self.left, self.right
+        i = self.root
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                i = left[i]
+            elif key > k:
+                i = right[i]
+            else:
+                return i
+        return NIL
+
+    def insert(self, key):
+        """Insert key; returns False if it was already present"""
+        keys, left, right = self.key, self.left, self.right
+        parent = NIL
+        i = self.root
+        while i != NIL:
+            k = keys[i]
+            parent = i
+            if key < k:
+                i = left[i]
+            elif key > k:
+                i = right[i]
+            else:
+                return False
+
+        new = self._allocate(key)
+        if parent == NIL:
+            self.root = new
+        elif key < keys[parent]:
+            left[parent] = new
+        else:
+            right[parent] = new
+        self.count += 1
+        return True
+
+    def minValueNode(self, i=None):
+        """Slot index of the minimum key in the subtree at slot i (default: root)"""
+        if i is None:
+            i = self.root
+        if i == NIL:
+            return NIL
+        left = self.left
+        while left[i] != NIL:
+            i = left[i]
+        return i
+
+    def delete(self, key):
+        """Delete key; returns False if it was not found"""
+        keys, left, right = self.key, self.left, self.right
+        parent = NIL
+        i = self.root
+        while i != NIL:
+            k = keys[i]
+            if key < k:
+                parent, i = i, left[i]
+            elif key > k:
+                parent, i = i, right[i]
+            else:
+                break
+        if i == NIL:
+            return False
+
+        # Two children: copy the in-order successor's key, then unlink the successor
+        if left[i] != NIL and right[i] != NIL:
+            parent = i
+            successor = right[i]
+            while left[successor] != NIL:
+                parent, successor = successor, left[successor]
+            keys[i] = keys[successor]
+            i = successor
+
+        # Now slot i has at most one child: splice it out
+        child = left[i] if left[i] != NIL else right[i]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == i:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._free(i)
+        self.count -= 1
+        return True
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def benchmark(n=300_000, seed=7):
+    """Compare memory and throughput with the object-based BST functions"""
+    import random
+    import time
+    import tracemalloc
+    import BinarySearchTrees as objectBST
+
+    keys = random.Random(seed).sample(range(n * 10), n)
+
+    def buildObjectTree():
+        root = None
+        for key in keys:
+            root = objectBST.insert(root, key)
+        return root
+
+    def buildArrayTree():
+        tree = ArrayBST()
+        for key in keys:
+            tree.insert(key)
+        return tree
+
+    results = {}
+    for name, build in (("Object BST", buildObjectTree), ("ArrayBST", buildArrayTree)):
+        # Memory: trace a separate build so tracing overhead doesn't skew the timings
+        tracemalloc.start()
+        tree = build()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+
+        start = time.perf_counter()
+        tree = build()
+        insertTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if name == "ArrayBST":
+            for key in keys:
+                tree.search(key)
+        else:
+            for key in keys:
+                objectBST.search(tree, key)
+        searchTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if name == "ArrayBST":
+            for key in keys[::2]:
+                tree.delete(key)
+        else:
+            for key in keys[::2]:
+                tree = objectBST.delete(tree, key)
+        deleteTime = time.perf_counter() - start
+        results[name] = (memory, insertTime, searchTime, deleteTime)
+
+    print(f"Benchmark with {n:,} random int keys:")
+    print(f"  {'':12} {'memory':>10} {'bytes/node':>11} {'insert':>9} {'search':>9} {'delete½':>9}")
+    for name, (memory, insertTime, searchTime, deleteTime) in results.items():
+        print(f"  {name:12} {memory / 2**20:8.1f}MB {memory / n:11.1f} "
+              f"{insertTime:8.3f}s {searchTime:8.3f}s {deleteTime:8.3f}s")
+
+
+# -------------------------
+# Demonstration
+# -------------------------
+if __name__ == "__main__":
+    print("\n========== Array-Backed BST Demonstration ==========\n")
+
+    tree = ArrayBST()
+    for value in [13, 7, 15, 3, 8, 14, 19, 18]:
+        tree.insert(value)
+
+    print("Slot | key | left | right")
+    for i in range(len(tree.key)):
+        print(f"{i:4} | {tree.key[i]:3} | {tree.left[i]:4} | {tree.right[i]:5}")
+    print("Root slot:", tree.root, "\n")
+
+    print("In-order Traversal:", list(tree))
+    print("Search 14 → slot", tree.search(14), "| Search 99 → slot", tree.search(99))
+    print("Minimum value:", tree.key[tree.minValueNode()], "\n")
+
+    print("Deleting 15 (two children) and 3 (leaf)...")
+    tree.delete(15)
+    tree.delete(3)
+    print("In-order Traversal after deletion:", list(tree))
+    print("Free list head slot:", tree.freeHead)
+    tree.insert(10)
+    print("Inserted 10 → reused slot", tree.search(10), "from the free list\n")
+
+    benchmark()
+
+    print("\n========== Important Notes ==========")
+    print("1. Nodes are rows in three int64 columns: no per-node Python object.")
+    print("2. 'Pointers' are slot indices, NIL (-1) means no child.")
+    print("3. Deleted slots are recycled through a free list, so the arrays do not grow.")
+    print("4. Only int64 keys fit in array('q'); use the object BST for other key types.\n")
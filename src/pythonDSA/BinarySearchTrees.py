@@ -4,6 +4,7 @@ Binary Search Trees (BST) in Python
 This program demonstrates:
 - BST properties
 - Traversals (In-order, Pre-order, Post-order)
+- Lazy range-scan iterators (forward and reverse)
 - Searching, Insertion, Deletion
 - Finding Minimum Node
 - Balanced vs Unbalanced BST Concept
@@ -47,6 +48,63 @@ def postOrderTraversal(node):
     print(node.data, end=" ")
 
 
+# -------------------------
+# Lazy Range-Scan Iterators
+# -------------------------
+# These work for any node with .data/.left/.right (BST and AVL nodes).
+# An explicit stack replaces recursion; only the nodes on the current
+# root-to-leaf path are held, so a scan touches O(log n + k) nodes.
+def _iterAscending(node, lo, hi):
+    stack = []
+    # Seek: keep only the path nodes that are >= lo
+    while node is not None:
+        if lo is not None and node.data < lo:
+            node = node.right
+        else:
+            stack.append(node)
+            node = node.left
+    while stack:
+        node = stack.pop()
+        if hi is not None and node.data > hi:
+            return
+        yield node.data
+        node = node.right
+        while node is not None:
+            stack.append(node)
+            node = node.left
+
+def _iterDescending(node, lo, hi):
+    stack = []
+    # Seek: keep only the path nodes that are <= hi
+    while node is not None:
+        if hi is not None and node.data > hi:
+            node = node.left
+        else:
+            stack.append(node)
+            node = node.right
+    while stack:
+        node = stack.pop()
+        if lo is not None and node.data < lo:
+            return
+        yield node.data
+        node = node.left
+        while node is not None:
+            stack.append(node)
+            node = node.right
+
+def iter_range(node, lo=None, hi=None, reverse=False):
+    """Lazily yield keys in [lo, hi] (None = unbounded), ascending or descending"""
+    if reverse:
+        return _iterDescending(node, lo, hi)
+    return _iterAscending(node, lo, hi)
+
+def iter_from(node, key, reverse=False):
+    """Lazily yield keys >= key ascending (or keys <= key descending when reverse)"""
+    if reverse:
+        return _iterDescending(node, None, key)
+    return _iterAscending(node, key, None)
+
+
 # -------------------------
 # Search in BST
 # -------------------------
@@ -174,6 +232,13 @@ if __name__ == "__main__":
     inOrderTraversal(root)
     print("\n")
 
+    # Lazy Iterators
+    print("Range scan [8, 18]:", list(iter_range(root, 8, 18)))
+    print("Reverse scan (all):", list(iter_range(root, reverse=True)))
+    print("Keys from 14 onward:", list(iter_from(root, 14)))
+    print("Keys up to 13, descending:", list(iter_from(root, 13, reverse=True)))
+    print("Note: iterators are lazy - nodes are only visited when their key is requested.\n")
+
     # Balanced vs Unbalanced Tree
     print("\n========== Important Notes ==========")
     print("1. BST operations like Search, Insert, Delete are O(h), where h = tree height.")
@@ -111,7 +111,23 @@ print()
 
 print("Breadth First Search (BFS): ", end="")
 bfsTraversal(root)
-print("\n")
+print()
+
+# Level Order generator: same BFS, but yields values instead of printing them
+def levelOrder(node):
+    if not node:
+        return
+    queue = deque([node])
+    while queue:
+        curr = queue.popleft()
+        yield curr.data
+        if curr.left:
+            queue.append(curr.left)
+        if curr.right:
+            queue.append(curr.right)
+
+print("Level Order (generator) :", list(levelOrder(root)))
+print()
 
 print("--- Important Note ---")
 print("✅ Pre-order: Root before children → Useful for copying tree, prefix expressions.")
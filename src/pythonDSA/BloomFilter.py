@@ -0,0 +1,340 @@
+# ================================================================
+# BLOOM FILTER - MEMBERSHIP PRE-SCREENING IN A FEW BITS PER KEY
+# ================================================================
+# contains / contains_with_chaining in Hashtable.py keep every key in
+# memory. A Bloom filter only keeps m bits:
+#   - add(key)     : set k bit positions derived from the key's hash
+#   - key in bf    : True only if all k positions are set
+#   - "No" is always correct; "yes" is wrong with a small, chosen
+#     probability (the false-positive rate p)
+#
+# Sizing for n keys and target rate p:
+#   m = -n·ln(p) / (ln 2)²  bits       k = (m / n)·ln 2  hash positions
+#   (p = 1% → 9.6 bits and 7 positions per key, whatever the key size)
+#
+# Double hashing: position i = (h1 + i·h2) mod m, so one 128-bit hash
+# per key gives all k positions (Kirsch & Mitzenmacher).
+#
+# The bits live in a bytearray viewed as a NumPy array, so whole batches
+# are hashed and tested at once (add_many / contains_many), and a saved
+# filter can be memory-mapped instead of read into memory.
+#
+# CountingBloomFilter keeps a small counter per position instead of a
+# bit, so keys can also be removed.
+# ================================================================
+
+import math
+import mmap
+import struct
+from hashlib import blake2b
+
+import numpy as np
+
+from HashFunctions import MASK64, toBytes
+
+HEADER = struct.Struct("<4sxxxxQQQ")  # magic, cells (m), hash count (k), items added
+BIT = np.array([1, 2, 4, 8, 16, 32, 64, 128], dtype=np.uint8)
+BATCH = 1 << 18  # keys hashed per step, bounds the (batch x k) position array
+
+
+def splitmix64(x):
+    """SplitMix64 finalizer; works on Python ints and on uint64 NumPy arrays"""
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def hashPairs(keys):
+    """Two 64-bit hashes (h1, h2 odd) per key as uint64 arrays
+
+    Integer keys are mixed with SplitMix64 in one vectorized pass; any other
+    key (str, bytes, ...) goes through blake2b, one key at a time. The same
+    key gets the same hashes whichever path it takes.
+    """
+    if isinstance(keys, np.ndarray) and keys.dtype.kind in "iu":
+        x = keys.astype(np.int64, copy=False).view(np.uint64)
+        h1 = splitmix64(x)
+        return h1, splitmix64(h1) | 1
+
+    keys = list(keys)
+    if all(isinstance(key, (int, np.integer)) for key in keys):
+        try:
+            return hashPairs(np.array(keys, dtype=np.int64))
+        except OverflowError:
+            pass  # some ints do not fit int64 → per-key path below
+
+    h1 = np.empty(len(keys), dtype=np.uint64)
+    h2 = np.empty(len(keys), dtype=np.uint64)
+    for i, key in enumerate(keys):
+        if isinstance(key, (int, np.integer)) and -(1 << 63) <= key < (1 << 64):
+            a = splitmix64(int(key) & MASK64)
+            b = splitmix64(a) | 1
+        else:
+            digest = blake2b(toBytes(key), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], "little")
+            b = int.from_bytes(digest[8:], "little") | 1
+        h1[i], h2[i] = a, b
+    return h1, h2
+
+
+def optimalSize(capacity, errorRate):
+    """(m, k) for capacity keys at false-positive rate errorRate"""
+    if capacity <= 0 or not 0 < errorRate < 1:
+        raise ValueError("capacity must be > 0 and errorRate between 0 and 1")
+    m = math.ceil(-capacity * math.log(errorRate) / math.log(2) ** 2)
+    k = max(1, round(m / capacity * math.log(2)))
+    return m, k
+
+
+class BloomFilter:
+    """Bloom filter over a bytearray bit array with vectorized batch operations"""
+
+    MAGIC = b"BLMF"
+
+    def __init__(self, capacity=1_000_000, errorRate=0.01):
+        m, k = optimalSize(capacity, errorRate)
+        self._setup(m, k, bytearray(self._bufferSize(m)), 0)
+
+    def _setup(self, m, k, buffer, count):
+        self.m = m
+        self.k = k
+        self.count = count  # items added (duplicates included)
+        self.buffer = buffer
+        self.cells = np.frombuffer(buffer, dtype=np.uint8, count=self._bufferSize(m),
+                                   offset=HEADER.size if isinstance(buffer, mmap.mmap) else 0)
+        self.steps = np.arange(k, dtype=np.uint64)
+        self.writableMap = False
+
+    @staticmethod
+    def _bufferSize(m):
+        return (m + 7) // 8
+
+    # -------------------------------------------------
+    # Bit positions
+    # -------------------------------------------------
+    def _positions(self, keys):
+        """(len(keys), k) array of positions h1 + i·h2 mod m"""
+        h1, h2 = hashPairs(keys)
+        return (h1[:, None] + h2[:, None] * self.steps) % np.uint64(self.m)
+
+    def _set(self, positions):
+        np.bitwise_or.at(self.cells, positions >> 3, BIT[positions & 7])
+
+    def _checkWritable(self):
+        # ufunc.at does not honour a read-only NumPy view: writing would hit the read-only map
+        if not self.cells.flags.writeable:
+            raise ValueError("filter was loaded read-only; use load(path, writable=True) to modify it")
+
+    def _test(self, positions):
+        return ((self.cells[positions >> 3] & BIT[positions & 7]) != 0).all(axis=1)
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    def add_many(self, keys):
+        """Add a batch of keys (NumPy int arrays take the fully vectorized path)"""
+        self._checkWritable()
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        for i in range(0, len(keys), BATCH):
+            chunk = keys[i:i + BATCH]
+            self._set(self._positions(chunk))
+            self.count += len(chunk)
+
+    def contains_many(self, keys):
+        """Boolean array: False = definitely absent, True = probably present"""
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        result = np.empty(len(keys), dtype=bool)
+        for i in range(0, len(keys), BATCH):
+            result[i:i + BATCH] = self._test(self._positions(keys[i:i + BATCH]))
+        return result
+
+    def add(self, key):
+        self.add_many([key])
+
+    def __contains__(self, key):
+        return bool(self.contains_many([key])[0])
+
+    def __len__(self):
+        return self.count
+
+    def falsePositiveRate(self):
+        """Expected false-positive rate after count insertions: (1 - e^(-kn/m))^k"""
+        return (1 - math.exp(-self.k * self.count / self.m)) ** self.k
+
+    @property
+    def nbytes(self):
+        return self.cells.nbytes
+
+    # -------------------------------------------------
+    # Save / memory-mapped load
+    # -------------------------------------------------
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(self.MAGIC, self.m, self.k, self.count))
+            f.write(self.cells)
+
+    @classmethod
+    def load(cls, path, writable=False):
+        """Memory-map a saved filter; pages are read on demand, not up front
+
+        With writable=True, adds go straight to the file (call flush()/close()
+        to store the new item count in the header).
+        """
+        with open(path, "r+b" if writable else "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, m, k, count = HEADER.unpack_from(buffer, 0)
+        if magic != cls.MAGIC or len(buffer) < HEADER.size + cls._bufferSize(m):
+            buffer.close()
+            raise ValueError(f"{path} is not a saved {cls.__name__}")
+        bf = cls.__new__(cls)
+        bf._setup(m, k, buffer, count)
+        bf.writableMap = writable
+        return bf
+
+    def flush(self):
+        if self.writableMap:
+            HEADER.pack_into(self.buffer, 0, self.MAGIC, self.m, self.k, self.count)
+            self.buffer.flush()
+
+    def close(self):
+        """Unmap a loaded filter (no-op for an in-memory one)"""
+        if isinstance(self.buffer, mmap.mmap) and not self.buffer.closed:
+            self.flush()
+            del self.cells  # drop the NumPy view so the map can close
+            self.buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CountingBloomFilter(BloomFilter):
+    """Bloom filter with 8-bit saturating counters instead of bits → supports remove
+
+    A counter that reaches 255 stays there (it can no longer tell how many
+    keys share it), so removing never causes false negatives. Only remove
+    keys that were actually added: removing a false positive clears counters
+    that real keys rely on.
+    """
+
+    MAGIC = b"CBLM"
+
+    @staticmethod
+    def _bufferSize(m):
+        return m
+
+    def _set(self, positions):
+        cells, counts = np.unique(positions, return_counts=True)
+        self.cells[cells] = np.minimum(self.cells[cells] + counts, 255)
+
+    def _test(self, positions):
+        return (self.cells[positions] != 0).all(axis=1)
+
+    def remove_many(self, keys):
+        """Remove the keys that test present; returns the boolean 'was present' array"""
+        self._checkWritable()
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        present = np.empty(len(keys), dtype=bool)
+        for i in range(0, len(keys), BATCH):
+            positions = self._positions(keys[i:i + BATCH])
+            hit = self._test(positions)
+            present[i:i + BATCH] = hit
+            cells, counts = np.unique(positions[hit], return_counts=True)
+            current = self.cells[cells].astype(np.int64)
+            self.cells[cells] = np.where(current == 255, 255, np.maximum(current - counts, 0))
+            self.count -= int(hit.sum())
+        return present
+
+    def remove(self, key):
+        return bool(self.remove_many([key])[0])
+
+
+# ================================================================
+# BENCHMARK: Bloom filter vs keeping every key in a Python set
+# ================================================================
+def benchmark(n=1_000_000, errorRate=0.01, seed=7):
+    import os
+    import sys
+    import tempfile
+    import time
+
+    rng = np.random.default_rng(seed)
+    keys = rng.choice(2**62, size=2 * n, replace=False).astype(np.int64)
+    present, absent = keys[:n], keys[n:]
+
+    start = time.perf_counter()
+    bf = BloomFilter(n, errorRate)
+    bf.add_many(present)
+    addTime = time.perf_counter() - start
+    start = time.perf_counter()
+    hits = bf.contains_many(present)
+    falseHits = bf.contains_many(absent)
+    bloomLookup = time.perf_counter() - start
+    assert hits.all()  # no false negatives
+
+    ids = present.tolist()
+    start = time.perf_counter()
+    seen = set(ids)
+    setAdd = time.perf_counter() - start
+    probes = ids + absent.tolist()
+    start = time.perf_counter()
+    for key in probes:
+        key in seen
+    setLookup = time.perf_counter() - start
+    setBytes = sys.getsizeof(seen) + sum(sys.getsizeof(key) for key in ids)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "ids.bloom")
+        bf.save(path)
+        start = time.perf_counter()
+        with BloomFilter.load(path) as mapped:
+            sample = mapped.contains_many(present[:1000])
+            openTime = time.perf_counter() - start
+        assert sample.all()
+
+    bitsPerKey = bf.m / n
+    print(f"Benchmark with {n:,} int64 IDs (target false-positive rate {errorRate:.1%}):")
+    print(f"  {'':22} {'build s':>8} {'2n lookups s':>13} {'memory MB':>10}")
+    print(f"  {'Python set':22} {setAdd:8.3f} {setLookup:13.3f} {setBytes / 1e6:10.1f}")
+    print(f"  {'BloomFilter':22} {addTime:8.3f} {bloomLookup:13.3f} {bf.nbytes / 1e6:10.1f}")
+    print(f"  m = {bf.m:,} bits ({bitsPerKey:.1f} bits/key), k = {bf.k}")
+    print(f"  Measured false-positive rate: {falseHits.mean():.3%} (expected {bf.falsePositiveRate():.3%})")
+    print(f"  mmap load + 1,000 lookups   : {openTime * 1e3:.2f} ms")
+    print(f"  Extrapolated to 500M IDs    : Bloom {500e6 * bitsPerKey / 8 / 1e9:.2f} GB "
+          f"vs set ~{500e6 * setBytes / n / 1e9:.0f} GB")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" BLOOM FILTER ")
+    print("============================\n")
+
+    seen = BloomFilter(capacity=1000, errorRate=0.01)
+    for name in ['Bob', 'Pete', 'Jones', 'Lisa', 'Siri']:
+        seen.add(name)
+    print(f"m = {seen.m} bits, k = {seen.k} hash positions, {seen.nbytes} bytes")
+    print("'Lisa' in filter :", 'Lisa' in seen)
+    print("'Stuart' in filter:", 'Stuart' in seen, "(False is always correct)")
+    print("contains_many([101, 'Bob', 'Alex']):", seen.contains_many([101, 'Bob', 'Alex']).tolist(), "\n")
+
+    counting = CountingBloomFilter(capacity=1000, errorRate=0.01)
+    counting.add_many(['Bob', 'Pete', 'Pete'])
+    counting.remove('Bob')
+    print("Counting filter after remove('Bob'): 'Bob' →", 'Bob' in counting, "| 'Pete' →", 'Pete' in counting)
+    counting.remove('Pete')
+    print("After removing one of two 'Pete's: 'Pete' →", 'Pete' in counting, "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Memory depends only on n and p (~1.2 bytes/key at 1%), never on the key size.")
+    print("❌ Not faster than a set that fits in RAM: the win is memory, which is what allows 500M keys.")
+    print("✅ A 'not present' answer is exact: use the filter to skip expensive lookups.")
+    print("❌ 'Present' can be a false positive: confirm against the real store when it matters.")
+    print("❌ A plain Bloom filter cannot delete; the counting variant uses 8x the memory to allow it.\n")
@@ -0,0 +1,419 @@
+# ============================================
+# CONCURRENT QUEUES - THREADS AND ASYNCIO
+# ============================================
+# Pipelines (producers → queue → consumers) that guard a LinkedListQueue
+# with their own lock pay one lock round-trip per item on both sides.
+#
+# ThreadSafeQueue (threads) and AsyncQueue (asyncio) share one core:
+#   - storage is a RingBufferQueue (RingBufferQueue.py): O(1) per item
+#   - get_batch(max_items, timeout) waits once, then drains up to
+#     max_items in a single lock acquisition
+#   - high / low watermark callbacks for backpressure: onHigh fires when
+#     the depth reaches the high mark, onLow when it falls back to the
+#     low mark (hysteresis, so the callbacks do not flap)
+#   - stats(): queue depth (current / max / mean) and how long producers
+#     and consumers spent waiting
+# ============================================
+
+import asyncio
+import threading
+import time
+
+from RingBufferQueue import POLICIES, QueueEmpty, QueueFull, RingBufferQueue
+
+
+def remaining(deadline):
+    """Seconds left until deadline (None: wait forever), never negative"""
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class QueueCore:
+    """Ring buffer + watermarks + instrumentation; callers provide the locking"""
+
+    def __init__(self, capacity=None, policy="block", highWatermark=None, lowWatermark=None,
+                 onHigh=None, onLow=None):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        # Waiting for room (block) is done by the wrappers; the ring itself never sees a full put
+        self.ring = RingBufferQueue(capacity, "reject" if policy == "block" else policy)
+        self.capacity = capacity
+        self.policy = policy
+        self.highWatermark = highWatermark
+        self.lowWatermark = lowWatermark if lowWatermark is not None else (highWatermark or 0) // 2
+        self.onHigh = onHigh
+        self.onLow = onLow
+        self.aboveHigh = False
+        # Instrumentation
+        self.puts = 0
+        self.gets = 0
+        self.maxDepth = 0
+        self.depthSum = 0     # depth after each put/get call, for the mean
+        self.depthSamples = 0
+        self.putWait = 0.0    # seconds producers spent waiting for room
+        self.getWait = 0.0    # seconds consumers spent waiting for items
+        self.maxGetWait = 0.0
+        self.waitingProducers = 0  # wake-ups are only sent when someone is waiting
+        self.waitingConsumers = 0
+
+    def room(self):
+        return float("inf") if self.capacity is None or self.policy != "block" else self.capacity - self.ring.count
+
+    def hasRoom(self):
+        return self.room() > 0
+
+    def hasItems(self):
+        return self.ring.count > 0
+
+    def _record(self):
+        """Update depth statistics; returns the watermark callback to run (outside the lock) or None"""
+        depth = self.ring.count
+        self.maxDepth = max(self.maxDepth, depth)
+        self.depthSum += depth
+        self.depthSamples += 1
+        if self.highWatermark is None:
+            return None
+        if not self.aboveHigh and depth >= self.highWatermark:
+            self.aboveHigh = True
+            return self.onHigh and (lambda: self.onHigh(depth))
+        if self.aboveHigh and depth <= self.lowWatermark:
+            self.aboveHigh = False
+            return self.onLow and (lambda: self.onLow(depth))
+        return None
+
+    def _put(self, items):
+        self.ring.enqueue_many(items)
+        self.puts += len(items)
+        return self._record()
+
+    def _take(self, maxItems):
+        items = self.ring.dequeue_many(maxItems)
+        self.gets += len(items)
+        return items, self._record()
+
+    def _startWait(self, consumer):
+        if consumer:
+            self.waitingConsumers += 1
+        else:
+            self.waitingProducers += 1
+        return time.perf_counter()
+
+    def _endWait(self, start, consumer):
+        seconds = time.perf_counter() - start
+        if consumer:
+            self.waitingConsumers -= 1
+            self.getWait += seconds
+            self.maxGetWait = max(self.maxGetWait, seconds)
+        else:
+            self.waitingProducers -= 1
+            self.putWait += seconds
+
+    def __len__(self):
+        return self.ring.count
+
+    def stats(self):
+        return {
+            "depth": self.ring.count,
+            "maxDepth": self.maxDepth,
+            "meanDepth": self.depthSum / self.depthSamples if self.depthSamples else 0.0,
+            "puts": self.puts,
+            "gets": self.gets,
+            "dropped": self.ring.dropped,
+            "producerWaitSeconds": self.putWait,
+            "consumerWaitSeconds": self.getWait,
+            "maxConsumerWaitSeconds": self.maxGetWait,
+        }
+
+
+class ThreadSafeQueue(QueueCore):
+    """Queue for threads; get_batch drains many items per lock acquisition"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+
+    def _wait(self, condition, predicate, timeout, consumer):
+        """Under the lock: wait for predicate, recording the time spent"""
+        if predicate():
+            return True
+        start = self._startWait(consumer)
+        try:
+            return condition.wait_for(predicate, timeout)
+        finally:
+            self._endWait(start, consumer)
+
+    def put_many(self, items, timeout=None):
+        """Add items, waiting for room under the block policy (QueueFull on timeout)
+
+        timeout bounds the whole call; items added before a timeout stay queued.
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(items):
+            with self.lock:
+                if not self._wait(self.notFull, self.hasRoom, remaining(deadline), consumer=False):
+                    raise QueueFull(f"timed out waiting for room ({start} of {len(items)} items enqueued)")
+                room = self.room()
+                chunk = items[start:] if room == float("inf") else items[start:start + room]
+                callback = self._put(chunk)
+                if self.waitingConsumers:
+                    self.notEmpty.notify_all()
+            start += len(chunk)
+            if callback:
+                callback()
+
+    def put(self, item, timeout=None):
+        """Single-item fast path of put_many"""
+        with self.lock:
+            if not self._wait(self.notFull, self.hasRoom, timeout, consumer=False):
+                raise QueueFull("timed out waiting for room")
+            self.ring.enqueue(item)
+            self.puts += 1
+            callback = self._record()
+            if self.waitingConsumers:
+                self.notEmpty.notify()
+        if callback:
+            callback()
+
+    def get_batch(self, max_items, timeout=None):
+        """Wait up to timeout for at least one item, then return up to max_items ([] on timeout)"""
+        with self.lock:
+            if not self._wait(self.notEmpty, self.hasItems, timeout, consumer=True):
+                return []
+            items, callback = self._take(max_items)
+            if self.waitingProducers:
+                self.notFull.notify_all()
+        if callback:
+            callback()
+        return items
+
+    def get(self, timeout=None):
+        items = self.get_batch(1, timeout)
+        if not items:
+            raise QueueEmpty("timed out waiting for an item")
+        return items[0]
+
+
+class AsyncQueue(QueueCore):
+    """Queue for asyncio tasks with the same batching, watermarks and stats"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.condition = asyncio.Condition()  # one condition: readers and writers both wait on it
+
+    async def _wait(self, predicate, timeout, consumer):
+        if predicate():
+            return True
+        start = self._startWait(consumer)
+        try:
+            await asyncio.wait_for(self.condition.wait_for(predicate), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._endWait(start, consumer)
+
+    def _wake(self):
+        if self.waitingProducers or self.waitingConsumers:
+            self.condition.notify_all()
+
+    async def put_many(self, items, timeout=None):
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(items):
+            async with self.condition:
+                if not await self._wait(self.hasRoom, remaining(deadline), consumer=False):
+                    raise QueueFull(f"timed out waiting for room ({start} of {len(items)} items enqueued)")
+                room = self.room()
+                chunk = items[start:] if room == float("inf") else items[start:start + room]
+                callback = self._put(chunk)
+                self._wake()
+            start += len(chunk)
+            if callback:
+                callback()
+
+    async def put(self, item, timeout=None):
+        """Single-item fast path of put_many"""
+        async with self.condition:
+            if not await self._wait(self.hasRoom, timeout, consumer=False):
+                raise QueueFull("timed out waiting for room")
+            self.ring.enqueue(item)
+            self.puts += 1
+            callback = self._record()
+            self._wake()
+        if callback:
+            callback()
+
+    async def get_batch(self, max_items, timeout=None):
+        async with self.condition:
+            if not await self._wait(self.hasItems, timeout, consumer=True):
+                return []
+            items, callback = self._take(max_items)
+            self._wake()
+        if callback:
+            callback()
+        return items
+
+    async def get(self, timeout=None):
+        items = await self.get_batch(1, timeout)
+        if not items:
+            raise QueueEmpty("timed out waiting for an item")
+        return items[0]
+
+
+# -------------------------------------------------
+# Benchmark: producers/consumer throughput at 1, 4 and 16 producers
+# -------------------------------------------------
+def benchmark(items=100_000, producerCounts=(1, 4, 16), capacity=10_000, batch=256):
+    import os
+    import queue
+    from contextlib import redirect_stdout
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import Queues  # runs its demo on import, silenced here
+
+    class LockedLinkedListQueue:
+        """Today's approach: LinkedListQueue behind a hand-written lock (one acquisition per item)"""
+        def __init__(self):
+            self.queue = Queues.LinkedListQueue()
+            self.lock = threading.Lock()
+            self.notEmpty = threading.Condition(self.lock)
+
+        def put(self, item):
+            with self.lock:
+                self.queue.enqueue(item)
+                self.notEmpty.notify()
+
+        def get(self):
+            with self.lock:
+                self.notEmpty.wait_for(lambda: self.queue.length)
+                return self.queue.dequeue()
+
+    def runThreads(makeQueue, producers, consume):
+        q = makeQueue()
+        share = items // producers
+        total = share * producers
+
+        def produce():
+            put = q.put
+            for i in range(share):
+                put(i)
+
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        consume(q, total)
+        for thread in threads:
+            thread.join()
+        return total / (time.perf_counter() - start), q
+
+    def consumeOne(q, total):
+        get = q.get
+        for _ in range(total):
+            get()
+
+    def consumeBatches(q, total):
+        received = 0
+        while received < total:
+            received += len(q.get_batch(batch))
+
+    async def runAsync(makeQueue, producers, batched):
+        q = makeQueue()
+        share = items // producers
+        total = share * producers
+
+        async def produce():
+            for i in range(share):
+                await q.put(i)
+
+        start = time.perf_counter()
+        tasks = [asyncio.create_task(produce()) for _ in range(producers)]
+        received = 0
+        while received < total:
+            if batched:
+                received += len(await q.get_batch(batch))
+            else:
+                await q.get()
+                received += 1
+        await asyncio.gather(*tasks)
+        return total / (time.perf_counter() - start)
+
+    variants = {
+        "LinkedListQueue + lock": (LockedLinkedListQueue, consumeOne),
+        "queue.Queue": (lambda: queue.Queue(capacity), consumeOne),
+        "ThreadSafeQueue get()": (lambda: ThreadSafeQueue(capacity), consumeOne),
+        f"ThreadSafeQueue get_batch({batch})": (lambda: ThreadSafeQueue(capacity), consumeBatches),
+    }
+    print(f"Benchmark: {items:,} items, 1 consumer, capacity {capacity:,} (items per second)")
+    print(f"  {'':34}" + "".join(f"{f'{p} producer' + ('s' if p > 1 else ''):>14}" for p in producerCounts))
+    lastStats = None
+    for label, (makeQueue, consume) in variants.items():
+        rates = []
+        for producers in producerCounts:
+            rate, q = runThreads(makeQueue, producers, consume)
+            rates.append(rate)
+            if isinstance(q, ThreadSafeQueue):
+                lastStats = q.stats()
+        print(f"  {label:34}" + "".join(f"{rate:14,.0f}" for rate in rates))
+
+    asyncVariants = {
+        "asyncio.Queue": (lambda: asyncio.Queue(capacity), False),
+        f"AsyncQueue get_batch({batch})": (lambda: AsyncQueue(capacity), True),
+    }
+    for label, (makeQueue, batched) in asyncVariants.items():
+        rates = [asyncio.run(runAsync(makeQueue, producers, batched)) for producers in producerCounts]
+        print(f"  {label + ' (tasks)':34}" + "".join(f"{rate:14,.0f}" for rate in rates))
+
+    print(f"  Stats of the last ThreadSafeQueue run: max depth {lastStats['maxDepth']:,}, "
+          f"mean depth {lastStats['meanDepth']:,.0f}, producers waited {lastStats['producerWaitSeconds']:.3f} s, "
+          f"consumer waited {lastStats['consumerWaitSeconds']:.3f} s")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" CONCURRENT QUEUES ")
+    print("============================\n")
+
+    events = []
+    q = ThreadSafeQueue(capacity=8, highWatermark=6, lowWatermark=2,
+                        onHigh=lambda depth: events.append(f"HIGH at depth {depth} → slow producers down"),
+                        onLow=lambda depth: events.append(f"LOW at depth {depth} → resume producers"))
+    producer = threading.Thread(target=lambda: q.put_many(range(20)))
+    producer.start()
+    time.sleep(0.05)  # let the producer fill the queue and block
+    received = []
+    while len(received) < 20:
+        received += q.get_batch(5, timeout=1)
+    producer.join()
+    print("Received in order:", received == list(range(20)))
+    print("Watermark events:", *events, sep="\n  ")
+    stats = q.stats()
+    print(f"Stats: max depth {stats['maxDepth']}, mean depth {stats['meanDepth']:.1f}, "
+          f"producer waited {stats['producerWaitSeconds'] * 1e3:.1f} ms\n")
+
+    async def asyncDemo():
+        aq = AsyncQueue(capacity=4)
+
+        async def produce():
+            await aq.put_many(['A', 'B', 'C', 'D', 'E', 'F'])
+
+        task = asyncio.create_task(produce())
+        batches = [await aq.get_batch(4), await aq.get_batch(4)]
+        await task
+        print("AsyncQueue batches:", batches)
+        print("get_batch on an empty queue with timeout 0.01 s →", await aq.get_batch(4, timeout=0.01))
+
+    asyncio.run(asyncDemo())
+    print()
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ get_batch pays one lock acquisition / wake-up for up to N items.")
+    print("✅ Watermark callbacks signal backpressure before the queue is completely full.")
+    print("✅ Threads and asyncio share the same ring-buffer core, stats and policies.")
+    print("❌ Item-by-item get() is slower than queue.Queue / asyncio.Queue (pure Python bookkeeping): use get_batch.\n")
@@ -0,0 +1,182 @@
+# ================================================================
+# CONSISTENT HASHING - SHARDING KEYS ACROSS WORKER NODES
+# ================================================================
+# Hashtable.hash_function picks a bucket with "% 10". Change the 10
+# (add or remove a cache node) and almost every key moves to another
+# bucket: with n → n+1 nodes only about 1/(n+1) of the keys stay put.
+#
+# Consistent hashing places nodes and keys on the same ring of 2^64
+# positions ("tokens"). A key belongs to the first node token clockwise
+# from the key's hash, so:
+#   - a joining node only takes over the keys just before its tokens
+#   - a leaving node only hands its own keys to its ring neighbours
+#   → about 1/n of the keys move, instead of almost all of them
+#
+# Virtual nodes: each node owns many tokens spread around the ring,
+# which evens out the load; a node with weight w gets w times as many.
+# Lookup is a binary search (bisect) over the sorted tokens: O(log n).
+# ================================================================
+
+from bisect import bisect_right
+
+import numpy as np
+
+from BloomFilter import hashPairs
+
+
+def ringHashes(keys):
+    """Position of each key on the ring (uint64 array, same in every process)"""
+    return hashPairs(keys)[0]
+
+
+class ConsistentHashRing:
+    """Hash ring with weighted virtual nodes"""
+
+    def __init__(self, nodes=(), vnodes=100):
+        self.vnodes = vnodes  # tokens per unit of weight
+        self.weights = {}     # node → weight
+        self.tokens = []      # sorted ring positions (Python ints, for bisect)
+        self.owners = []      # owners[i] = node owning tokens[i]
+        self._arrays = None   # NumPy copies of tokens/owner indices for assign_many
+        for node in nodes:
+            self.add_node(node)
+
+    def _nodeTokens(self, node, weight):
+        count = max(1, round(self.vnodes * weight))
+        return ringHashes([f"{node}#{i}" for i in range(count)]).tolist()
+
+    def _rebuild(self, pairs):
+        pairs.sort(key=lambda pair: pair[0])  # nodes need not be comparable
+        self.tokens = [token for token, _ in pairs]
+        self.owners = [node for _, node in pairs]
+        self._arrays = None
+
+    def add_node(self, node, weight=1):
+        if node in self.weights:
+            raise ValueError(f"node {node!r} is already on the ring")
+        self.weights[node] = weight
+        pairs = list(zip(self.tokens, self.owners))
+        pairs.extend((token, node) for token in self._nodeTokens(node, weight))
+        self._rebuild(pairs)
+
+    def remove_node(self, node):
+        if self.weights.pop(node, None) is None:
+            raise KeyError(node)
+        self._rebuild([(token, owner) for token, owner in zip(self.tokens, self.owners) if owner != node])
+
+    def get_node(self, key):
+        """Node owning key: first token clockwise from the key's hash"""
+        if not self.tokens:
+            raise LookupError("the ring has no nodes")
+        i = bisect_right(self.tokens, int(ringHashes([key])[0]))
+        return self.owners[i % len(self.tokens)]
+
+    def assign_many(self, keys):
+        """Owning node of every key in a batch (vectorized bisect with np.searchsorted)"""
+        if not self.tokens:
+            raise LookupError("the ring has no nodes")
+        if self._arrays is None:
+            nodes = list(self.weights)
+            index = {node: i for i, node in enumerate(nodes)}
+            self._arrays = (np.array(self.tokens, dtype=np.uint64),
+                            np.array([index[owner] for owner in self.owners]),
+                            nodes)
+        tokens, ownerIndex, nodes = self._arrays
+        i = np.searchsorted(tokens, ringHashes(keys), side="right") % len(tokens)
+        return [nodes[j] for j in ownerIndex[i].tolist()]
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __contains__(self, node):
+        return node in self.weights
+
+
+class ModuloSharding:
+    """The Hashtable.py approach for comparison: node = nodes[hash % len(nodes)]"""
+
+    def __init__(self, nodes=()):
+        self.nodes = list(nodes)
+
+    def add_node(self, node, weight=1):
+        self.nodes.append(node)
+
+    def remove_node(self, node):
+        self.nodes.remove(node)
+
+    def assign_many(self, keys):
+        nodes = self.nodes
+        return [nodes[i] for i in (ringHashes(keys) % np.uint64(len(nodes))).tolist()]
+
+
+# ================================================================
+# SIMULATION: load imbalance and keys moved on join / leave
+# ================================================================
+def loadImbalance(assignment, weights):
+    """Max over nodes of (keys held / keys expected for its weight); 1.0 = perfect"""
+    counts = {}
+    for node in assignment:
+        counts[node] = counts.get(node, 0) + 1
+    totalWeight = sum(weights.values())
+    return max(counts.get(node, 0) / (len(assignment) * weight / totalWeight) for node, weight in weights.items())
+
+
+def movedFraction(before, after):
+    return sum(1 for a, b in zip(before, after) if a != b) / len(before)
+
+
+def simulate(keys=200_000, nodes=10, vnodeCounts=(1, 10, 100, 400), seed=1):
+    """Print imbalance and the fraction of keys moved when a node joins and when one leaves"""
+    import time
+
+    rng = np.random.default_rng(seed)
+    keyIds = rng.integers(0, 2**63, keys, dtype=np.int64)
+    names = [f"cache-{i}" for i in range(nodes)]
+    weights = dict.fromkeys(names, 1)
+    newcomer = f"cache-{nodes}"
+
+    print(f"Simulation: {keys:,} keys on {nodes} nodes, then '{newcomer}' joins, then 'cache-0' leaves")
+    print(f"  {'scheme':22} {'imbalance':>9} {'moved on join':>14} {'moved on leave':>15} {'assign µs/key':>14}")
+    print(f"  {'ideal':22} {1.0:9.2f} {1 / (nodes + 1):14.1%} {1 / nodes:15.1%}")
+    schemes = [("modulo (% n)", ModuloSharding(names))]
+    schemes += [(f"ring, {v} vnodes", ConsistentHashRing(names, vnodes=v)) for v in vnodeCounts]
+    for label, scheme in schemes:
+        start = time.perf_counter()
+        before = scheme.assign_many(keyIds)
+        assignTime = (time.perf_counter() - start) / keys * 1e6
+        imbalance = loadImbalance(before, weights)
+        scheme.add_node(newcomer)
+        joined = scheme.assign_many(keyIds)
+        scheme.remove_node(newcomer)
+        scheme.remove_node("cache-0")
+        left = scheme.assign_many(keyIds)
+        print(f"  {label:22} {imbalance:9.2f} {movedFraction(before, joined):14.1%} "
+              f"{movedFraction(before, left):15.1%} {assignTime:14.3f}")
+
+    ring = ConsistentHashRing(vnodes=200)
+    for name, weight in (("small", 1), ("medium", 2), ("large", 4)):
+        ring.add_node(name, weight)
+    assignment = ring.assign_many(keyIds)
+    shares = {name: assignment.count(name) / keys for name in ring.weights}
+    print("  Weighted ring (1:2:4) key shares:", {name: f"{share:.1%}" for name, share in shares.items()},
+          f"imbalance {loadImbalance(assignment, ring.weights):.2f}")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" CONSISTENT HASHING ")
+    print("============================\n")
+
+    ring = ConsistentHashRing(["node-A", "node-B", "node-C"], vnodes=50)
+    users = ['Bob', 'Pete', 'Jones', 'Lisa', 'Siri', 'Stuart']
+    print("Placement:", {user: ring.get_node(user) for user in users})
+    ring.add_node("node-D")
+    print("After node-D joins:", dict(zip(users, ring.assign_many(users))))
+    print("(only keys taken over by node-D changed)\n")
+
+    simulate()
+
+    print("\n--- Important Note ---")
+    print("✅ Adding/removing one of n nodes moves ~1/n of the keys; '% n' moves almost all of them.")
+    print("✅ More virtual nodes → smoother load (imbalance closer to 1.0), at the cost of a bigger ring.")
+    print("✅ Weights give bigger machines proportionally more tokens, and therefore more keys.\n")
@@ -0,0 +1,295 @@
+# ================================================================
+# DOUBLY LINKED LIST - DEMONSTRATION PROGRAM
+# ================================================================
+# LinkedList.py uses a singly linked Node and free functions:
+#   - deleteSpecificNode must walk from head to find the previous node
+#   - there is no tail pointer, so appending walks the whole list
+#
+# Here every node also points back (prev), and the list keeps both
+# head and tail. If you hold a node, you can unlink it, insert next to
+# it or move it in O(1): no traversal needed.
+#
+# Nodes use __slots__: no per-node __dict__, so each node is much
+# smaller than LinkedList.Node (see the benchmark).
+# ================================================================
+
+
+class DNode:
+    """Doubly linked list node"""
+    __slots__ = ("data", "prev", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+
+class DoublyLinkedList:
+    """Doubly linked list with head and tail pointers; node handles give O(1) updates"""
+
+    def __init__(self, iterable=()):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        for data in iterable:
+            self.append(data)
+
+    # -------------------------------------------------
+    # Linking helpers (node must not currently be in a list)
+    # -------------------------------------------------
+    def _linkAfter(self, node, after):
+        """Insert node after `after`; after=None inserts at the front"""
+        if after is None:
+            node.prev, node.next = None, self.head
+            if self.head is None:
+                self.tail = node
+            else:
+                self.head.prev = node
+            self.head = node
+        else:
+            node.prev, node.next = after, after.next
+            if after.next is None:
+                self.tail = node
+            else:
+                after.next.prev = node
+            after.next = node
+        self.size += 1
+        return node
+
+    def _unlink(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+
+    # -------------------------------------------------
+    # O(1) operations
+    # -------------------------------------------------
+    def append(self, data):
+        """Add at the tail; returns the new node (keep it for O(1) remove/move)"""
+        return self._linkAfter(DNode(data), self.tail)
+
+    def appendleft(self, data):
+        return self._linkAfter(DNode(data), None)
+
+    def insert_after(self, node, data):
+        return self._linkAfter(DNode(data), node)
+
+    def insert_before(self, node, data):
+        return self._linkAfter(DNode(data), node.prev)
+
+    def remove(self, node):
+        """Unlink a node of this list and return its data"""
+        self._unlink(node)
+        return node.data
+
+    def pop(self):
+        if self.tail is None:
+            raise IndexError("pop from empty list")
+        return self.remove(self.tail)
+
+    def popleft(self):
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        return self.remove(self.head)
+
+    def move_to_front(self, node):
+        if node is not self.head:
+            self._unlink(node)
+            self._linkAfter(node, None)
+
+    def move_to_back(self, node):
+        if node is not self.tail:
+            self._unlink(node)
+            self._linkAfter(node, self.tail)
+
+    def splice(self, after, other, first=None, last=None, count=None):
+        """Move nodes first..last (default: all) of `other` into this list after `after`
+
+        after=None splices at the front. Relinking is O(1); only the size
+        bookkeeping of a partial sublist needs its length, counted in O(k)
+        unless `count` is given.
+        """
+        if first is None:
+            first, last, count = other.head, other.tail, other.size
+        if first is None:
+            return
+        if count is None:
+            count, node = 1, first
+            while node is not last:
+                node = node.next
+                count += 1
+        if other is self and after is not None:
+            # Splicing a run of this list inside itself: after must lie outside it
+            node = first
+            for _ in range(count):
+                if node is after:
+                    raise ValueError("cannot splice a sublist after one of its own nodes")
+                node = node.next
+
+        # Cut first..last out of `other`
+        if first.prev is None:
+            other.head = last.next
+        else:
+            first.prev.next = last.next
+        if last.next is None:
+            other.tail = first.prev
+        else:
+            last.next.prev = first.prev
+        other.size -= count
+
+        # Link it in after `after`
+        following = self.head if after is None else after.next
+        first.prev, last.next = after, following
+        if after is None:
+            self.head = first
+        else:
+            after.next = first
+        if following is None:
+            self.tail = last
+        else:
+            following.prev = last
+        self.size += count
+
+    # -------------------------------------------------
+    # O(n) helpers
+    # -------------------------------------------------
+    def find(self, data):
+        """First node holding data, or None"""
+        node = self.head
+        while node is not None and node.data != data:
+            node = node.next
+        return node
+
+    def nodes(self):
+        node = self.head
+        while node is not None:
+            following = node.next  # allows removing the current node while iterating
+            yield node
+            node = following
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def __reversed__(self):
+        node = self.tail
+        while node is not None:
+            yield node.data
+            node = node.prev
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return " <-> ".join(str(data) for data in self) or "empty"
+
+
+# -------------------------------------------------
+# Benchmark: DoublyLinkedList vs LinkedList.Node vs collections.deque
+# -------------------------------------------------
+def benchmark(n=1_000_000, removals=1_000):
+    import os
+    import time
+    import tracemalloc
+    from collections import deque
+    from contextlib import redirect_stdout
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import LinkedList  # runs its demo on import, silenced here
+
+    def buildSingly():
+        head = tail = LinkedList.Node(0)
+        for i in range(1, n):
+            tail.next = LinkedList.Node(i)
+            tail = tail.next
+        return head
+
+    def measure(build):
+        start = time.perf_counter()
+        built = build()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()  # second build under tracing: tracemalloc slows allocation down
+        traced = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del traced
+        return built, elapsed, size / n
+
+    singly, singlyTime, singlyBytes = measure(buildSingly)
+    doubly, doublyTime, doublyBytes = measure(lambda: DoublyLinkedList(range(n)))
+    queue, dequeTime, dequeBytes = measure(lambda: deque(range(n)))
+
+    def timed(action):
+        start = time.perf_counter()
+        action()
+        return time.perf_counter() - start
+
+    def sumSingly():
+        total, node = 0, singly
+        while node:
+            total += node.data
+            node = node.next
+
+    scans = (timed(sumSingly), timed(lambda: sum(doubly)), timed(lambda: sum(queue)))
+
+    # Delete elements near the end when the caller already holds them
+    step = 10
+    victims = [node for i, node in enumerate(doubly.nodes()) if i >= n - removals * step and i % step == 0]
+    singlyVictims = []
+    node = singly
+    for i in range(n):
+        if i >= n - removals * step and i % step == 0:
+            singlyVictims.append(node)
+        node = node.next
+    sample = max(1, removals // 100)  # the O(n) deletes are slow: time a few and scale
+    singlyRemove = timed(lambda: [LinkedList.deleteSpecificNode(singly, v) for v in singlyVictims[:sample]]) * removals / sample
+    doublyRemove = timed(lambda: [doubly.remove(v) for v in victims])
+    dequeRemove = timed(lambda: [queue.remove(v.data) for v in victims[:sample]]) * removals / sample
+
+    print(f"Benchmark with {n:,} integer elements:")
+    print(f"  {'':28} {'bytes/elem':>10} {'build s':>8} {'scan s':>8} {f'{removals:,} removes s':>16}")
+    rows = (("LinkedList.Node (singly)", singlyBytes, singlyTime, scans[0], singlyRemove),
+            ("DoublyLinkedList (__slots__)", doublyBytes, doublyTime, scans[1], doublyRemove),
+            ("collections.deque", dequeBytes, dequeTime, scans[2], dequeRemove))
+    for label, size, build, scan, remove in rows:
+        print(f"  {label:28} {size:10.1f} {build:8.3f} {scan:8.3f} {remove:16.4f}")
+    print("  (bytes/elem include the int objects; removes are of held nodes near the tail,")
+    print("   singly/deque remove times are scaled from a sample)")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" DOUBLY LINKED LIST ")
+    print("============================\n")
+
+    dll = DoublyLinkedList([7, 11, 3, 2, 9])
+    print("List:", dll, "| head:", dll.head.data, "| tail:", dll.tail.data)
+    node3 = dll.find(3)
+    dll.remove(node3)
+    print("After remove(node 3) in O(1):", dll)
+    dll.move_to_front(dll.tail)
+    print("After move_to_front(tail):", dll)
+    dll.insert_after(dll.head, 97)
+    print("After insert_after(head, 97):", dll)
+    print("Backwards:", list(reversed(dll)))
+
+    other = DoublyLinkedList([100, 200, 300])
+    dll.splice(dll.head, other)
+    print("After splicing [100, 200, 300] after the head:", dll, "| other is now:", other, "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Holding a node turns remove / insert / move into O(1) pointer updates.")
+    print("✅ The tail pointer makes append O(1) instead of a walk to the end.")
+    print("✅ __slots__ nodes drop the per-node __dict__ of a plain class (about a third less memory).")
+    print("❌ deque is smaller and faster for pure queue use; use this list when you need node handles.\n")
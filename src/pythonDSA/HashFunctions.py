@@ -0,0 +1,173 @@
+# ================================================================
+# HASH FUNCTIONS - PLUGGABLE HASHING FOR HashMap
+# ================================================================
+# Hashtable.hash_function sums the character codes of a string, so:
+#   - anagrams always collide ('Lisa' and 'Sila' → same bucket)
+#   - similar keys ('user1', 'user2', ...) land in neighbouring buckets
+#
+# Every function below maps a key to a 64-bit integer; HashMap then
+# keeps the low bits (hash & (capacity - 1)) as the slot index.
+#
+#   ordinal_sum : the Hashtable.py method (without % 10), for comparison
+#   fnv1a       : FNV-1a, fast and simple byte-at-a-time mixing
+#   siphash     : SipHash-2-4, keyed → attackers cannot force collisions
+#   fibonacci   : multiplicative (Fibonacci) hashing, great for integer keys
+#   builtin     : Python's hash() (randomized per process for str/bytes)
+# ================================================================
+
+MASK64 = (1 << 64) - 1
+
+
+def toBytes(key):
+    """Byte representation used by the byte-oriented hash functions"""
+    if isinstance(key, bytes):
+        return key
+    if isinstance(key, str):
+        return key.encode("utf-8")
+    if isinstance(key, int) and -(1 << 63) <= key < (1 << 63):
+        return key.to_bytes(8, "little", signed=True)
+    return repr(key).encode("utf-8")
+
+
+def ordinal_sum(key):
+    """Sum of character codes (Hashtable.hash_function without the modulo)"""
+    return sum(ord(char) for char in key)
+
+
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+
+def fnv1a(key):
+    """64-bit FNV-1a: XOR each byte in, then multiply by the FNV prime"""
+    h = FNV_OFFSET
+    for byte in toBytes(key):
+        h = ((h ^ byte) * FNV_PRIME) & MASK64
+    return h
+
+
+DEFAULT_SIP_KEY = bytes(range(16))
+
+def _rotl(x, b):
+    return ((x << b) | (x >> (64 - b))) & MASK64
+
+def siphash(key, secret=DEFAULT_SIP_KEY):
+    """SipHash-2-4 of key under a 16-byte secret (keyed, collision-resistant)"""
+    data = toBytes(key)
+    k0 = int.from_bytes(secret[:8], "little")
+    k1 = int.from_bytes(secret[8:16], "little")
+    v0 = k0 ^ 0x736F6D6570736575
+    v1 = k1 ^ 0x646F72616E646F6D
+    v2 = k0 ^ 0x6C7967656E657261
+    v3 = k1 ^ 0x7465646279746573
+
+    def sipRound(v0, v1, v2, v3):
+        v0 = (v0 + v1) & MASK64
+        v1 = _rotl(v1, 13) ^ v0
+        v0 = _rotl(v0, 32)
+        v2 = (v2 + v3) & MASK64
+        v3 = _rotl(v3, 16) ^ v2
+        v0 = (v0 + v3) & MASK64
+        v3 = _rotl(v3, 21) ^ v0
+        v2 = (v2 + v1) & MASK64
+        v1 = _rotl(v1, 17) ^ v2
+        v2 = _rotl(v2, 32)
+        return v0, v1, v2, v3
+
+    # Process 8-byte words; the last word holds the leftover bytes and the length
+    end = len(data) - len(data) % 8
+    for i in range(0, end, 8):
+        m = int.from_bytes(data[i:i + 8], "little")
+        v3 ^= m
+        for _ in range(2):
+            v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+        v0 ^= m
+    m = int.from_bytes(data[end:], "little") | ((len(data) & 0xFF) << 56)
+    v3 ^= m
+    for _ in range(2):
+        v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+    v0 ^= m
+
+    v2 ^= 0xFF
+    for _ in range(4):
+        v0, v1, v2, v3 = sipRound(v0, v1, v2, v3)
+    return v0 ^ v1 ^ v2 ^ v3
+
+
+GOLDEN_RATIO_64 = 0x9E3779B97F4A7C15  # 2^64 / φ
+
+def fibonacci(key):
+    """Multiplicative hashing by 2^64/φ; the well-mixed high half is rotated into the low bits"""
+    x = key if isinstance(key, int) else hash(key)
+    product = (x * GOLDEN_RATIO_64) & MASK64
+    return ((product >> 32) | (product << 32)) & MASK64
+
+
+def builtin(key):
+    """Python's own hash()"""
+    return hash(key)
+
+
+HASH_FUNCTIONS = {
+    "ordinal_sum": ordinal_sum,
+    "fnv1a": fnv1a,
+    "siphash": siphash,
+    "fibonacci": fibonacci,
+    "builtin": builtin,
+}
+
+
+# ================================================================
+# COMPARISON: distribution and lookup latency per hash function
+# ================================================================
+def compareHashFunctions(keys, capacity=None):
+    """Fill a HashMap per hash function and report probe statistics and lookup time"""
+    import time
+    from HashMap import HashMap
+
+    print(f"{'function':12} {'max probe':>9} {'mean probe':>10} {'collisions':>10} "
+          f"{'busiest slot':>12} {'lookup µs':>9}")
+    for name, function in HASH_FUNCTIONS.items():
+        table = HashMap(capacity or 2 * len(keys), hashFunction=function)
+        for key in keys:
+            table.put(key, None)
+        start = time.perf_counter()
+        for key in keys:
+            table.get(key)
+        lookup = (time.perf_counter() - start) / len(keys) * 1e6
+        stats = table.probeStats()
+        print(f"{name:12} {stats['maxProbe']:9} {stats['meanProbe']:10.2f} {stats['collisions']:10} "
+              f"{len(stats['homeOccupancy']) - 1:12} {lookup:9.2f}")
+    return table
+
+
+if __name__ == "__main__":
+    import random
+
+    print("\n============================")
+    print(" PLUGGABLE HASH FUNCTIONS ")
+    print("============================\n")
+
+    print("Hash of 'Lisa' vs its anagram 'Sila':")
+    for name, function in HASH_FUNCTIONS.items():
+        print(f"  {name:12} {function('Lisa'):>22} {function('Sila'):>22}")
+    print()
+
+    print("SipHash-2-4 test vector (empty input, key 00..0f):",
+          hex(siphash(b"")), "(expected 0x726fdb47dd0e0e31)\n")
+
+    rng = random.Random(42)
+    first = ["anna", "bob", "lisa", "pete", "siri", "jones", "stuart", "maria", "omar", "li"]
+    last = ["smith", "lee", "khan", "garcia", "ng", "brown", "sato", "ali"]
+    usernames = list({f"{rng.choice(first)}.{rng.choice(last)}{rng.randrange(1000)}" for _ in range(20_000)})
+    print(f"Distribution on {len(usernames):,} usernames (table capacity = 2 × keys):")
+    table = compareHashFunctions(usernames)
+
+    print("\nFull statistics for the last table (builtin hash):")
+    stats = table.probeStats()
+    print("  Probe length histogram:", dict(sorted(stats["probeHistogram"].items())))
+    print("  Home slot occupancy   :", {k: v for k, v in enumerate(stats["homeOccupancy"])})
+
+    print("\n--- Important Note ---")
+    print("✅ Collisions and long probe runs directly cost lookup time.")
+    print("❌ ordinal_sum clusters similar keys and collides on every anagram.")
+    print("✅ siphash is slower to compute but protects against crafted collision attacks.\n")
@@ -0,0 +1,266 @@
+# ================================================================
+# HASH MAP (OPEN ADDRESSING) - DEMONSTRATION PROGRAM
+# ================================================================
+# Hashtable.py stores names in 10 fixed buckets: a collision either
+# overwrites a value (add) or grows a bucket list (add_with_chaining),
+# so lookups slow down as more data arrives.
+#
+# This HashMap fixes that:
+#  - key → value storage in flat parallel lists (keys / values / hashes)
+#  - Linear probing: on a collision, try the next slot (i + 1)
+#  - The table doubles once it is 70% full, so probe runs stay short
+#  - Deleted slots become "tombstones" so probe chains are not broken;
+#    tombstones are cleaned up on delete (when possible) and on resize
+#  - The hash function is pluggable (see HashFunctions.py) and
+#    probeStats() shows how well it spreads the keys
+# ================================================================
+
+_EMPTY = object()    # slot never used
+_DELETED = object()  # tombstone: slot used before, probing must continue past it
+
+
+class HashMap:
+    """Resizable hash map using linear probing with tombstones"""
+
+    def __init__(self, capacity=8, maxLoad=0.7, hashFunction=hash):
+        if not 0 < maxLoad < 1:
+            raise ValueError("maxLoad must be between 0 and 1")
+        size = 8
+        while size < capacity:
+            size *= 2  # power of two → index = hash & (size - 1)
+        self.maxLoad = maxLoad
+        self.hashFunction = hashFunction
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self.keys = [_EMPTY] * size
+        self.values = [None] * size
+        self.hashes = [0] * size
+        self.mask = size - 1
+        self.count = 0  # live entries
+        self.used = 0   # live entries + tombstones
+
+    # -------------------------------------------------
+    # Probing
+    # -------------------------------------------------
+    def _find(self, key, h):
+        """Slot index holding key, or -1"""
+        keys, hashes, mask = self.keys, self.hashes, self.mask
+        i = h & mask
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    def _resize(self, size):
+        """Rehash all live entries into a new table (drops every tombstone)"""
+        oldKeys, oldValues, oldHashes = self.keys, self.values, self.hashes
+        self._allocate(size)
+        keys, values, hashes, mask = self.keys, self.values, self.hashes, self.mask
+        for k, v, h in zip(oldKeys, oldValues, oldHashes):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            i = h & mask
+            while keys[i] is not _EMPTY:
+                i = (i + 1) & mask
+            keys[i], values[i], hashes[i] = k, v, h
+            self.count += 1
+        self.used = self.count
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    def get(self, key, default=None):
+        i = self._find(key, self.hashFunction(key))
+        return default if i < 0 else self.values[i]
+
+    def put(self, key, value):
+        """Insert or overwrite key"""
+        h = self.hashFunction(key)
+        keys, hashes, mask = self.keys, self.hashes, self.mask
+        i = h & mask
+        tombstone = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if tombstone < 0:
+                    tombstone = i  # reuse the first tombstone on the probe path
+            elif hashes[i] == h and (k is key or k == key):
+                self.values[i] = value
+                return
+            i = (i + 1) & mask
+
+        if tombstone >= 0:
+            i = tombstone
+        else:
+            self.used += 1
+        keys[i], self.values[i], hashes[i] = key, value, h
+        self.count += 1
+
+        if self.used > self.maxLoad * (mask + 1):
+            # Mostly tombstones → rehash at the same size, otherwise grow
+            grow = self.count > self.maxLoad * (mask + 1) / 2
+            self._resize((mask + 1) * 2 if grow else mask + 1)
+
+    def delete(self, key):
+        """Remove key; returns False if it was not present"""
+        i = self._find(key, self.hashFunction(key))
+        if i < 0:
+            return False
+        keys, values, mask = self.keys, self.values, self.mask
+        keys[i], values[i] = _DELETED, None
+        self.count -= 1
+
+        # Tombstone cleanup: if the next slot is empty, no probe chain runs
+        # through here, so this tombstone (and any run before it) can be freed
+        if keys[(i + 1) & mask] is _EMPTY:
+            while keys[i] is _DELETED:
+                keys[i] = _EMPTY
+                self.used -= 1
+                i = (i - 1) & mask
+        return True
+
+    def items(self):
+        for k, v in zip(self.keys, self.values):
+            if k is not _EMPTY and k is not _DELETED:
+                yield k, v
+
+    def __iter__(self):
+        for k in self.keys:
+            if k is not _EMPTY and k is not _DELETED:
+                yield k
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self._find(key, self.hashFunction(key)) >= 0
+
+    def __getitem__(self, key):
+        i = self._find(key, self.hashFunction(key))
+        if i < 0:
+            raise KeyError(key)
+        return self.values[i]
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def probeStats(self):
+        """Distribution report: probe lengths, collisions and home-slot occupancy"""
+        mask = self.mask
+        probeHistogram = {}
+        keysPerHome = {}
+        for i, (k, h) in enumerate(zip(self.keys, self.hashes)):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            home = h & mask
+            probe = ((i - home) & mask) + 1  # slots inspected to find this key
+            probeHistogram[probe] = probeHistogram.get(probe, 0) + 1
+            keysPerHome[home] = keysPerHome.get(home, 0) + 1
+
+        # homeOccupancy[k] = number of slots that are the home slot of exactly k keys
+        homeOccupancy = [0] * (max(keysPerHome.values(), default=0) + 1)
+        for n in keysPerHome.values():
+            homeOccupancy[n] += 1
+        homeOccupancy[0] = mask + 1 - len(keysPerHome)
+
+        totalProbes = sum(probe * n for probe, n in probeHistogram.items())
+        return {
+            "capacity": mask + 1,
+            "count": self.count,
+            "tombstones": self.used - self.count,
+            "loadFactor": self.count / (mask + 1),
+            "maxProbe": max(probeHistogram, default=0),
+            "meanProbe": totalProbes / self.count if self.count else 0.0,
+            "collisions": self.count - len(keysPerHome),
+            "probeHistogram": probeHistogram,
+            "homeOccupancy": homeOccupancy,
+        }
+
+    def __repr__(self):
+        return "HashMap({" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "})"
+
+
+# ================================================================
+# BENCHMARK: HashMap vs the chaining table in Hashtable.py
+# ================================================================
+def benchmark(n=1_000_000, chainingLookups=1_000):
+    import os
+    import time
+    from contextlib import redirect_stdout
+
+    names = [f"user{i}" for i in range(n)]
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import Hashtable  # runs its demo on import, silenced here
+        Hashtable.my_list = [[] for _ in range(10)]
+        start = time.perf_counter()
+        for name in names:
+            Hashtable.add_with_chaining(name)
+        chainInsert = time.perf_counter() - start
+    start = time.perf_counter()
+    for name in names[::n // chainingLookups]:
+        Hashtable.contains_with_chaining(name)
+    chainLookup = (time.perf_counter() - start) / len(names[::n // chainingLookups])
+
+    table = HashMap()
+    start = time.perf_counter()
+    for i, name in enumerate(names):
+        table.put(name, i)
+    mapInsert = time.perf_counter() - start
+    start = time.perf_counter()
+    for name in names:
+        table.get(name)
+    mapLookup = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    for name in names[::2]:
+        table.delete(name)
+    mapDelete = time.perf_counter() - start
+
+    print(f"Benchmark with {n:,} string keys:")
+    print(f"  Chaining (10 buckets) insert : {chainInsert:8.3f} s (includes its print per insert)")
+    print(f"  Chaining lookup              : {chainLookup * 1e6:10.1f} µs/lookup")
+    print(f"  HashMap insert               : {mapInsert:8.3f} s (final capacity {table.mask + 1:,})")
+    print(f"  HashMap lookup               : {mapLookup * 1e6:10.1f} µs/lookup")
+    print(f"  HashMap delete half          : {mapDelete:8.3f} s")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" HASH MAP (OPEN ADDRESSING) ")
+    print("============================\n")
+
+    ages = HashMap(capacity=8)
+    for name, age in [('Bob', 31), ('Pete', 24), ('Jones', 45), ('Lisa', 29), ('Siri', 38), ('Stuart', 52)]:
+        ages.put(name, age)
+    print("Map:", ages)
+    print("Capacity:", ages.mask + 1, "| Entries:", len(ages))
+    print("get('Lisa') =", ages.get('Lisa'), "| get('Alex') =", ages.get('Alex'))
+
+    ages.put('Lisa', 30)
+    ages.delete('Pete')
+    print("After put('Lisa', 30) and delete('Pete'):", ages)
+    print("'Pete' in map:", 'Pete' in ages, "| 'Stuart' in map:", 'Stuart' in ages)
+
+    for i in range(20):
+        ages[f"guest{i}"] = i
+    print("After 20 more puts → capacity grew to", ages.mask + 1)
+    stats = ages.probeStats()
+    print(f"Probe stats: max probe {stats['maxProbe']}, mean {stats['meanProbe']:.2f}, "
+          f"collisions {stats['collisions']}, histogram {stats['probeHistogram']}\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Collisions never overwrite: probing finds the next free slot.")
+    print("✅ Load factor stays ≤ 0.7 by doubling, so lookups stay O(1) on average.")
+    print("✅ Tombstones keep probe chains intact after deletes and are purged on resize.\n")
@@ -0,0 +1,159 @@
+# ================================================================
+# PYTHON DEMO: Interval Tree (built on the AVL Tree)
+# ================================================================
+# Interval Tree = AVL Tree keyed by (start, end) that answers
+# "which stored intervals overlap [a, b]?" without scanning everything.
+#
+# Key Concepts:
+#  - Each node stores one closed interval [start, end] as its key
+#  - Augmentation: maxEnd = largest end point anywhere in the subtree
+#  - Rotations/insert/delete from AVLTree.py keep maxEnd up to date
+#    through IntervalNode.update()
+#  - A subtree whose maxEnd < a cannot overlap [a, b] → skipped entirely
+#  - Once a node starts after b, nothing later in sorted order can overlap
+#  - Overlap query: O(log n + k) on typical data, O(min(n, k·log n)) worst case
+# ================================================================
+
+from AVLTree import AVLTree, TreeNode
+
+
+class IntervalNode(TreeNode):
+    """AVL node holding an interval (start, end) plus the subtree's max end point"""
+    def __init__(self, data):
+        super().__init__(data)
+        self.maxEnd = data[1]
+
+    def update(self):
+        """Recompute height, subtree size and maxEnd from the children"""
+        TreeNode.update(self)
+        left, right = self.left, self.right
+        maxEnd = self.data[1]
+        if left is not None and left.maxEnd > maxEnd:
+            maxEnd = left.maxEnd
+        if right is not None and right.maxEnd > maxEnd:
+            maxEnd = right.maxEnd
+        self.maxEnd = maxEnd
+
+
+def checkInterval(start, end):
+    if end < start:
+        raise ValueError(f"invalid interval [{start}, {end}]: end is before start")
+    return (start, end)
+
+
+class IntervalTree(AVLTree):
+    """AVL-balanced interval tree; identical intervals are stored once"""
+
+    nodeClass = IntervalNode
+
+    @classmethod
+    def from_sorted(cls, intervals):
+        """Build a balanced tree in O(n) from (start, end) pairs sorted by start, then end"""
+        return super().from_sorted(checkInterval(start, end) for start, end in intervals)
+
+    def insert(self, start, end):
+        """Insert [start, end]; returns False if that exact interval is already stored"""
+        return super().insert(checkInterval(start, end))
+
+    def delete(self, start, end):
+        """Delete [start, end]; returns False if it was not stored"""
+        return super().delete((start, end))
+
+    def overlaps(self, lo, hi):
+        """Lazily yield stored intervals overlapping [lo, hi], in sorted order"""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            # Descend left, skipping subtrees that end before lo
+            while node is not None and node.maxEnd >= lo:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            start, end = node.data
+            if start > hi:
+                return  # every later interval starts even later
+            if end >= lo:
+                yield node.data
+            node = node.right
+
+    def stabbing(self, point):
+        """Lazily yield stored intervals that contain point"""
+        return self.overlaps(point, point)
+
+
+# ==============================
+# Benchmark
+# ==============================
+def benchmark(n=100_000, queries=200, seed=5):
+    """Compare overlap queries with a linear scan over a list of intervals"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(n):
+        start = rng.randrange(10 * n)
+        intervals.append((start, start + rng.randrange(1, 50)))  # short time ranges
+    windows = []
+    for _ in range(queries):
+        lo = rng.randrange(10 * n)
+        windows.append((lo, lo + rng.randrange(0, 200)))
+
+    start = time.perf_counter()
+    tree = IntervalTree()
+    for interval in intervals:
+        tree.insert(*interval)
+    insertTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = IntervalTree.from_sorted(sorted(intervals))
+    bulkTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    treeHits = sum(1 for lo, hi in windows for _ in bulk.overlaps(lo, hi))
+    treeTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unique = sorted(set(intervals))
+    scanHits = sum(1 for lo, hi in windows for s, e in unique if s <= hi and e >= lo)
+    scanTime = time.perf_counter() - start
+    assert treeHits == scanHits
+
+    print(f"Benchmark: {len(tree):,} intervals, {queries:,} overlap queries ({treeHits:,} hits)")
+    print(f"  Build by insert()          : {insertTime:8.3f} s")
+    print(f"  Build by from_sorted()     : {bulkTime:8.3f} s")
+    print(f"  Queries, IntervalTree      : {treeTime:8.3f} s")
+    print(f"  Queries, linear list scan  : {scanTime:8.3f} s")
+
+
+# ==============================
+# DEMONSTRATION
+# ==============================
+if __name__ == "__main__":
+    print("\n==============================")
+    print(" DEMO: Interval Tree ")
+    print("==============================\n")
+
+    meetings = [(9, 10), (13, 15), (8, 12), (16, 18), (10, 11), (14, 17), (11, 13)]
+    tree = IntervalTree()
+    for start, end in meetings:
+        tree.insert(start, end)
+
+    print("Stored intervals (sorted):", list(tree))
+    print("Root:", tree.root.data, "→ maxEnd of whole tree:", tree.root.maxEnd)
+    print("Overlapping [12, 14]:", list(tree.overlaps(12, 14)))
+    print("Containing time 10  :", list(tree.stabbing(10)))
+    tree.delete(14, 17)
+    print("After deleting (14, 17), overlapping [16, 20]:", list(tree.overlaps(16, 20)), "\n")
+
+    benchmark()
+
+    print("\n==============================")
+    print(" IMPORTANT NOTES ")
+    print("==============================")
+    print("1. Same AVL insert/delete/rotations; IntervalNode.update() also maintains maxEnd.")
+    print("2. maxEnd lets a query skip whole subtrees that end before the window starts.")
+    print("3. Sorted order (by start) lets the query stop at the first interval starting after the window.")
+    print("4. from_sorted() builds the tree in O(n) from an already sorted interval list.\n")
@@ -0,0 +1,259 @@
+# ================================================================
+# LRU / TTL CACHE - HASH MAP + DOUBLY LINKED LIST
+# ================================================================
+# A cache keeps recently used results so they need not be recomputed.
+# When it is full, the Least Recently Used (LRU) entry is evicted.
+#
+# Two structures work together, both O(1) per operation:
+#   - HashMap (HashMap.py)     : key → entry, for direct lookup
+#   - Doubly linked list       : entries ordered from least to most
+#                                recently used; an entry can be unlinked
+#                                and moved to the front without a search
+#
+# Extras:
+#   - capacity by entry count (maxsize) and/or by total weight (maxWeight)
+#   - optional time-to-live per entry, checked lazily when the key is read
+#   - hit / miss / eviction / expiration counters
+#   - @memoize decorator built on top of the cache
+# ================================================================
+
+import functools
+import time
+
+from HashMap import HashMap
+
+
+class CacheEntry:
+    """Doubly linked list node holding one cached value"""
+    __slots__ = ("key", "value", "weight", "expires", "prev", "next")
+
+    def __init__(self, key=None, value=None, weight=0, expires=None):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.expires = expires
+        self.prev = self
+        self.next = self
+
+
+class LRUCache:
+    """O(1) LRU cache with optional weight-based capacity and per-entry TTL"""
+
+    def __init__(self, maxsize=128, maxWeight=None, weigher=None, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize      # None = unlimited number of entries
+        self.maxWeight = maxWeight  # None = no weight limit
+        self.weigher = weigher      # weigher(key, value) → weight, default 1 per entry
+        self.ttl = ttl              # default time-to-live in seconds, None = never expires
+        self.clock = clock
+        self.map = HashMap()
+        # Sentinel of a circular list: root.next = least recent, root.prev = most recent
+        self.root = CacheEntry()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # -------------------------------------------------
+    # Linked list helpers
+    # -------------------------------------------------
+    def _unlink(self, entry):
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _append(self, entry):
+        """Link entry as the most recently used"""
+        last = self.root.prev
+        entry.prev, entry.next = last, self.root
+        last.next = entry
+        self.root.prev = entry
+
+    def _remove(self, entry):
+        self._unlink(entry)
+        self.map.delete(entry.key)
+        self.weight -= entry.weight
+
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self.clock()
+
+    # -------------------------------------------------
+    # Public API
+    # -------------------------------------------------
+    def get(self, key, default=None):
+        entry = self.map.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._expired(entry):
+            self._remove(entry)  # lazy expiry: only checked when read
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._unlink(entry)
+        self._append(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key, value, ttl=None, weight=None):
+        """Cache value under key; ttl/weight override the cache defaults"""
+        if weight is None:
+            weight = self.weigher(key, value) if self.weigher else 1
+        ttl = self.ttl if ttl is None else ttl
+        expires = self.clock() + ttl if ttl is not None else None
+
+        entry = self.map.get(key)
+        if entry is not None:
+            self._unlink(entry)
+            self.weight += weight - entry.weight
+            entry.value, entry.weight, entry.expires = value, weight, expires
+        else:
+            entry = CacheEntry(key, value, weight, expires)
+            self.map.put(key, entry)
+            self.weight += weight
+        self._append(entry)
+
+        # Evict least recently used entries until both limits hold
+        root = self.root
+        while root.next is not root and (
+                (self.maxsize is not None and len(self.map) > self.maxsize) or
+                (self.maxWeight is not None and self.weight > self.maxWeight)):
+            self._remove(root.next)
+            self.evictions += 1
+
+    def delete(self, key):
+        """Remove key; returns False if it was not cached"""
+        entry = self.map.get(key)
+        if entry is None:
+            return False
+        self._remove(entry)
+        return True
+
+    def clear(self):
+        self.map = HashMap()
+        self.root.prev = self.root.next = self.root
+        self.weight = 0
+
+    def __len__(self):
+        return len(self.map)
+
+    def __contains__(self, key):
+        entry = self.map.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def keys(self):
+        """Keys from least to most recently used (expired ones included until read)"""
+        entry = self.root.next
+        while entry is not self.root:
+            yield entry.key
+            entry = entry.next
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.map),
+            "weight": self.weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hitRate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# ================================================================
+# @memoize DECORATOR
+# ================================================================
+_MISSING = object()
+_KWARGS = object()  # separates positional from keyword arguments in cache keys
+
+
+def memoize(maxsize=128, maxWeight=None, weigher=None, ttl=None):
+    """Cache a function's results in an LRUCache (use as @memoize or @memoize(...))"""
+    if callable(maxsize):
+        return memoize()(maxsize)
+
+    def decorator(func):
+        cache = LRUCache(maxsize, maxWeight, weigher, ttl)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS,) + tuple(sorted(kwargs.items())) if kwargs else args
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+# ================================================================
+# BENCHMARK: memoize vs functools.lru_cache
+# ================================================================
+def benchmark(calls=500_000, distinctKeys=50_000, maxsize=10_000, seed=3):
+    import random
+
+    rng = random.Random(seed)
+    # Skewed access pattern: a few keys are very popular (like real traffic)
+    workload = [int(rng.paretovariate(0.3)) % distinctKeys for _ in range(calls)]
+
+    def work(x):
+        return x * x
+
+    results = {}
+    for name, wrapped in (("memoize (LRUCache)", memoize(maxsize)(work)),
+                          ("functools.lru_cache", functools.lru_cache(maxsize)(work))):
+        start = time.perf_counter()
+        for x in workload:
+            wrapped(x)
+        elapsed = time.perf_counter() - start
+        if hasattr(wrapped, "cache"):
+            hitRate = wrapped.cache.stats()["hitRate"]
+        else:
+            info = wrapped.cache_info()
+            hitRate = info.hits / (info.hits + info.misses)
+        results[name] = (elapsed, hitRate)
+
+    print(f"Benchmark: {calls:,} calls over {distinctKeys:,} keys, maxsize {maxsize:,}")
+    for name, (elapsed, hitRate) in results.items():
+        print(f"  {name:22}: {elapsed:6.3f} s  ({elapsed / calls * 1e6:5.2f} µs/call, hit rate {hitRate:.1%})")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" LRU / TTL CACHE ")
+    print("============================\n")
+
+    cache = LRUCache(maxsize=3)
+    for name in ['Bob', 'Pete', 'Jones']:
+        cache.put(name, len(name))
+    cache.get('Bob')             # Bob becomes most recently used
+    cache.put('Lisa', 4)         # evicts Pete (least recently used)
+    print("Order (LRU → MRU):", list(cache.keys()))
+    print("'Pete' cached:", 'Pete' in cache, "| stats:", cache.stats(), "\n")
+
+    now = [0.0]
+    sessions = LRUCache(maxsize=None, maxWeight=10, weigher=lambda k, v: len(v), ttl=30, clock=lambda: now[0])
+    sessions.put('s1', 'abcd')
+    sessions.put('s2', 'efgh', ttl=5)
+    sessions.put('s3', 'ijkl')   # total weight 12 > 10 → evicts s1
+    now[0] = 10.0                # s2's ttl has passed
+    print("Weighted cache after adding s3:", list(sessions.keys()))
+    print("get('s2') after 10 s:", sessions.get('s2'), "| get('s3'):", sessions.get('s3'))
+    print("stats:", sessions.stats(), "\n")
+
+    @memoize(maxsize=256)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print("fib(80) =", fib(80), "| cache stats:", fib.cache.stats(), "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ HashMap finds the entry in O(1); the linked list reorders it in O(1).")
+    print("✅ Expired entries are dropped lazily on read, so there is no background sweeper.")
+    print("❌ Pure Python: functools.lru_cache (written in C) is faster when count-based LRU is enough.\n")
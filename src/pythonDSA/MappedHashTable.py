@@ -0,0 +1,230 @@
+"""
+Memory-Mapped Persistent Hash Table (str key -> int64 value)
+------------------------------------------------------------
+This program demonstrates:
+- The open-addressing idea of Hashtable.py / HashMap.py, stored in a file
+- Fixed-width slots, so slot i is found by arithmetic (no parsing)
+- Looking keys up straight from a memory-mapped file: opening costs the
+  same whether the table holds 10 keys or 10 million
+- An offline build() that counts and sizes everything before writing
+
+File layout (every section starts on an 8-byte boundary):
+    header : magic, version, byte order, capacity, count, key heap size
+    slots  : capacity x 4 int64 words = (hash, key offset, key length, value)
+             hash 0 marks an empty slot
+    heap   : the UTF-8 bytes of every key, back to back
+
+The hash is blake2b (fixed, unlike Python's hash() which is randomized
+per process), so a file built by one process is readable by any other.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from hashlib import blake2b
+
+MAGIC = b"MHTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHcxqqq")  # magic, version, byte order, capacity, count, heap bytes
+HEADER_SIZE = 32
+SLOT_WORDS = 4  # hash, key offset, key length, value
+
+
+def keyHash(data):
+    """Non-zero 63-bit hash of the key bytes (0 is reserved for empty slots)"""
+    return (int.from_bytes(blake2b(data, digest_size=8).digest(), "little") >> 1) | 1
+
+
+def encodeKey(key):
+    if not isinstance(key, str):
+        raise TypeError(f"keys must be str, not {type(key).__name__}")
+    return key.encode("utf-8")
+
+
+def build(path, items, maxLoad=0.7):
+    """Write (key, value) pairs (or a dict) to path; a repeated key keeps its last value"""
+    if not 0 < maxLoad < 1:
+        raise ValueError("maxLoad must be between 0 and 1")
+    if hasattr(items, "items"):
+        items = items.items()
+    table = {encodeKey(key): value for key, value in items}
+
+    # Size every section before writing anything
+    capacity = 8
+    while len(table) > maxLoad * capacity:
+        capacity *= 2
+    mask = capacity - 1
+    slots = array('q', [0]) * (SLOT_WORDS * capacity)
+    heap = bytearray()
+    for data, value in table.items():
+        h = keyHash(data)
+        i = h & mask
+        while slots[SLOT_WORDS * i]:  # linear probing
+            i = (i + 1) & mask
+        w = SLOT_WORDS * i
+        slots[w], slots[w + 1], slots[w + 2], slots[w + 3] = h, len(heap), len(data), value
+        heap += data
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, sys.byteorder[0].encode(), capacity, len(table), len(heap)))
+        slots.tofile(f)
+        f.write(heap)
+    return len(table)
+
+
+class MappedHashTable:
+    """Read-only hash table answering lookups directly from a memory-mapped file"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder, self.capacity, self.count, heapSize = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a mapped hash table (version {VERSION})")
+        if byteorder != sys.byteorder[0].encode():
+            self.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        # Zero-copy views: only the slots and keys a lookup touches are paged in
+        self.mask = self.capacity - 1
+        heapStart = HEADER_SIZE + 8 * SLOT_WORDS * self.capacity
+        view = memoryview(self.map)
+        self.slots = view[HEADER_SIZE:heapStart].cast('q')
+        self.heap = view[heapStart:heapStart + heapSize]
+        view.release()
+
+    def _find(self, key):
+        """Word index of key's slot, or -1"""
+        data = encodeKey(key)
+        h = keyHash(data)
+        slots, heap, mask = self.slots, self.heap, self.mask
+        i = h & mask
+        for _ in range(self.capacity):  # a full table (not written by build) has no empty slot to stop at
+            w = SLOT_WORDS * i
+            slotHash = slots[w]
+            if slotHash == 0:
+                return -1
+            if slotHash == h and heap[slots[w + 1]:slots[w + 1] + slots[w + 2]] == data:
+                return w
+            i = (i + 1) & mask
+        return -1
+
+    def get(self, key, default=None):
+        w = self._find(key)
+        return default if w < 0 else self.slots[w + 3]
+
+    def __getitem__(self, key):
+        w = self._find(key)
+        if w < 0:
+            raise KeyError(key)
+        return self.slots[w + 3]
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __len__(self):
+        return self.count
+
+    def items(self):
+        """All (key, value) pairs, in slot order"""
+        slots, heap = self.slots, self.heap
+        for w in range(0, len(slots), SLOT_WORDS):
+            if slots[w]:
+                yield str(heap[slots[w + 1]:slots[w + 1] + slots[w + 2]], "utf-8"), slots[w + 3]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release the views and unmap the file"""
+        for name in ("slots", "heap"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self.map.close()
+        self.file.close()
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def benchmark(n=1_000_000, lookups=1_000, folder=None):
+    """Open-to-answer latency: mapped file vs unpickling (or JSON-loading) a dict"""
+    import json
+    import os
+    import pickle
+    import random
+    import tempfile
+    import time
+
+    index = {f"segments/{i:08d}.log": i * 4096 for i in range(n)}
+    probes = random.Random(2).sample(list(index), lookups)
+
+    with tempfile.TemporaryDirectory(dir=folder) as tmp:
+        tablePath = os.path.join(tmp, "index.mht")
+        picklePath = os.path.join(tmp, "index.pickle")
+        jsonPath = os.path.join(tmp, "index.json")
+        start = time.perf_counter()
+        build(tablePath, index)
+        buildTime = time.perf_counter() - start
+        with open(picklePath, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        with open(jsonPath, "w") as f:
+            json.dump(index, f)
+
+        timings = {}
+        start = time.perf_counter()
+        with open(jsonPath) as f:
+            loaded = json.load(f)
+        timings["json.load + lookups"] = (time.perf_counter() - start, sum(loaded[key] for key in probes))
+        start = time.perf_counter()
+        with open(picklePath, "rb") as f:
+            loaded = pickle.load(f)
+        timings["pickle.load + lookups"] = (time.perf_counter() - start, sum(loaded[key] for key in probes))
+        del loaded
+        start = time.perf_counter()
+        with MappedHashTable(tablePath) as table:
+            firstOpen = time.perf_counter() - start
+            answer = sum(table[key] for key in probes)
+        timings["MappedHashTable + lookups"] = (time.perf_counter() - start, answer)
+        assert len({answer for _, answer in timings.values()}) == 1
+
+        print(f"Benchmark: {n:,} keys, {lookups:,} lookups after opening")
+        print(f"  build() time              : {buildTime:8.3f} s")
+        for label, name in (("mapped file", tablePath), ("pickle", picklePath), ("json", jsonPath)):
+            print(f"  {label + ' size':26}: {os.path.getsize(name) / 2**20:8.2f} MB")
+        for label, (seconds, _) in timings.items():
+            print(f"  {label:26}: {seconds * 1e3:10.2f} ms")
+        print(f"  (open + map alone         : {firstOpen * 1e3:10.3f} ms)")
+
+
+# -------------------------
+# Demonstration
+# -------------------------
+if __name__ == "__main__":
+    import os
+
+    print("\n========== Memory-Mapped Hash Table Demonstration ==========\n")
+
+    path = "offsets_demo.mht"
+    count = build(path, [('Bob', 0), ('Pete', 120), ('Jones', 360), ('Lisa', 512), ('Pete', 777)])
+    print(f"Built {path} with {count} keys ('Pete' was repeated, last value kept)")
+    with MappedHashTable(path) as table:
+        print("Capacity:", table.capacity, "| Entries:", len(table))
+        print("table['Lisa'] =", table['Lisa'], "| table.get('Pete') =", table.get('Pete'),
+              "| 'Stuart' in table:", 'Stuart' in table)
+        print("All entries:", sorted(table.items()), "\n")
+    os.remove(path)
+
+    benchmark()
+
+    print("\n========== Important Notes ==========")
+    print("1. Fixed-width slots: slot i lives at header + 32·i bytes, so nothing is parsed on open.")
+    print("2. The OS pages in only the slots and keys that lookups touch.")
+    print("3. blake2b instead of hash(): the layout must not change between processes.")
+    print("4. The table is read-only; rebuild it offline with build() when the data changes.\n")
@@ -0,0 +1,186 @@
+# ============================================
+# NUMERIC STACK - DEMONSTRATION PROGRAM
+# ============================================
+# StackList and LinkedListStack in Stacks.py:
+#   - store every number as a separate Python object (a float is 24
+#     bytes, plus an 8-byte list slot or a whole Node for the linked list)
+#   - return the string "Stack is empty" from pop/peek, so an error looks
+#     like just another value on the stack
+#
+# NumericStack keeps raw machine numbers in an array.array:
+#   'd' → 8-byte floats, 'q' → 8-byte signed integers
+#   - push / pop work on the end of the array: amortized O(1) (the array
+#     over-allocates when it grows, like a list)
+#   - push_many / pop_many(n) move whole blocks with one C-level copy;
+#     pop_many returns the popped values as an array slice
+#   - an empty stack raises StackEmpty (an IndexError)
+# ============================================
+
+from array import array
+
+
+class StackEmpty(IndexError):
+    """Raised when popping or peeking past the bottom of the stack"""
+
+
+class NumericStack:
+    """LIFO stack of numbers stored unboxed in an array.array"""
+
+    def __init__(self, typecode='d', iterable=()):
+        self.data = array(typecode, iterable)  # the top of the stack is data[-1]
+
+    def push(self, value):
+        self.data.append(value)
+
+    def push_many(self, values):
+        """Push values in order (the last one ends on top)"""
+        self.data.extend(values)
+
+    def pop(self):
+        if not self.data:
+            raise StackEmpty("pop from an empty stack")
+        return self.data.pop()
+
+    def pop_many(self, n):
+        """Pop the top n values; returns them as an array in push order (top value last)"""
+        data = self.data
+        if n > len(data):
+            raise StackEmpty(f"cannot pop {n} values from a stack of {len(data)}")
+        if n <= 0:
+            return array(data.typecode)
+        top = data[-n:]
+        del data[-n:]
+        return top
+
+    def peek(self, k=0):
+        """Value k places below the top (peek() is the top) without removing it"""
+        if not 0 <= k < len(self.data):
+            raise StackEmpty(f"cannot peek {k} below the top of a stack of {len(self.data)}")
+        return self.data[-1 - k]
+
+    def clear(self):
+        del self.data[:]
+
+    def isEmpty(self):
+        return len(self.data) == 0
+
+    def size(self):
+        return len(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def nbytes(self):
+        return len(self.data) * self.data.itemsize
+
+    def __repr__(self):
+        return f"NumericStack({self.data.typecode!r}, {self.data.tolist()})  # top is last"
+
+
+def evalRPN(tokens):
+    """Evaluate a postfix expression such as "3 4 + 2 *" on a float stack"""
+    operators = {"+": float.__add__, "-": float.__sub__, "*": float.__mul__, "/": float.__truediv__}
+    stack = NumericStack('d')
+    for token in tokens.split():
+        if token in operators:
+            left, right = stack.pop_many(2)
+            stack.push(operators[token](left, right))
+        else:
+            stack.push(float(token))
+    if len(stack) != 1:
+        raise ValueError(f"malformed expression: {len(stack)} values left on the stack")
+    return stack.pop()
+
+
+# -------------------------------------------------
+# Benchmark: NumericStack vs StackList vs LinkedListStack
+# -------------------------------------------------
+def benchmark(n=10_000_000, memoryN=1_000_000, block=10_000):
+    import os
+    import time
+    import tracemalloc
+    from contextlib import redirect_stdout
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import Stacks  # runs its demo on import, silenced here
+
+    def pushAll(stack, count):
+        push = stack.push
+        for i in range(count):
+            push(i * 0.5)
+
+    def popAll(stack, count):
+        pop = stack.pop
+        for _ in range(count):
+            pop()
+
+    def pushBlocks(stack, count):
+        chunk = array('d', [0.5] * block)
+        for _ in range(count // block):
+            stack.push_many(chunk)
+
+    def popBlocks(stack, count):
+        for _ in range(count // block):
+            stack.pop_many(block)
+
+    variants = {
+        "StackList": (Stacks.StackList, pushAll, popAll),
+        "LinkedListStack": (Stacks.LinkedListStack, pushAll, popAll),
+        "NumericStack('d')": (NumericStack, pushAll, popAll),
+        f"NumericStack('d'), blocks of {block:,}": (NumericStack, pushBlocks, popBlocks),
+    }
+    print(f"Benchmark: {n:,} float pushes, then {n:,} pops")
+    print(f"  {'':36} {'push s':>8} {'pop s':>8} {'bytes/elem':>11} {f'MB at {n // 10**6}M':>10}")
+    for label, (makeStack, push, pop) in variants.items():
+        stack = makeStack()
+        start = time.perf_counter()
+        push(stack, n)
+        middle = time.perf_counter()
+        pop(stack, n)
+        popTime = time.perf_counter() - middle
+        del stack
+
+        tracemalloc.start()  # a smaller traced run: tracemalloc slows allocation down
+        traced = makeStack()
+        push(traced, memoryN)
+        size = tracemalloc.get_traced_memory()[0] / memoryN
+        tracemalloc.stop()
+        del traced
+        print(f"  {label:36} {middle - start:8.3f} {popTime:8.3f} {size:11.1f} {size * n / 1e6:10,.0f}")
+    print(f"  (bytes/elem traced with {memoryN:,} pushes, including the float objects)")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" NUMERIC STACK ")
+    print("============================\n")
+
+    stack = NumericStack('q')
+    stack.push_many([10, 20, 30, 40])
+    stack.push(50)
+    print("Stack:", stack)
+    print("peek():", stack.peek(), "| peek(2):", stack.peek(2))
+    print("pop_many(3):", stack.pop_many(3), "| left:", stack)
+    try:
+        stack.pop_many(5)
+    except StackEmpty as error:
+        print("pop_many(5) → StackEmpty:", error)
+    try:
+        stack.push(2 ** 70)
+    except OverflowError as error:
+        print("push(2**70) on a 'q' stack → OverflowError:", error)
+    stack.clear()
+    try:
+        stack.pop()
+    except StackEmpty as error:
+        print("pop on an empty stack → StackEmpty:", error)
+    print("evalRPN('3 4 + 2 * 7 /'):", evalRPN("3 4 + 2 * 7 /"), "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ 8 bytes per number: no float object and no list slot or Node per element.")
+    print("✅ push_many / pop_many move whole blocks in C instead of one Python call per value.")
+    print("✅ An empty stack raises StackEmpty instead of returning \"Stack is empty\" as a value.")
+    print("❌ One push() per value is still a Python call: about as fast as StackList, so batch when you can.")
+    print("❌ Only numbers of one type fit (typecode 'd' or 'q'); use StackList for mixed objects.\n")
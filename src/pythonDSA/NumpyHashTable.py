@@ -0,0 +1,262 @@
+# ================================================================
+# NUMPY HASH TABLE - VECTORIZED BATCH INSERT / LOOKUP
+# ================================================================
+# add_with_chaining / contains_with_chaining in Hashtable.py handle one
+# item per Python call. When keys arrive as batches of int64 IDs, the
+# per-call overhead dominates.
+#
+# This table keeps keys and values in two NumPy arrays (a sentinel key
+# marks free slots) and processes a whole batch per step ("probe round"):
+#   1. compute the home slot of every key at once (Fibonacci hashing)
+#   2. resolve every key whose slot holds it (hit) or is empty (miss/claim)
+#   3. move the remaining keys one slot further (linear probing) and repeat
+# A batch finishes in (longest probe run) rounds instead of n Python calls.
+# Growing multiplies the size by 16 and re-inserts the live keys in one
+# pass; pass expected= (or reserve()) to size the table once up front.
+# ================================================================
+
+import numpy as np
+
+GOLDEN_RATIO_64 = np.uint64(0x9E3779B97F4A7C15)  # 2^64 / φ
+EMPTY = np.iinfo(np.int64).min  # marks a free slot; this key itself is stored aside
+
+
+class NumpyHashTable:
+    """Open-addressing int64 → int64 table with vectorized batch operations"""
+
+    def __init__(self, capacity=1024, maxLoad=0.5, growth=16):
+        if growth < 2 or growth & (growth - 1):
+            raise ValueError("growth must be a power of two (the table size stays a power of two)")
+        if not 0 < maxLoad < 1:
+            raise ValueError("maxLoad must be between 0 and 1")
+        size = 1024
+        while size < capacity:
+            size *= 2
+        self.maxLoad = maxLoad
+        self.growth = growth  # each rehash multiplies the size by this: fewer full rehashes
+        self.count = 0
+        self.emptyKeyValue = None  # value of the key EMPTY, which cannot live in a slot
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self.keys = np.full(size, EMPTY, dtype=np.int64)
+        self.values = np.zeros(size, dtype=np.int64)
+        self.bits = size.bit_length() - 1
+        self.mask = size - 1
+
+    def __len__(self):
+        return self.count
+
+    def _home(self, keys):
+        """Fibonacci hashing: top bits of key * 2^64/φ (wrapping uint64 multiply)"""
+        return ((keys.view(np.uint64) * GOLDEN_RATIO_64) >> np.uint64(64 - self.bits)).view(np.int64)
+
+    def _place(self, keys, values):
+        """Insert or update distinct keys (none equal to EMPTY), one vectorized probe round at a time
+
+        The keys still probing are kept compacted (keys, values and slots
+        side by side), so later rounds work on short arrays. take/put/compress
+        are used instead of fancy indexing: same result, much less overhead.
+        """
+        tableKeys, tableValues = self.keys, self.values
+        slots = self._home(keys)
+        while len(keys):
+            current = tableKeys.take(slots, mode="wrap")  # wrap: slot size+i is slot i
+            free = current == EMPTY
+            hit = current == keys
+            if hit.any():
+                tableValues.put(np.compress(hit, slots) & self.mask, np.compress(hit, values))
+
+            # Empty slots: scatter the keys, then read back to see which key
+            # landed (one per slot); the others retry next round, when the
+            # slot is taken and they move on
+            freeSlots = np.compress(free, slots) & self.mask
+            freeKeys = np.compress(free, keys)
+            tableKeys.put(freeSlots, freeKeys)
+            won = tableKeys.take(freeSlots) == freeKeys
+            claimed = np.compress(won, freeSlots)
+            tableValues.put(claimed, np.compress(won, np.compress(free, values)))
+            self.count += len(claimed)
+            if len(claimed) == len(keys):
+                break
+
+            pending = ~(free | hit)  # taken by another key: probe the next slot
+            pending[free] = ~won     # lost the claim: retry the same slot
+            step = ~np.compress(pending, free)
+            keys, values = np.compress(pending, keys), np.compress(pending, values)
+            slots = np.compress(pending, slots) + step
+
+    def _rebuild(self, keys, values):
+        """Fill an empty table with distinct keys in home-slot order, without probe rounds
+
+        Inserted in home order, linear probing puts key i at
+        max(home_i, slot_{i-1} + 1), a running maximum NumPy computes in one
+        pass. Keys pushed past the last slot wrap around via _place.
+        """
+        homes = self._home(keys)
+        order = np.argsort(homes)  # any order among equal homes gives a valid layout
+        keys, values, homes = keys.take(order), values.take(order), homes.take(order)
+        rank = np.arange(len(keys))
+        slots = np.maximum.accumulate(homes - rank) + rank
+        inside = slots <= self.mask
+        insideSlots = np.compress(inside, slots)
+        self.keys.put(insideSlots, np.compress(inside, keys))
+        self.values.put(insideSlots, np.compress(inside, values))
+        self.count += len(insideSlots)
+        if len(insideSlots) < len(keys):
+            self._place(np.compress(~inside, keys), np.compress(~inside, values))
+
+    def reserve(self, count):
+        """Make room for count entries in total (one rehash now instead of several later)"""
+        size = self.mask + 1
+        if count <= self.maxLoad * size:
+            return
+        while count > self.maxLoad * size:
+            size *= self.growth
+        live = self.keys != EMPTY
+        liveKeys, liveValues = np.compress(live, self.keys), np.compress(live, self.values)
+        self._allocate(size)
+        self.count -= len(liveKeys)
+        self._rebuild(liveKeys, liveValues)
+
+    def insert_many(self, keys, values, expected=None):
+        """Insert/update a batch; if a key repeats in the batch, its last value wins
+
+        expected (optional): how many entries the table will hold once all
+        coming batches are in. The table is then sized once, so later batches
+        do not trigger rehashes.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.broadcast_to(np.asarray(values, dtype=np.int64), keys.shape)
+        # Every key must be placed exactly once: a plain sort detects repeats
+        # cheaply, the (slower) stable unique only runs when there are some
+        sortedKeys = np.sort(keys)
+        if len(keys) > 1 and (sortedKeys[1:] == sortedKeys[:-1]).any():
+            keys, lastIndex = np.unique(keys[::-1], return_index=True)
+            values = values[::-1][lastIndex]
+        if len(keys) and sortedKeys[0] == EMPTY:  # the sentinel key goes aside
+            isEmpty = keys == EMPTY
+            self.count += self.emptyKeyValue is None
+            self.emptyKeyValue = int(values[isEmpty][-1])
+            keys, values = keys[~isEmpty], values[~isEmpty]
+        self.reserve(max(self.count + len(keys), expected or 0))
+        self._place(keys, values)
+
+    def lookup_many(self, keys, default=-1):
+        """Return (values, found) arrays; missing keys get default and found=False"""
+        keys = np.asarray(keys, dtype=np.int64)
+        tableKeys, tableValues = self.keys, self.values
+        result = np.full(len(keys), default, dtype=np.int64)
+        found = np.zeros(len(keys), dtype=bool)
+        isEmpty = keys == EMPTY
+        if self.emptyKeyValue is not None:
+            result[isEmpty] = self.emptyKeyValue
+            found[isEmpty] = True
+        slots = self._home(keys)
+        pending = np.flatnonzero(~isEmpty)
+        while pending.size:
+            s = slots.take(pending)
+            current = tableKeys.take(s, mode="wrap")
+            hit = current == keys.take(pending)
+            if hit.any():
+                result.put(np.compress(hit, pending), tableValues.take(np.compress(hit, s), mode="wrap"))
+                found.put(np.compress(hit, pending), True)
+            move = ~hit & (current != EMPTY)  # empty slot → key is absent, stop probing
+            pending = np.compress(move, pending)
+            slots.put(pending, np.compress(move, s) + 1)
+        return result, found
+
+    def get(self, key, default=None):
+        values, found = self.lookup_many([key])
+        return int(values[0]) if found[0] else default
+
+
+# ================================================================
+# BENCHMARK: batched NumPy table vs per-item Python tables
+# ================================================================
+def benchmark(batches=10, batchSize=100_000, chainSample=1_000, repeats=3, seed=0):
+    """Every contender inserts and looks up the same batches * batchSize keys (best of `repeats` runs)"""
+    import os
+    import time
+    from contextlib import redirect_stdout
+    from HashMap import HashMap
+
+    rng = np.random.default_rng(seed)
+    batchKeys = [rng.integers(0, 2**62, batchSize, dtype=np.int64) for _ in range(batches)]
+    allKeys = np.concatenate(batchKeys)
+    total = len(allKeys)
+
+    def rates(makeTable, insert, lookup, lookups=total):
+        """Best (insert, lookup) rates over `repeats` fresh tables"""
+        best = (0, 0)
+        for _ in range(repeats):
+            table = makeTable()
+            start = time.perf_counter()
+            insert(table)
+            middle = time.perf_counter()
+            lookup(table)
+            end = time.perf_counter()
+            best = max(best[0], total / (middle - start)), max(best[1], lookups / (end - middle))
+        return best
+
+    results = {}
+    # The chaining demo hashes strings (sum of the characters), so it gets the
+    # same keys as decimal strings, converted before timing. One Python call
+    # (and one print) per item, 10 buckets.
+    ids = [str(k) for k in allKeys.tolist()]
+    sample = ids[::max(1, total // chainSample)]  # ~total/10 keys per bucket, every lookup scans one
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import Hashtable
+
+        def chainTable():
+            Hashtable.my_list = [[] for _ in range(10)]
+
+        results["Chaining (Hashtable.py)"] = rates(
+            chainTable,
+            lambda _: [Hashtable.add_with_chaining(key) for key in ids],
+            lambda _: [Hashtable.contains_with_chaining(key) for key in sample], len(sample))
+
+    keys = allKeys.tolist()
+    results["HashMap (per item)"] = rates(HashMap, lambda table: [table.put(key, key) for key in keys],
+                                          lambda table: [table.get(key) for key in keys])
+
+    for label, capacity, expected in (("growing", 1024, None), ("growing, expected hint", 1024, total),
+                                      ("presized", 2 * total, None)):
+        results["NumpyHashTable, " + label] = rates(
+            lambda: NumpyHashTable(capacity),
+            lambda table: [table.insert_many(batch, batch, expected) for batch in batchKeys],
+            lambda table: [table.lookup_many(batch) for batch in batchKeys])
+
+    print(f"Benchmark: {batches} batches x {batchSize:,} int64 keys, the same keys for every table")
+    print(f"  (items per second, best of {repeats} runs)")
+    print(f"  {'':40} {'insert':>14} {'lookup':>14}")
+    chainInsert, chainLookup = results["Chaining (Hashtable.py)"]
+    for label, (insertRate, lookupRate) in results.items():
+        print(f"  {label:40} {insertRate:14,.0f} {lookupRate:14,.0f}")
+        if label.startswith("NumpyHashTable"):
+            print(f"    speed-up vs chaining: insert {insertRate / chainInsert:,.0f}x, "
+                  f"lookup {lookupRate / chainLookup:,.0f}x")
+    print(f"  (chaining lookups timed on {len(sample):,} of the {total:,} keys)")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" NUMPY HASH TABLE (BATCHED) ")
+    print("============================\n")
+
+    table = NumpyHashTable()
+    table.insert_many([101, 202, 303, 404], [1, 2, 3, 4])
+    table.insert_many([202, 505, 505], [20, 5, 50])  # update 202; last 505 wins
+    values, found = table.lookup_many([101, 202, 505, 999])
+    print("lookup_many([101, 202, 505, 999])")
+    print("  values:", values.tolist())
+    print("  found :", found.tolist())
+    print("Entries:", len(table), "| capacity:", table.mask + 1, "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ One NumPy call handles every key of a batch: Python overhead is paid per round, not per item.")
+    print("✅ Load factor ≤ 0.5 keeps probe runs (and therefore rounds) short.")
+    print("✅ Growing by 16x means few rehashes; an expected size (or reserve) avoids them entirely.")
+    print("❌ Only int64 keys/values; single-item calls are slower than a dict.\n")
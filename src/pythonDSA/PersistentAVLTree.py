@@ -0,0 +1,273 @@
+# ================================================================
+# PYTHON DEMO: Persistent (Path-Copying) AVL Tree
+# ================================================================
+# A persistent tree never changes a node after creating it.
+# An update copies only the nodes on the root-to-key path (O(log n))
+# and returns a NEW root; every untouched subtree is shared.
+#
+# Why? In AVLTree.py insert/delete rotate nodes in place, so a reader
+# thread can observe a tree halfway through a rotation. Here a reader
+# simply grabs the current root: that version can never change under it,
+# and the writer publishes the next version with one reference assignment.
+#
+# Key Concepts:
+#  - Same balance rules (LL, RR, LR, RL) as AVLTree.py, done by copying
+#  - Old versions stay valid as long as someone holds their root
+#  - Time Complexity: O(log n) time and O(log n) new nodes per update
+# ================================================================
+
+from AVLTree import getHeight, getSize, minValueNode, select, rank, count_range
+from BinarySearchTrees import iter_range
+
+
+class PersistentNode:
+    """Immutable AVL node; height and size are computed once at creation"""
+    __slots__ = ("data", "left", "right", "height", "size")
+
+    def __init__(self, data, left=None, right=None):
+        self.data = data
+        self.left = left
+        self.right = right
+        self.height = 1 + max(getHeight(left), getHeight(right))
+        self.size = 1 + getSize(left) + getSize(right)
+
+
+# ==============================
+# Path-Copying Operations
+# ==============================
+def balanced(data, left, right):
+    """New node for data/left/right; rotations are done by building new nodes"""
+    leftHeight, rightHeight = getHeight(left), getHeight(right)
+
+    if leftHeight > rightHeight + 1:
+        if getHeight(left.left) >= getHeight(left.right):
+            # Left Left (LL): single right rotation
+            return PersistentNode(left.data, left.left, PersistentNode(data, left.right, right))
+        # Left Right (LR): double rotation
+        pivot = left.right
+        return PersistentNode(pivot.data,
+                              PersistentNode(left.data, left.left, pivot.left),
+                              PersistentNode(data, pivot.right, right))
+
+    if rightHeight > leftHeight + 1:
+        if getHeight(right.right) >= getHeight(right.left):
+            # Right Right (RR): single left rotation
+            return PersistentNode(right.data, PersistentNode(data, left, right.left), right.right)
+        # Right Left (RL): double rotation
+        pivot = right.left
+        return PersistentNode(pivot.data,
+                              PersistentNode(data, left, pivot.left),
+                              PersistentNode(right.data, pivot.right, right.right))
+
+    return PersistentNode(data, left, right)
+
+
+def insert(node, data):
+    """Return the root of a new version containing data (same root if already present)"""
+    if node is None:
+        return PersistentNode(data)
+    if data < node.data:
+        left = insert(node.left, data)
+        return node if left is node.left else balanced(node.data, left, node.right)
+    if data > node.data:
+        right = insert(node.right, data)
+        return node if right is node.right else balanced(node.data, node.left, right)
+    return node
+
+
+def delete(node, data):
+    """Return the root of a new version without data (same root if not present)"""
+    if node is None:
+        return None
+    if data < node.data:
+        left = delete(node.left, data)
+        return node if left is node.left else balanced(node.data, left, node.right)
+    if data > node.data:
+        right = delete(node.right, data)
+        return node if right is node.right else balanced(node.data, node.left, right)
+
+    if node.left is None:
+        return node.right
+    if node.right is None:
+        return node.left
+    successor = minValueNode(node.right)
+    return balanced(successor.data, node.left, delete(node.right, successor.data))
+
+
+def search(node, data):
+    """Return the node holding data in this version, or None"""
+    while node is not None:
+        if data < node.data:
+            node = node.left
+        elif data > node.data:
+            node = node.right
+        else:
+            return node
+    return None
+
+
+class PersistentAVLTree:
+    """Immutable AVL tree value: insert/delete return a new tree sharing unchanged nodes"""
+    __slots__ = ("root",)
+
+    def __init__(self, root=None):
+        self.root = root
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced version from ascending keys in O(n) (duplicates are skipped)"""
+        keys = []
+        for data in iterable:
+            if keys and not keys[-1] < data:
+                if data < keys[-1]:
+                    raise ValueError("from_sorted() expects keys in ascending order")
+                continue
+            keys.append(data)
+
+        def build(lo, hi):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            return PersistentNode(keys[mid], build(lo, mid - 1), build(mid + 1, hi))
+
+        return cls(build(0, len(keys) - 1))
+
+    def insert(self, data):
+        root = insert(self.root, data)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def delete(self, data):
+        root = delete(self.root, data)
+        return self if root is self.root else PersistentAVLTree(root)
+
+    def __len__(self):
+        return getSize(self.root)
+
+    def __contains__(self, data):
+        return search(self.root, data) is not None
+
+    def __iter__(self):
+        return iter_range(self.root)
+
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        return iter_range(self.root, lo, hi, reverse)
+
+    def select(self, k):
+        return select(self.root, k)
+
+    def rank(self, data):
+        return rank(self.root, data)
+
+    def count_range(self, lo, hi):
+        return count_range(self.root, lo, hi)
+
+
+# ==============================
+# Benchmark
+# ==============================
+def benchmark(n=200_000, readers=4, seconds=1.0, seed=11):
+    """Update cost vs the in-place AVLTree, and reader throughput under a concurrent writer"""
+    import random
+    import threading
+    import time
+    from AVLTree import AVLTree
+
+    rng = random.Random(seed)
+    keys = rng.sample(range(n * 10), n)
+
+    start = time.perf_counter()
+    mutable = AVLTree()
+    for key in keys:
+        mutable.insert(key)
+    mutableTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = PersistentAVLTree()
+    for key in keys:
+        tree = tree.insert(key)
+    persistentTime = time.perf_counter() - start
+
+    print(f"Update cost ({n:,} inserts):")
+    print(f"  AVLTree (in place)       : {mutableTime:7.3f} s  ({mutableTime / n * 1e6:5.2f} µs/op)")
+    print(f"  PersistentAVLTree (copy) : {persistentTime:7.3f} s  ({persistentTime / n * 1e6:5.2f} µs/op)")
+
+    published = {"tree": tree}  # the writer swaps this reference, readers just read it
+    probes = rng.sample(keys, 1000)
+
+    def runReaders(withWriter):
+        stop = threading.Event()
+        counts = [0] * readers
+        snapshotsOk = [True] * readers
+
+        def reader(slot):
+            done, ok, snapshot = 0, True, published["tree"]
+            while not stop.is_set():
+                snapshot = published["tree"]  # consistent version, no lock needed
+                hits = 0
+                for key in probes:
+                    if key in snapshot:
+                        hits += 1
+                done += len(probes)
+                # Probes are loaded keys and the writer only adds/removes keys outside that
+                # range, so every snapshot must contain all of them and keep n keys
+                ok = ok and hits == len(probes) and len(snapshot) == n
+            # One full walk of the last snapshot: sorted, and as long as its stored size
+            walked = list(snapshot)
+            ok = ok and len(walked) == len(snapshot) and all(a < b for a, b in zip(walked, walked[1:]))
+            counts[slot] = done
+            snapshotsOk[slot] = ok
+
+        def writer():
+            current = published["tree"]
+            key = n * 10  # outside range(n * 10) of the loaded keys: insert always adds a new key
+            while not stop.is_set():
+                current = current.insert(key)
+                current = current.delete(key)
+                published["tree"] = current
+                key += 1
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        if withWriter:
+            threads.append(threading.Thread(target=writer))
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        return sum(counts) / seconds, all(snapshotsOk)
+
+    print(f"Reader throughput ({readers} reader threads, {seconds:.1f} s):")
+    for withWriter in (False, True):
+        rate, ok = runReaders(withWriter)
+        label = "with concurrent writer" if withWriter else "no writer"
+        print(f"  {label:24} : {rate:12,.0f} lookups/s  (snapshots consistent: {ok})")
+
+
+# ==============================
+# DEMONSTRATION
+# ==============================
+if __name__ == "__main__":
+    print("\n==============================")
+    print(" DEMO: Persistent AVL Tree ")
+    print("==============================\n")
+
+    v1 = PersistentAVLTree()
+    for letter in ['C', 'B', 'E', 'A', 'D', 'H', 'G', 'F']:
+        v1 = v1.insert(letter)
+    v2 = v1.delete('H').insert('Z')
+
+    print("Version 1:", list(v1))
+    print("Version 2:", list(v2), "(delete H, insert Z)")
+    print("Version 1 is unchanged:", list(v1) == ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H'])
+    print("Shared left subtree (same object):", v1.root.left is v2.root.left, "\n")
+
+    benchmark()
+
+    print("\n==============================")
+    print(" IMPORTANT NOTES ")
+    print("==============================")
+    print("1. Nodes are immutable: an update copies only the O(log n) nodes on its path.")
+    print("2. Readers use whichever root they grabbed; it is always a complete, balanced tree.")
+    print("3. One writer publishes a new root with a single assignment (atomic in CPython).")
+    print("4. Multiple writers still need a lock among themselves, readers never do.\n")
@@ -0,0 +1,347 @@
+# ================================================================
+# PYTHON DEMO: Indexed Heap (priority queue with decrease-key)
+# ================================================================
+# The queues in Queues.py are FIFO: items leave in arrival order.
+# A priority queue always hands out the most urgent item first.
+#
+# A binary heap keeps items in a list where parent i has children
+# 2i+1 and 2i+2, and every parent is at least as urgent as its
+# children:
+#   - peek  → heap[0]                                    O(1)
+#   - push  → append, then swap upwards ("sift up")      O(log n)
+#   - pop   → move the last item to the top, sift down   O(log n)
+#   - heapify a list bottom-up                           O(n)
+#
+# heapq does all this, but cannot change the priority of an item that
+# is already queued: the usual workaround pushes a duplicate and marks
+# the old entry as stale ("lazy deletion"), so the heap fills with dead
+# entries. Here push returns a handle that always knows its position:
+#   - decrease_key / update(handle, priority)  → one sift   O(log n)
+#   - remove(handle)                           → O(log n)
+#
+# A d-ary heap (arity d: children d·i+1 ... d·i+d) is shallower: fewer
+# levels to sift through, at the cost of comparing d children per level.
+# ================================================================
+
+import operator
+
+from RingBufferQueue import QueueEmpty
+
+MODES = ("min", "max")
+
+
+class Handle:
+    """A queued item; index is its position in the heap list (-1 once it has left)"""
+    __slots__ = ("item", "priority", "index")
+
+    def __init__(self, item, priority):
+        self.item = item
+        self.priority = priority
+        self.index = -1
+
+    def __repr__(self):
+        return f"Handle({self.item!r}, priority={self.priority!r})"
+
+
+class IndexedHeap:
+    """Array-backed d-ary min/max heap whose entries can be re-prioritized or removed"""
+
+    def __init__(self, arity=2, mode="min"):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        self.arity = arity
+        self.mode = mode
+        self.before = operator.lt if mode == "min" else operator.gt  # before(a, b): a is more urgent
+        self.heap = []  # list of Handle
+
+    # -------------------------------------------------
+    # Sifting (moves a hole instead of swapping pairs)
+    # -------------------------------------------------
+    def _siftUp(self, index):
+        heap, before, arity = self.heap, self.before, self.arity
+        handle = heap[index]
+        priority = handle.priority
+        while index > 0:
+            parentIndex = (index - 1) // arity
+            parent = heap[parentIndex]
+            if not before(priority, parent.priority):
+                break
+            heap[index] = parent
+            parent.index = index
+            index = parentIndex
+        heap[index] = handle
+        handle.index = index
+
+    def _siftDown(self, index):
+        heap, before, arity = self.heap, self.before, self.arity
+        n = len(heap)
+        handle = heap[index]
+        priority = handle.priority
+        while True:
+            best = arity * index + 1
+            if best >= n:
+                break
+            bestPriority = heap[best].priority
+            for child in range(best + 1, min(best + arity, n)):
+                if before(heap[child].priority, bestPriority):
+                    best, bestPriority = child, heap[child].priority
+            if not before(bestPriority, priority):
+                break
+            heap[index] = heap[best]
+            heap[index].index = index
+            index = best
+        heap[index] = handle
+        handle.index = index
+
+    def _check(self, handle):
+        index = handle.index
+        if not 0 <= index < len(self.heap) or self.heap[index] is not handle:
+            raise ValueError(f"{handle!r} is not in this heap")
+
+    # -------------------------------------------------
+    # Priority queue operations
+    # -------------------------------------------------
+    def push(self, item, priority):
+        """Add item; returns its handle (keep it to update or remove the item later)"""
+        handle = Handle(item, priority)
+        self.heap.append(handle)
+        self._siftUp(len(self.heap) - 1)
+        return handle
+
+    def heapify(self, pairs):
+        """Add many (item, priority) pairs by rebuilding bottom-up in O(n); returns their handles"""
+        handles = [Handle(item, priority) for item, priority in pairs]
+        heap = self.heap
+        heap.extend(handles)
+        for index, handle in enumerate(heap):
+            handle.index = index
+        for index in range((len(heap) - 2) // self.arity, -1, -1):  # last parent down to the root
+            self._siftDown(index)
+        return handles
+
+    def peek(self):
+        """(item, priority) of the most urgent entry"""
+        if not self.heap:
+            raise QueueEmpty("peek at an empty priority queue")
+        top = self.heap[0]
+        return top.item, top.priority
+
+    def pop(self):
+        """Remove and return (item, priority) of the most urgent entry"""
+        heap = self.heap
+        if not heap:
+            raise QueueEmpty("pop from an empty priority queue")
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._siftDown(0)
+        top.index = -1
+        return top.item, top.priority
+
+    def update(self, handle, priority):
+        """Change the priority of a queued entry (either direction)"""
+        self._check(handle)
+        old, handle.priority = handle.priority, priority
+        if self.before(priority, old):
+            self._siftUp(handle.index)
+        else:
+            self._siftDown(handle.index)
+
+    def decrease_key(self, handle, priority):
+        """Make an entry more urgent: a smaller priority in a min-heap, a larger one in a max-heap"""
+        if self.before(handle.priority, priority):
+            raise ValueError(f"{priority!r} is less urgent than {handle.priority!r}: use update()")
+        self.update(handle, priority)
+
+    def remove(self, handle):
+        """Remove a queued entry from anywhere in the heap; returns its item"""
+        self._check(handle)
+        heap, index = self.heap, handle.index
+        last = heap.pop()
+        if last is not handle:
+            heap[index] = last
+            last.index = index
+            if index > 0 and self.before(last.priority, heap[(index - 1) // self.arity].priority):
+                self._siftUp(index)
+            else:
+                self._siftDown(index)
+        handle.index = -1
+        return handle.item
+
+    def __contains__(self, handle):
+        return 0 <= handle.index < len(self.heap) and self.heap[handle.index] is handle
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __repr__(self):
+        return f"IndexedHeap({self.mode}, arity={self.arity}, {[(h.item, h.priority) for h in self.heap]})"
+
+
+# ==============================
+# Benchmark
+# ==============================
+def dijkstra(graph, source, makeHeap):
+    """Shortest distances with decrease_key: each vertex is queued at most once"""
+    heap = makeHeap()
+    distance = {source: 0}
+    handles = {source: heap.push(source, 0)}
+    done = set()
+    while heap:
+        u, d = heap.pop()
+        done.add(u)
+        for v, weight in graph.adj_list[u]:
+            candidate = d + weight
+            if v in done or candidate >= distance.get(v, float("inf")):
+                continue
+            distance[v] = candidate
+            if v in handles and handles[v] in heap:
+                heap.decrease_key(handles[v], candidate)
+            else:
+                handles[v] = heap.push(v, candidate)
+    return distance
+
+
+def dijkstraLazy(graph, source):
+    """heapq version: push a duplicate on every improvement and skip stale entries"""
+    import heapq
+    distance = {source: 0}
+    queue = [(0, source)]
+    done = set()
+    while queue:
+        d, u = heapq.heappop(queue)
+        if u in done:
+            continue  # stale duplicate
+        done.add(u)
+        for v, weight in graph.adj_list[u]:
+            candidate = d + weight
+            if v not in done and candidate < distance.get(v, float("inf")):
+                distance[v] = candidate
+                heapq.heappush(queue, (candidate, v))
+    return distance
+
+
+def benchmark(vertices=50_000, edges=400_000, tasks=200_000, changes=200_000, seed=11):
+    import heapq
+    import itertools
+    import random
+    import time
+    from Graph import GraphList
+
+    rng = random.Random(seed)
+
+    def timed(action):
+        start = time.perf_counter()
+        result = action()
+        return time.perf_counter() - start, result
+
+    # Shortest paths on a random sparse graph
+    graph = GraphList(list(range(vertices)), directed=True, weighted=True)
+    for _ in range(edges):
+        graph.add_edge(rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, 100))
+    rows = {"heapq + lazy deletion": timed(lambda: dijkstraLazy(graph, 0))}
+    for arity in (2, 4, 8):
+        rows[f"IndexedHeap, arity {arity}"] = timed(lambda: dijkstra(graph, 0, lambda: IndexedHeap(arity)))
+    assert len({tuple(sorted(distance.items())) for _, distance in rows.values()}) == 1
+
+    # Scheduler: queue tasks, then re-prioritize / cancel random ones, then drain
+    priorities = [rng.random() for _ in range(tasks)]
+    operations = [(rng.randrange(tasks), rng.random() if rng.random() < 0.8 else None) for _ in range(changes)]
+
+    def schedulerIndexed(arity):
+        heap = IndexedHeap(arity)
+        handles = heap.heapify(zip(range(tasks), priorities))
+        for task, priority in operations:
+            handle = handles[task]
+            if handle not in heap:
+                continue
+            if priority is None:
+                heap.remove(handle)  # cancel
+            else:
+                heap.update(handle, priority)
+        order = []
+        while heap:
+            order.append(heap.pop()[0])
+        return order, tasks
+
+    def schedulerLazy():
+        counter = itertools.count()
+        entries = {}  # task -> its live [priority, count, task, alive] entry
+        queue = []
+        for task, priority in zip(range(tasks), priorities):
+            entries[task] = [priority, next(counter), task, True]
+            queue.append(entries[task])
+        heapq.heapify(queue)
+        for task, priority in operations:
+            entry = entries.get(task)
+            if entry is None:
+                continue
+            entry[3] = False  # the old entry becomes a stale leftover
+            if priority is None:
+                del entries[task]
+            else:
+                entries[task] = [priority, next(counter), task, True]
+                heapq.heappush(queue, entries[task])
+        peak = len(queue)
+        order = []
+        while queue:
+            priority, _, task, alive = heapq.heappop(queue)
+            if alive:
+                order.append(task)
+        return order, peak
+
+    schedulers = {"heapq + lazy deletion": timed(schedulerLazy)}
+    for arity in (2, 4, 8):
+        schedulers[f"IndexedHeap, arity {arity}"] = timed(lambda: schedulerIndexed(arity))
+    assert len({tuple(order) for _, (order, _) in schedulers.values()}) == 1
+
+    print(f"Benchmark 1: Dijkstra on {vertices:,} vertices / {edges:,} edges")
+    for label, (elapsed, _) in rows.items():
+        print(f"  {label:24} {elapsed:8.3f} s")
+    print(f"\nBenchmark 2: {tasks:,} tasks, {changes:,} re-prioritize/cancel operations, then drain")
+    print(f"  {'':24} {'time s':>8} {'peak heap size':>15}")
+    for label, (elapsed, (_, peak)) in schedulers.items():
+        print(f"  {label:24} {elapsed:8.3f} {peak:15,}")
+
+
+# ==============================
+# DEMONSTRATION
+# ==============================
+if __name__ == "__main__":
+    print("\n==============================")
+    print(" DEMO: Indexed Heap ")
+    print("==============================\n")
+
+    jobs = IndexedHeap()
+    backup = jobs.push("backup", 5)
+    emails = jobs.push("send emails", 3)
+    jobs.heapify([("build", 4), ("deploy", 6), ("report", 8)])
+    print("Queued:", jobs)
+    print("peek:", jobs.peek())
+    jobs.decrease_key(backup, 1)
+    print("After decrease_key(backup, 1):", jobs.peek())
+    jobs.update(emails, 9)
+    print("Removed:", jobs.remove(backup))
+    print("Pop order:", [jobs.pop() for _ in range(len(jobs))])
+    try:
+        jobs.pop()
+    except QueueEmpty as error:
+        print("Pop from an empty heap → QueueEmpty:", error)
+
+    scores = IndexedHeap(arity=4, mode="max")
+    scores.heapify([("ann", 70), ("bob", 85), ("cy", 60), ("dee", 92), ("eve", 78)])
+    print("\n4-ary max-heap, top score:", scores.peek(), "| list layout:", [h.item for h in scores.heap], "\n")
+
+    benchmark()
+
+    print("\n==============================")
+    print(" IMPORTANT NOTES ")
+    print("==============================")
+    print("1. Handles make decrease_key / update / remove O(log n): no stale duplicate entries.")
+    print("2. heapify builds the heap bottom-up in O(n) instead of n pushes in O(n log n).")
+    print("3. Higher arity means a shallower heap: cheaper pushes / decrease_keys, more comparisons per pop.")
+    print("4. heapq is written in C and stays faster even with stale entries; the indexed heap")
+    print("   keeps the heap at its live size and gives exact update / remove by handle.\n")
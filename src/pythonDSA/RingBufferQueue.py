@@ -0,0 +1,337 @@
+# ============================================
+# RING BUFFER QUEUE - DEMONSTRATION PROGRAM
+# ============================================
+# QueueList in Queues.py dequeues with pop(0): every remaining element
+# shifts one place, so draining n items costs O(n²).
+#
+# A ring buffer preallocates a fixed block of slots and keeps two
+# positions that only move forward (and wrap around at the end):
+#
+#     slots:  [ .  .  C  D  E  .  . ]
+#                     ↑ head    ↑ head + count  (next free slot)
+#
+#   enqueue → write at (head + count) % size     O(1), nothing shifts
+#   dequeue → read at head, head = (head + 1) % size
+#
+# Bounded queues apply a policy when full (backpressure):
+#   "reject"      → raise QueueFull
+#   "drop_oldest" → overwrite the oldest item (keeps the newest data)
+#   "block"       → wait until a consumer makes room (threads only:
+#                   BlockingRingBufferQueue)
+# Unbounded queues (capacity=None) double their buffer when full.
+# ============================================
+
+import threading
+import time
+from array import array
+
+POLICIES = ("reject", "drop_oldest", "block")
+
+
+class QueueEmpty(IndexError):
+    """Raised when dequeuing from an empty queue"""
+
+
+class QueueFull(OverflowError):
+    """Raised when a bounded queue is full (reject policy, or a block timed out)"""
+
+
+class RingBufferQueue:
+    """FIFO queue over a preallocated list (or typed array) used as a ring"""
+
+    policies = ("reject", "drop_oldest")  # "block" needs a lock to wait on: BlockingRingBufferQueue
+
+    def __init__(self, capacity=None, policy="reject", typecode=None):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if policy not in self.policies:
+            raise ValueError(f"the {policy} policy needs threads: use BlockingRingBufferQueue")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity  # None = unbounded
+        self.policy = policy
+        self.typecode = typecode  # e.g. 'd' or 'q' → array storage, no per-item objects
+        self.buffer = self._newBuffer(capacity or 16)
+        self.head = 0
+        self.count = 0
+        self.dropped = 0  # items overwritten by the drop_oldest policy
+
+    def _newBuffer(self, size):
+        return array(self.typecode, bytes(array(self.typecode).itemsize * size)) if self.typecode else [None] * size
+
+    # -------------------------------------------------
+    # Ring helpers (no checks)
+    # -------------------------------------------------
+    def _grow(self, minimum):
+        size = len(self.buffer)
+        while size < minimum:
+            size *= 2
+        items = self._take(self.count)
+        self.buffer = self._newBuffer(size)
+        self.head = 0
+        self._put(items)
+
+    def _put(self, items):
+        """Write items after the current rear (caller guarantees room), at most 2 slice copies"""
+        buffer, size = self.buffer, len(self.buffer)
+        start = (self.head + self.count) % size
+        first = min(len(items), size - start)
+        buffer[start:start + first] = items[:first]
+        buffer[:len(items) - first] = items[first:]
+        self.count += len(items)
+
+    def _take(self, n):
+        """Remove and return the n oldest items (as a list or array)"""
+        buffer, size, head = self.buffer, len(self.buffer), self.head
+        first = min(n, size - head)
+        items = buffer[head:head + first] + buffer[:n - first]
+        if not self.typecode:  # drop references so dequeued objects can be freed
+            buffer[head:head + first] = [None] * first
+            buffer[:n - first] = [None] * (n - first)
+        self.head = (head + n) % size
+        self.count -= n
+        return items
+
+    # -------------------------------------------------
+    # Queue operations
+    # -------------------------------------------------
+    def enqueue(self, element):
+        buffer = self.buffer
+        size = len(buffer)
+        if self.count == size:
+            if self.capacity is None:
+                self._grow(size + 1)
+                buffer, size = self.buffer, len(self.buffer)
+            elif self.policy == "drop_oldest":
+                buffer[self.head] = element  # the oldest slot becomes the newest
+                self.head = (self.head + 1) % size
+                self.dropped += 1
+                return
+            else:
+                raise QueueFull("queue is full")
+        buffer[(self.head + self.count) % size] = element
+        self.count += 1
+
+    def dequeue(self):
+        if self.count == 0:
+            raise QueueEmpty("dequeue from an empty queue")
+        buffer, head = self.buffer, self.head
+        element = buffer[head]
+        if not self.typecode:
+            buffer[head] = None
+        self.head = (head + 1) % len(buffer)
+        self.count -= 1
+        return element
+
+    def enqueue_many(self, elements):
+        """Enqueue a batch; with the reject policy it is all or nothing"""
+        items = array(self.typecode, elements) if self.typecode else list(elements)
+        room = len(self.buffer) - self.count
+        if len(items) > room:
+            if self.capacity is None:
+                self._grow(self.count + len(items))
+            elif self.policy == "drop_oldest":
+                if len(items) > self.capacity:
+                    self.dropped += len(items) - self.capacity
+                    items = items[len(items) - self.capacity:]
+                overflow = len(items) - (len(self.buffer) - self.count)
+                if overflow > 0:
+                    self._take(overflow)
+                    self.dropped += overflow
+            else:
+                raise QueueFull(f"no room for {len(items)} items ({room} free)")
+        self._put(items)
+
+    def dequeue_many(self, maxItems=None):
+        """Dequeue up to maxItems (default: all) in one step; returns a list"""
+        n = self.count if maxItems is None else min(maxItems, self.count)
+        items = self._take(n)
+        return items.tolist() if self.typecode else items
+
+    def peek(self):
+        if self.count == 0:
+            raise QueueEmpty("peek at an empty queue")
+        return self.buffer[self.head]
+
+    def isEmpty(self):
+        return self.count == 0
+
+    def isFull(self):
+        return self.capacity is not None and self.count == self.capacity
+
+    def size(self):
+        return self.count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Items from front to rear (without removing them)"""
+        buffer, size = self.buffer, len(self.buffer)
+        for i in range(self.count):
+            yield buffer[(self.head + i) % size]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)})"
+
+
+class BlockingRingBufferQueue(RingBufferQueue):
+    """Thread-safe ring buffer queue; the block policy makes producers wait for room"""
+
+    policies = POLICIES
+
+    def __init__(self, capacity=None, policy="block", typecode=None):
+        super().__init__(capacity, policy, typecode)
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+
+    def _waitForRoom(self, needed, deadline):
+        """Under the lock: wait until `needed` slots are free (block policy only); False on timeout"""
+        if self.policy != "block" or self.capacity is None:
+            return True
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return self.notFull.wait_for(lambda: self.capacity - self.count >= needed, timeout)
+
+    def enqueue(self, element, timeout=None):
+        with self.lock:
+            if not self._waitForRoom(1, None if timeout is None else time.monotonic() + timeout):
+                raise QueueFull("timed out waiting for room")
+            super().enqueue(element)
+            self.notEmpty.notify()
+
+    def enqueue_many(self, elements, timeout=None):
+        """Enqueue a batch; under the block policy it is added piece by piece as room frees up
+
+        timeout bounds the whole call; items added before a timeout stay queued.
+        """
+        items = list(elements)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            if self.policy == "block" and self.capacity is not None:
+                start = 0
+                while start < len(items):
+                    if not self._waitForRoom(1, deadline):
+                        raise QueueFull(f"timed out waiting for room ({start} of {len(items)} items enqueued)")
+                    room = self.capacity - self.count
+                    super().enqueue_many(items[start:start + room])
+                    start += room
+                    self.notEmpty.notify_all()
+                return
+            super().enqueue_many(items)
+            self.notEmpty.notify_all()
+
+    def dequeue(self, block=True, timeout=None):
+        with self.lock:
+            if block and not self.notEmpty.wait_for(lambda: self.count, timeout):
+                raise QueueEmpty("timed out waiting for an item")
+            element = super().dequeue()
+            self.notFull.notify()
+            return element
+
+    def dequeue_many(self, maxItems=None, block=True, timeout=None):
+        """Wait for at least one item (if block), then take up to maxItems"""
+        with self.lock:
+            if block and not self.notEmpty.wait_for(lambda: self.count, timeout):
+                return []
+            items = super().dequeue_many(maxItems)
+            self.notFull.notify_all()
+            return items
+
+    def peek(self):
+        with self.lock:
+            return super().peek()
+
+
+# -------------------------------------------------
+# Benchmark: ring buffer vs the queues in Queues.py and collections.deque
+# -------------------------------------------------
+def benchmark(n=1_000_000, listQueueN=100_000, batch=1_000):
+    import os
+    import time
+    from collections import deque
+    from contextlib import redirect_stdout
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import Queues  # runs its demo on import, silenced here
+
+    def fillAndDrain(queue, count, enqueue, dequeue):
+        start = time.perf_counter()
+        for i in range(count):
+            enqueue(queue, i)
+        middle = time.perf_counter()
+        for _ in range(count):
+            dequeue(queue)
+        return middle - start, time.perf_counter() - middle
+
+    results = {}
+    ql = Queues.QueueList()
+    results["QueueList (pop(0))"] = fillAndDrain(ql, listQueueN, Queues.QueueList.enqueue, Queues.QueueList.dequeue)
+    results["LinkedListQueue"] = fillAndDrain(Queues.LinkedListQueue(), n, Queues.LinkedListQueue.enqueue,
+                                              Queues.LinkedListQueue.dequeue)
+    results["RingBufferQueue"] = fillAndDrain(RingBufferQueue(), n, RingBufferQueue.enqueue, RingBufferQueue.dequeue)
+    results["RingBufferQueue('q')"] = fillAndDrain(RingBufferQueue(typecode='q'), n, RingBufferQueue.enqueue,
+                                                   RingBufferQueue.dequeue)
+    results["collections.deque"] = fillAndDrain(deque(), n, deque.append, deque.popleft)
+
+    ring = RingBufferQueue(capacity=n)
+    chunks = [list(range(i, i + batch)) for i in range(0, n, batch)]
+    start = time.perf_counter()
+    for chunk in chunks:
+        ring.enqueue_many(chunk)
+    middle = time.perf_counter()
+    while ring.count:
+        ring.dequeue_many(batch)
+    results[f"RingBuffer, batches of {batch:,}"] = (middle - start, time.perf_counter() - middle)
+
+    scale = n / listQueueN
+    print(f"Benchmark: enqueue then drain {n:,} items")
+    print(f"  {'':28} {'enqueue s':>10} {'drain s':>10}")
+    for label, (enqueueTime, drainTime) in results.items():
+        if label.startswith("QueueList"):
+            # pop(0) is O(n): measured on fewer items, drain extrapolated quadratically
+            enqueueTime, drainTime = enqueueTime * scale, drainTime * scale ** 2
+            label += " *"
+        print(f"  {label:28} {enqueueTime:10.3f} {drainTime:10.3f}")
+    print(f"  * measured with {listQueueN:,} items; drain extrapolated as O(n²)")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" RING BUFFER QUEUE ")
+    print("============================\n")
+
+    q = RingBufferQueue(capacity=4)
+    q.enqueue_many(['A', 'B', 'C'])
+    print("Queue after enqueue_many(A, B, C):", list(q), "| peek:", q.peek())
+    print("Dequeue:", q.dequeue())
+    q.enqueue('D')
+    q.enqueue('E')  # wraps around to the start of the buffer
+    print("After enqueue D, E (wrapped):", list(q), "| buffer slots:", q.buffer)
+    try:
+        q.enqueue('F')
+    except QueueFull as error:
+        print("Enqueue F on a full 'reject' queue → QueueFull:", error)
+
+    latest = RingBufferQueue(capacity=3, policy="drop_oldest")
+    latest.enqueue_many(range(1, 8))
+    print("drop_oldest queue after 1..7:", list(latest), "| dropped:", latest.dropped)
+    print("dequeue_many(2):", latest.dequeue_many(2), "| left:", list(latest))
+    try:
+        RingBufferQueue().dequeue()
+    except QueueEmpty as error:
+        print("Dequeue from an empty queue → QueueEmpty:", error)
+
+    blocking = BlockingRingBufferQueue(capacity=2)
+    consumer = threading.Thread(target=lambda: [print("  consumer got", blocking.dequeue()) for _ in range(4)])
+    consumer.start()
+    blocking.enqueue_many(['job1', 'job2', 'job3', 'job4'])  # waits whenever 2 jobs are pending
+    consumer.join()
+    print()
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Enqueue and dequeue only move an index: O(1), no shifting like pop(0).")
+    print("✅ Bounded capacity gives backpressure: reject, drop the oldest item, or block.")
+    print("✅ Errors are exceptions (QueueEmpty / QueueFull), not strings mixed with the data.\n")
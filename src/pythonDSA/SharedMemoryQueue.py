@@ -0,0 +1,291 @@
+# ============================================
+# SHARED-MEMORY RING QUEUE - BETWEEN PROCESSES
+# ============================================
+# The queues in Queues.py live inside one process. multiprocessing.Queue
+# crosses processes, but pickles every item, pushes the bytes through a
+# pipe and unpickles them on the other side.
+#
+# SharedMemoryQueue keeps a ring of fixed-size records in one block of
+# multiprocessing.shared_memory that every process maps:
+#
+#   [ head | tail |  record 0 | record 1 | ... | record slots-1 ]
+#     (64-bit counters, each on its own cache line)
+#
+#   - records are NumPy rows (any dtype / row shape, also structured
+#     dtypes for fixed-size records): a put copies bytes in, a get copies
+#     them out — nothing is pickled
+#   - head and tail only grow; slot = counter % slots
+#   - the producer writes the records first, then publishes them by
+#     storing the new tail; the consumer copies them out, then frees the
+#     slots by storing the new head. Each counter has a single writer.
+#   - "spsc": one producer, one consumer, no locks at all
+#     "mpsc": many producers share a multiprocessing.Lock (a block of rows
+#     stays contiguous), still one consumer
+#   - a full / empty queue is waited on by spinning, then sleeping briefly
+#
+# "Atomic-ish": an aligned 8-byte store is a single store on x86-64 and
+# ARM64, so a reader never sees half a counter. Python has no memory
+# fences; the write-data-then-publish order relies on the CPU keeping
+# stores in order (x86-64 does).
+# ============================================
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from RingBufferQueue import QueueEmpty, QueueFull
+
+MODES = ("spsc", "mpsc")
+HEADER = 128        # bytes before the first record
+HEAD, TAIL = 0, 8   # int64 word index of each counter (64 bytes apart)
+
+
+class SharedMemoryQueue:
+    """Ring of fixed-size NumPy records in shared memory; pass it to a Process to share it"""
+
+    def __init__(self, slots, dtype="f8", shape=(), mode="spsc"):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        self.slots = slots
+        self.dtype = np.dtype(dtype)
+        self.shape = tuple(shape)   # shape of one record: () = scalar, (128,) = row of 128 values
+        self.mode = mode
+        recordSize = self.dtype.itemsize * int(np.prod(self.shape, dtype=np.int64))
+        self.memory = shared_memory.SharedMemory(create=True, size=HEADER + slots * recordSize)
+        self.owner = True           # the creating process unlinks the block
+        self.lock = multiprocessing.Lock() if mode == "mpsc" else None
+        self._attachViews()
+        self.counters[:] = 0
+
+    def _attachViews(self):
+        self.counters = np.ndarray((HEADER // 8,), np.int64, buffer=self.memory.buf)
+        self.records = np.ndarray((self.slots,) + self.shape, self.dtype, buffer=self.memory.buf, offset=HEADER)
+
+    # Sent to a child process: attach to the same block by name
+    def __getstate__(self):
+        return {"name": self.memory.name, "slots": self.slots, "dtype": self.dtype,
+                "shape": self.shape, "mode": self.mode, "lock": self.lock}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.memory = shared_memory.SharedMemory(name=state["name"])
+        self.owner = False
+        del self.name
+        self._attachViews()
+
+    # -------------------------------------------------
+    # Ring helpers
+    # -------------------------------------------------
+    @staticmethod
+    def _waitFor(ready, deadline):
+        """Spin, then sleep in short steps until ready(); False once the deadline passes"""
+        spins = 0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            spins += 1
+            time.sleep(0 if spins < 100 else 0.0002)
+        return True
+
+    def _copyIn(self, position, rows):
+        start = position % self.slots
+        first = min(len(rows), self.slots - start)
+        self.records[start:start + first] = rows[:first]
+        self.records[:len(rows) - first] = rows[first:]
+
+    def _copyOut(self, position, n):
+        start = position % self.slots
+        first = min(n, self.slots - start)
+        if first == n:
+            return self.records[start:start + n].copy()
+        return np.concatenate((self.records[start:], self.records[:n - first]))
+
+    def _write(self, rows, deadline):
+        counters, start = self.counters, 0
+        tail = int(counters[TAIL])  # only this producer (or the lock holder) moves tail
+        while start < len(rows):
+            free = self.slots - (tail - int(counters[HEAD]))
+            if free == 0:
+                if not self._waitFor(lambda: int(counters[HEAD]) > tail - self.slots, deadline):
+                    raise QueueFull(f"timed out waiting for room ({start} of {len(rows)} rows written)")
+                continue
+            count = min(free, len(rows) - start)
+            self._copyIn(tail, rows[start:start + count])
+            tail += count
+            counters[TAIL] = tail  # publish only after the records are written
+            start += count
+
+    # -------------------------------------------------
+    # Queue operations
+    # -------------------------------------------------
+    def put_many(self, rows, timeout=None):
+        """Enqueue a block of records, waiting for room as needed (QueueFull on timeout)
+
+        Rows written before a timeout stay queued.
+        """
+        rows = np.asarray(rows, self.dtype).reshape((-1,) + self.shape)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self.lock is None:
+            self._write(rows, deadline)
+        else:
+            with self.lock:
+                self._write(rows, deadline)
+
+    def put(self, record, timeout=None):
+        self.put_many(np.reshape(np.asarray(record, self.dtype), (1,) + self.shape), timeout)
+
+    def get_batch(self, maxRows, timeout=None):
+        """Wait up to timeout for a record, then return up to maxRows as an array (empty on timeout)
+
+        Only one process may consume.
+        """
+        counters = self.counters
+        head = int(counters[HEAD])
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._waitFor(lambda: int(counters[TAIL]) > head, deadline):
+            return np.empty((0,) + self.shape, self.dtype)
+        n = min(maxRows, int(counters[TAIL]) - head)
+        rows = self._copyOut(head, n)
+        counters[HEAD] = head + n  # free the slots only after copying them out
+        return rows
+
+    def get(self, timeout=None):
+        rows = self.get_batch(1, timeout)
+        if not len(rows):
+            raise QueueEmpty("timed out waiting for a record")
+        return rows[0]
+
+    def __len__(self):
+        return int(self.counters[TAIL] - self.counters[HEAD])
+
+    def nbytes(self):
+        return self.memory.size
+
+    # -------------------------------------------------
+    # Cleanup
+    # -------------------------------------------------
+    def close(self):
+        """Detach this process; the creating process also frees the shared block"""
+        if self.memory is None:
+            return
+        self.counters = self.records = None  # views must go before the mapping closes
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+        self.memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -------------------------------------------------
+# Producers (module level so child processes can run them)
+# -------------------------------------------------
+def produceRows(queue, first, count, width, block):
+    """Send rows first..first+count-1 in blocks of `block` rows; column 0 holds the row number"""
+    template = np.ones((block, width))
+    shared = isinstance(queue, SharedMemoryQueue)
+    for start in range(first, first + count, block):
+        rows = template[:min(block, first + count - start)]
+        rows[:, 0] = np.arange(start, start + len(rows))
+        if not shared:
+            queue.put(rows.copy())  # pickled later by a feeder thread: must not change meanwhile
+        elif block > 1:
+            queue.put_many(rows)
+        else:
+            queue.put(rows[0])
+
+
+# -------------------------------------------------
+# Benchmark: MB/s against multiprocessing.Queue
+# -------------------------------------------------
+def benchmark(rows=100_000, width=128, block=256, slots=8_192, producers=4):
+    def run(makeQueue, producerCount, rowsPerPut):
+        queue = makeQueue()
+        share = rows // producerCount
+        total = share * producerCount
+        workers = [multiprocessing.Process(target=produceRows, args=(queue, p * share, share, width, rowsPerPut))
+                   for p in range(producerCount)]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        received, checksum = 0, 0.0
+        shared = isinstance(queue, SharedMemoryQueue)
+        while received < total:
+            if shared:
+                batch = queue.get_batch(block) if rowsPerPut > 1 else queue.get()[None]
+            else:
+                batch = queue.get()
+            received += len(batch)
+            checksum += batch[:, 0].sum()
+        elapsed = time.perf_counter() - start
+        for worker in workers:
+            worker.join()
+        if shared:
+            queue.close()
+        assert checksum == total * (total - 1) / 2  # every row arrived exactly once
+        return total * width * 8 / elapsed / 1e6
+
+    mpQueue = lambda: multiprocessing.Queue(slots // block)
+    spsc = lambda: SharedMemoryQueue(slots, "f8", (width,))
+    mpsc = lambda: SharedMemoryQueue(slots, "f8", (width,), mode="mpsc")
+    results = {
+        "multiprocessing.Queue, 1 row per put": run(mpQueue, 1, 1),
+        f"multiprocessing.Queue, {block}-row blocks": run(mpQueue, 1, block),
+        "SharedMemoryQueue spsc, 1 row per put": run(spsc, 1, 1),
+        f"SharedMemoryQueue spsc, {block}-row blocks": run(spsc, 1, block),
+        f"multiprocessing.Queue, {producers} producers": run(mpQueue, producers, block),
+        f"SharedMemoryQueue mpsc, {producers} producers": run(mpsc, producers, block),
+    }
+    print(f"Benchmark: {rows:,} rows of {width} float64 ({rows * width * 8 / 1e6:.0f} MB), "
+          f"ring of {slots:,} rows, 1 consumer")
+    for label, rate in results.items():
+        print(f"  {label:42} {rate:10,.0f} MB/s")
+
+
+def produceTrades(queue, first, count):
+    for i in range(first, first + count):
+        queue.put((i, 100 + i * 0.25))
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" SHARED-MEMORY RING QUEUE ")
+    print("============================\n")
+
+    trade = np.dtype([("id", "i8"), ("price", "f8")])  # fixed-size 16-byte records
+    with SharedMemoryQueue(slots=4, dtype=trade, mode="mpsc") as trades:
+        workers = [multiprocessing.Process(target=produceTrades, args=(trades, p * 5, 5)) for p in range(2)]
+        for worker in workers:
+            worker.start()
+        received = []
+        while len(received) < 10:
+            received += trades.get_batch(4).tolist()
+        for worker in workers:
+            worker.join()
+        print(f"Shared block: {trades.nbytes()} bytes, ring of {trades.slots} records of {trade.itemsize} bytes")
+        print("10 trades from 2 producer processes (ring of 4):", sorted(received) == [(i, 100 + i * 0.25) for i in range(10)])
+        print("get_batch on an empty queue with timeout 0.01 s →", trades.get_batch(4, timeout=0.01))
+
+    with SharedMemoryQueue(slots=3, shape=(2,)) as small:
+        small.put_many([[1, 2], [3, 4], [5, 6]])
+        try:
+            small.put([7, 8], timeout=0.01)
+        except QueueFull as error:
+            print("put on a full queue with timeout 0.01 s → QueueFull:", error)
+        print("Rows (a NumPy block, no pickling):", small.get_batch(3).tolist(), "\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Records are copied straight into shared memory: no pickling, no pipe.")
+    print("✅ Blocks of rows cost one copy per block, which is where the MB/s come from.")
+    print("✅ spsc needs no lock at all; mpsc serializes producers with one multiprocessing.Lock.")
+    print("❌ Records have a fixed dtype and size, and only one process may consume.\n")
@@ -0,0 +1,243 @@
+# ================================================================
+# STREAMING SKETCHES - COUNT-MIN SKETCH AND HYPERLOGLOG
+# ================================================================
+# Counting or de-duplicating with a hash table (Hashtable.py, HashMap.py)
+# stores every distinct element. For a click stream with hundreds of
+# millions of distinct IDs, that does not fit. A sketch keeps a small,
+# fixed-size summary instead and answers approximately:
+#
+#   Count-Min Sketch  "how often did x occur?", heavy hitters / top-k
+#     - depth rows of width counters; x adds to one counter per row
+#     - estimate = minimum over the rows (never too low, rarely too high)
+#     - error ≤ ε·N with probability 1-δ:  width = e/ε, depth = ln(1/δ)
+#
+#   HyperLogLog       "how many distinct elements?"
+#     - 2^p small registers; x goes to register (top p bits of its hash)
+#     - each register remembers the longest run of leading zeros seen
+#     - standard error ≈ 1.04 / √(2^p)  (p = 14 → 0.8% in 16 KB)
+#
+# Both are mergeable: a sketch per worker process, combined afterwards,
+# equals one sketch over the whole stream. Hashes come from
+# BloomFilter.hashPairs, which (unlike hash()) is the same in every process.
+# ================================================================
+
+import heapq
+import math
+
+import numpy as np
+
+from BloomFilter import hashPairs
+
+
+class CountMinSketch:
+    """Approximate frequency counts in depth x width counters, with top-k tracking"""
+
+    def __init__(self, width=2048, depth=5, topK=10):
+        self.width = width
+        self.depth = depth
+        self.topK = topK
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0  # N: sum of all counts added
+        self.candidates = {}  # up to topK keys with the largest estimates
+        self.rows = np.arange(depth, dtype=np.uint64)
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, topK=10):
+        """Sketch whose estimates exceed the true count by ≤ epsilon·N with probability 1 - delta"""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)), topK)
+
+    def _cells(self, keys):
+        """Flat table index of every (key, row) pair, shape (len(keys), depth)"""
+        h1, h2 = hashPairs(keys)
+        columns = (h1[:, None] + h2[:, None] * self.rows) % np.uint64(self.width)
+        return columns.astype(np.int64) + np.arange(self.depth) * self.width
+
+    def update_many(self, keys, counts=1):
+        """Add counts (scalar or one per key) for a batch of keys"""
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        counts = np.broadcast_to(np.asarray(counts, dtype=np.int64), (len(keys),))
+        cells = self._cells(keys)
+        flat = self.table.reshape(-1)
+        np.add.at(flat, cells, counts[:, None])
+        self.total += int(counts.sum())
+        if self.topK:
+            self._updateCandidates(keys, flat[cells].min(axis=1))
+
+    def update(self, key, count=1):
+        self.update_many([key], count)
+
+    def estimate_many(self, keys):
+        if not isinstance(keys, np.ndarray):
+            keys = list(keys)
+        return self.table.reshape(-1)[self._cells(keys)].min(axis=1)
+
+    def estimate(self, key):
+        return int(self.estimate_many([key])[0])
+
+    def _updateCandidates(self, keys, estimates):
+        """Keep the topK largest estimates among the current candidates and a new batch"""
+        pool = list(self.candidates)
+        candidates = dict(zip(pool, self.estimate_many(pool).tolist()))
+        # Only batch keys that beat the weakest candidate can enter the top k
+        floor = min(candidates.values()) if len(candidates) >= self.topK else -1
+        hot = np.flatnonzero(estimates > floor)
+        if isinstance(keys, np.ndarray):
+            hot = hot[np.unique(keys[hot], return_index=True)[1]]  # one index per distinct key
+        for i in hot.tolist():
+            key = keys[i]
+            candidates[key.item() if isinstance(key, np.generic) else key] = int(estimates[i])
+        self.candidates = dict(heapq.nlargest(self.topK, candidates.items(), key=lambda item: item[1]))
+
+    def top(self, n=None):
+        """[(key, estimated count), ...] of the heaviest hitters, largest first"""
+        ranked = sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:n]
+
+    def merge(self, other):
+        """Add another sketch with the same shape (e.g. from another worker) into this one"""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("can only merge sketches with the same width and depth")
+        self.table += other.table
+        self.total += other.total
+        if self.topK:
+            keys = list(other.candidates)
+            self._updateCandidates(keys, self.estimate_many(keys))
+        return self
+
+    @property
+    def nbytes(self):
+        return self.table.nbytes
+
+
+class HyperLogLog:
+    """Distinct-count estimator using 2^p one-byte registers"""
+
+    def __init__(self, p=14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def add_many(self, keys):
+        h = hashPairs(keys)[0]
+        index = (h >> np.uint64(64 - self.p)).astype(np.int64)
+        # The remaining 64-p bits, shifted to the top; the guard bit caps the rank at 64-p+1
+        rest = (h << np.uint64(self.p)) | np.uint64(1 << (self.p - 1))
+        np.maximum.at(self.registers, index, leadingZeros64(rest) + 1)
+
+    def add(self, key):
+        self.add_many([key])
+
+    def count(self):
+        """Estimated number of distinct keys added"""
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # small range: linear counting
+        return round(estimate)
+
+    def __len__(self):
+        return self.count()
+
+    def merge(self, other):
+        """Union with another sketch of the same precision: register-wise maximum"""
+        if self.p != other.p:
+            raise ValueError("can only merge HyperLogLogs with the same precision p")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    @property
+    def nbytes(self):
+        return self.registers.nbytes
+
+
+def leadingZeros64(x):
+    """Leading zero bits of each (non-zero) uint64, by halving the search window"""
+    x = x.copy()
+    zeros = np.zeros(len(x), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        high = x < np.uint64(1 << (64 - shift))  # top `shift` bits are all zero
+        zeros[high] += shift
+        x[high] <<= np.uint64(shift)
+    return zeros
+
+
+# ================================================================
+# BENCHMARK: sketches vs exact dict counting
+# ================================================================
+def benchmark(n=2_000_000, workers=4, seed=11):
+    import pickle
+    import sys
+    import time
+    from collections import Counter
+
+    rng = np.random.default_rng(seed)
+    stream = rng.zipf(1.3, n).astype(np.int64)  # click-stream-like: few hot IDs, long tail
+    clicks = stream.tolist()
+
+    start = time.perf_counter()
+    exact = Counter(clicks)
+    exactTime = time.perf_counter() - start
+    exactBytes = sys.getsizeof(exact) + sum(sys.getsizeof(key) + sys.getsizeof(c) for key, c in exact.items())
+
+    # Each "worker" sketches its share of the stream; the coordinator merges
+    # the pickled sketches, exactly as separate processes would send them
+    start = time.perf_counter()
+    parts = []
+    for chunk in np.array_split(stream, workers):
+        cms, hll = CountMinSketch.from_error(epsilon=0.0001, delta=0.01), HyperLogLog(14)
+        for batch in np.array_split(chunk, 10):
+            cms.update_many(batch)
+            hll.add_many(batch)
+        parts.append(pickle.dumps((cms, hll)))
+    sketchTime = time.perf_counter() - start
+    cms, hll = pickle.loads(parts[0])
+    for blob in parts[1:]:
+        otherCms, otherHll = pickle.loads(blob)
+        cms.merge(otherCms)
+        hll.merge(otherHll)
+
+    trueTop = exact.most_common(10)
+    sketchTop = cms.top(10)
+    overshoot = [cms.estimate(key) - c for key, c in exact.most_common(1000)]
+    distinctError = abs(hll.count() - len(exact)) / len(exact)
+
+    print(f"Benchmark: {n:,} clicks, {len(exact):,} distinct IDs, {workers} merged worker sketches")
+    print(f"  {'':26} {'time s':>8} {'memory':>12}")
+    print(f"  {'Exact Counter (dict)':26} {exactTime:8.3f} {exactBytes / 1e6:9.1f} MB")
+    print(f"  {'Count-Min + HyperLogLog':26} {sketchTime:8.3f} {(cms.nbytes + hll.nbytes) / 1e6:9.1f} MB")
+    print(f"  Count-Min: {cms.depth} x {cms.width} counters, "
+          f"top-10 agreement {len({k for k, _ in trueTop} & {k for k, _ in sketchTop})}/10, "
+          f"mean overestimate of top-1000 IDs {np.mean(overshoot):.1f} (bound ε·N = {0.0001 * n:,.0f})")
+    print(f"  HyperLogLog: {hll.m:,} registers, estimate {hll.count():,} vs exact {len(exact):,} "
+          f"(error {distinctError:.2%})")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" COUNT-MIN SKETCH & HYPERLOGLOG ")
+    print("============================\n")
+
+    pages = ['home'] * 50 + ['cart'] * 20 + ['help'] * 5 + [f"item{i}" for i in range(100)]
+    cms = CountMinSketch(width=64, depth=4, topK=3)
+    cms.update_many(pages)
+    print("Estimated 'home':", cms.estimate('home'), "| 'cart':", cms.estimate('cart'), "| 'nope':", cms.estimate('nope'))
+    print("Top 3 pages:", cms.top(), "\n")
+
+    left, right = HyperLogLog(10), HyperLogLog(10)
+    left.add_many(np.arange(0, 6000))
+    right.add_many(np.arange(4000, 10000))
+    print("Distinct in worker A:", left.count(), "| worker B:", right.count(), "| merged:", left.merge(right).count(),
+          "(exact 10000)\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ Memory is fixed by the error target, not by the number of distinct elements.")
+    print("✅ Sketches from different workers merge: add the tables (CMS) / take the maximum (HLL).")
+    print("❌ A C-level Counter is faster while the exact counts still fit in memory.")
+    print("❌ Answers are approximate: Count-Min may overcount, HyperLogLog is off by ~1.04/√m.\n")
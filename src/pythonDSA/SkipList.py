@@ -0,0 +1,241 @@
+# ================================================================
+# PYTHON DEMO: Skip List (probabilistic sorted linked list)
+# ================================================================
+# A sorted linked list (LinkedList.py) can only be searched by walking
+# it node by node: O(n).
+#
+# A skip list adds "express lanes" on top of the sorted list:
+#  - Level 1 links every node (the ordinary sorted linked list)
+#  - Each node is promoted to the next level with probability p,
+#    so level k links about n·p^(k-1) nodes
+#  - Search starts on the highest lane, moves right while the next key
+#    is smaller, then drops one level → O(log n) expected steps
+#  - Insert/delete only relink the predecessors found by that search:
+#    no rotations or rebalancing as in the AVL tree
+#
+# Levels are random; pass a seed to get the same structure (and the
+# same benchmark numbers) on every run.
+# ================================================================
+
+import random
+
+
+class SkipNode:
+    """Skip list node: forward[i] is the next node on level i + 1"""
+    __slots__ = ("key", "forward")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * level
+
+
+class SkipList:
+    """Sorted multiset with O(log n) expected search, insert and delete"""
+
+    def __init__(self, p=0.5, maxLevel=32, seed=None):
+        if not 0 < p < 1:
+            raise ValueError("p must be between 0 and 1")
+        self.p = p
+        self.maxLevel = maxLevel
+        self.rng = random.Random(seed)  # seed=None → different levels on every run
+        self.head = SkipNode(None, maxLevel)
+        self.level = 1  # highest level currently in use
+        self.count = 0
+
+    def _randomLevel(self):
+        level = 1
+        while level < self.maxLevel and self.rng.random() < self.p:
+            level += 1
+        return level
+
+    def _predecessors(self, key, inclusive=False):
+        """Last node on each level whose key is < key (or <= key when inclusive)"""
+        update = [self.head] * self.maxLevel
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and (following.key < key or inclusive and following.key == key):
+                node = following
+                following = node.forward[i]
+            update[i] = node
+        return update
+
+    # -------------------------------------------------
+    # Search / bounds
+    # -------------------------------------------------
+    def lower_bound(self, key):
+        """Smallest stored key >= key, or None (like bisect_left)"""
+        node = self._predecessors(key)[0].forward[0]
+        return None if node is None else node.key
+
+    def upper_bound(self, key):
+        """Smallest stored key > key, or None (like bisect_right)"""
+        node = self._predecessors(key, inclusive=True)[0].forward[0]
+        return None if node is None else node.key
+
+    def search(self, key):
+        """True if key is stored (O(log n) expected)"""
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            following = node.forward[i]
+            while following is not None and following.key < key:
+                node = following
+                following = node.forward[i]
+        node = node.forward[0]
+        return node is not None and node.key == key
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    # -------------------------------------------------
+    # Insert / delete
+    # -------------------------------------------------
+    def insert(self, key):
+        """Insert key (duplicates allowed, placed after equal keys)"""
+        update = self._predecessors(key, inclusive=True)
+        level = self._randomLevel()
+        if level > self.level:
+            self.level = level  # new lanes start at the head (already in update)
+        node = SkipNode(key, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+        self.count += 1
+
+    def delete(self, key):
+        """Remove one occurrence of key; returns False if it was not stored"""
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or node.key != key:
+            return False
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self.count -= 1
+        return True
+
+    # -------------------------------------------------
+    # Iteration
+    # -------------------------------------------------
+    def iter_range(self, lo=None, hi=None):
+        """Lazily yield keys in [lo, hi] in ascending order (None = unbounded)"""
+        node = self.head.forward[0] if lo is None else self._predecessors(lo)[0].forward[0]
+        while node is not None and (hi is None or node.key <= hi):
+            yield node.key
+            node = node.forward[0]
+
+    def __iter__(self):
+        return self.iter_range()
+
+    def __len__(self):
+        return self.count
+
+    def levelCounts(self):
+        """Number of nodes linked on each level (level 1 first)"""
+        counts = []
+        for i in range(self.level):
+            n, node = 0, self.head.forward[i]
+            while node is not None:
+                n += 1
+                node = node.forward[i]
+            counts.append(n)
+        return counts
+
+    def __repr__(self):
+        return "SkipList([" + ", ".join(repr(key) for key in self) + "])"
+
+
+# ==============================
+# Benchmark
+# ==============================
+def benchmark(n=200_000, queries=20_000, seed=9):
+    """Compare with a linear search of a sorted LinkedList and with the AVL tree"""
+    import os
+    import time
+    from contextlib import redirect_stdout
+    from AVLTree import AVLTree
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import LinkedList  # runs its demo on import, silenced here
+
+    rng = random.Random(seed)
+    timestamps = rng.sample(range(10 * n), n)
+    probes = [rng.randrange(10 * n) for _ in range(queries)]
+
+    def timed(action):
+        start = time.perf_counter()
+        result = action()
+        return time.perf_counter() - start, result
+
+    skip = SkipList(seed=seed)
+    skipInsert, _ = timed(lambda: [skip.insert(t) for t in timestamps])
+    skipSearch, skipHits = timed(lambda: sum(1 for t in probes if skip.search(t)))
+    skipDelete, _ = timed(lambda: [skip.delete(t) for t in timestamps[::2]])
+
+    tree = AVLTree()
+    treeInsert, _ = timed(lambda: [tree.insert(t) for t in timestamps])
+    treeSearch, treeHits = timed(lambda: sum(1 for t in probes if t in tree))
+    treeDelete, _ = timed(lambda: [tree.delete(t) for t in timestamps[::2]])
+
+    head = None
+    for t in sorted(timestamps, reverse=True):
+        node = LinkedList.Node(t)
+        node.next = head
+        head = node
+
+    def linearSearch(key):
+        node = head
+        while node is not None and node.data < key:  # sorted: stop at the first key >= key
+            node = node.next
+        return node is not None and node.data == key
+
+    sample = max(1, queries // 200)  # linear searches are slow: time a few and scale
+    linearSearchTime, _ = timed(lambda: [linearSearch(t) for t in probes[:sample]])
+    stored = set(timestamps)
+    assert skipHits == treeHits == sum(1 for t in probes if t in stored)
+
+    again = SkipList(seed=seed)
+    for t in timestamps:
+        again.insert(t)
+    first = SkipList(seed=seed)
+    for t in timestamps:
+        first.insert(t)
+
+    print(f"Benchmark: {n:,} timestamps, {queries:,} searches")
+    print(f"  {'':22} {'insert all s':>12} {'searches s':>11} {'delete half s':>13}")
+    print(f"  {'Sorted LinkedList':22} {'':>12} {linearSearchTime * queries / sample:11.3f} {'':>13}  (scaled from {sample} searches)")
+    print(f"  {'SkipList (p = 0.5)':22} {skipInsert:12.3f} {skipSearch:11.3f} {skipDelete:13.3f}")
+    print(f"  {'AVLTree':22} {treeInsert:12.3f} {treeSearch:11.3f} {treeDelete:13.3f}")
+    print(f"  Nodes per level: {first.levelCounts()[:8]} ...")
+    print(f"  Same seed → same levels: {first.levelCounts() == again.levelCounts()}")
+
+
+# ==============================
+# DEMONSTRATION
+# ==============================
+if __name__ == "__main__":
+    print("\n==============================")
+    print(" DEMO: Skip List ")
+    print("==============================\n")
+
+    events = SkipList(p=0.5, seed=1)
+    for t in [1005, 1001, 1010, 1003, 1007, 1003, 1020, 1015]:
+        events.insert(t)
+    print("Events (sorted):", list(events))
+    print("Nodes per level:", events.levelCounts())
+    print("search(1007):", events.search(1007), "| search(1008):", events.search(1008))
+    print("lower_bound(1004):", events.lower_bound(1004), "| upper_bound(1003):", events.upper_bound(1003))
+    print("Events in [1003, 1010]:", list(events.iter_range(1003, 1010)))
+    events.delete(1003)
+    print("After deleting one 1003:", list(events), "\n")
+
+    benchmark()
+
+    print("\n==============================")
+    print(" IMPORTANT NOTES ")
+    print("==============================")
+    print("1. Expected O(log n) search/insert/delete, with only pointer updates (no rotations).")
+    print("2. Random levels: p trades memory (1/(1-p) pointers per node) for search speed.")
+    print("3. A seed makes the random levels (and so benchmark results) reproducible.")
+    print("4. Level 1 is an ordinary sorted linked list, so range scans are simple walks.\n")
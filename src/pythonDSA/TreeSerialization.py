@@ -0,0 +1,205 @@
+"""
+Compact Binary Serialization for BST / AVL Trees (Memory-Mapped Loading)
+------------------------------------------------------------------------
+This program demonstrates:
+- Saving a tree in level order with fixed-width (int64) keys
+- Storing the shape as a child bitmap: 2 bits per node (has-left, has-right)
+- A small rank directory so a child's position is found in O(1)
+- Searching straight from a memory-mapped file, without rebuilding nodes
+
+Works with the nodes of BinarySearchTrees.py and AVLTree.py (.data/.left/.right).
+
+File layout (every section starts on an 8-byte boundary):
+    header  : magic, version, byte order, node count, bitmap word count
+    keys    : count x int64 in level order
+    bitmap  : words x uint64, bit 2i = node i has a left child, bit 2i+1 = right child
+    ranks   : words x uint32, number of set bits before each bitmap word
+
+Why it works: in level order the children appear in the same order as their
+set bits in the bitmap, so the child behind bit b is node (set bits before b) + 1.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+
+MAGIC = b"BSTM"
+VERSION = 1
+HEADER = struct.Struct("<4sHcxqq")  # magic, version, byte order, count, bitmap words
+HEADER_SIZE = 32  # HEADER padded to keep the key section 8-byte aligned
+
+
+def dumpTree(root, path):
+    """Write the tree rooted at root to path in the compact level-order format"""
+    keys = array('q')
+    bits = []  # one (hasLeft, hasRight) pair per node, in level order
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        keys.append(node.data)
+        bits.append(node.left is not None)
+        bits.append(node.right is not None)
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+    words = array('Q', [0]) * ((len(bits) + 63) // 64)
+    for b, isSet in enumerate(bits):
+        if isSet:
+            words[b >> 6] |= 1 << (b & 63)
+
+    ranks = array('I')
+    total = 0
+    for word in words:
+        ranks.append(total)
+        total += word.bit_count()
+    if len(ranks) % 2:
+        ranks.append(0)  # pad the last section to 8 bytes
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, sys.byteorder[0].encode(), len(keys), len(words)).ljust(HEADER_SIZE, b"\0"))
+        keys.tofile(f)
+        words.tofile(f)
+        ranks.tofile(f)
+    return len(keys)
+
+
+class MappedTree:
+    """Read-only tree answering search() directly from a memory-mapped file"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, byteorder, self.count, nWords = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a serialized tree (version {VERSION})")
+        if byteorder != sys.byteorder[0].encode():
+            self.close()
+            raise ValueError(f"{path} was written on a machine with a different byte order")
+
+        # Zero-copy views over the mapping: pages load only when a search touches them
+        view = memoryview(self.map)
+        keysEnd = HEADER_SIZE + 8 * self.count
+        wordsEnd = keysEnd + 8 * nWords
+        self.keys = view[HEADER_SIZE:keysEnd].cast('q')
+        self.words = view[keysEnd:wordsEnd].cast('Q')
+        self.ranks = view[wordsEnd:wordsEnd + 4 * nWords].cast('I')
+        view.release()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        return self.search(key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def search(self, key):
+        """Return True if key is stored in the tree (O(height) page touches)"""
+        if self.count == 0:
+            return False
+        keys, words, ranks = self.keys, self.words, self.ranks
+        i = 0
+        while True:
+            k = keys[i]
+            if key == k:
+                return True
+            b = 2 * i + (key > k)  # left bit, or right bit
+            word = words[b >> 6]
+            offset = b & 63
+            if not (word >> offset) & 1:
+                return False
+            i = ranks[b >> 6] + (word & ((1 << offset) - 1)).bit_count() + 1
+
+    def close(self):
+        """Release the views and unmap the file"""
+        for name in ("keys", "words", "ranks"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self.map.close()
+        self.file.close()
+
+
+# -------------------------
+# Benchmark
+# -------------------------
+def benchmark(n=1_000_000, lookups=1_000, path="tree_benchmark.bin"):
+    """Compare rebuilding an AVL tree at start-up with opening the mapped file"""
+    import os
+    import random
+    import time
+    from AVLTree import AVLTree
+
+    keys = range(0, 2 * n, 2)
+    dumpTree(AVLTree.from_sorted(keys).root, path)
+    probes = random.Random(1).sample(range(2 * n), lookups)
+
+    start = time.perf_counter()
+    tree = AVLTree.from_sorted(keys)  # what every process start does today
+    hits = sum(1 for key in probes if key in tree)
+    rebuild = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with MappedTree(path) as mapped:
+        mappedHits = sum(1 for key in probes if key in mapped)
+    coldOpen = time.perf_counter() - start
+    assert hits == mappedHits
+
+    print(f"Benchmark: {n:,} keys, {lookups:,} lookups after start-up")
+    print(f"  File size                         : {os.path.getsize(path) / 2**20:8.2f} MB "
+          f"({os.path.getsize(path) / n:.2f} bytes/key)")
+    print(f"  Rebuild AVLTree + lookups         : {rebuild:8.3f} s")
+    print(f"  Open MappedTree + lookups         : {coldOpen:8.3f} s")
+    os.remove(path)
+
+
+# -------------------------
+# Demonstration
+# -------------------------
+if __name__ == "__main__":
+    import os
+    from BinarySearchTrees import TreeNode, inOrderTraversal
+
+    print("\n========== Compact Tree Serialization Demonstration ==========\n")
+
+    root = TreeNode(13)
+    root.left = TreeNode(7)
+    root.right = TreeNode(15)
+    root.left.left = TreeNode(3)
+    root.left.right = TreeNode(8)
+    root.right.left = TreeNode(14)
+    root.right.right = TreeNode(19)
+    root.right.right.left = TreeNode(18)
+
+    print("BST In-order: ", end="")
+    inOrderTraversal(root)
+    print()
+
+    path = "demo_tree.bin"
+    count = dumpTree(root, path)
+    print(f"Saved {count} nodes to '{path}' ({os.path.getsize(path)} bytes)\n")
+
+    with MappedTree(path) as tree:
+        print("Level-order keys in file:", list(tree.keys))
+        print("Child bitmap (LSB first):", format(tree.words[0], "016b")[::-1])
+        for value in (8, 18, 10):
+            print(f"Search {value:2} in mapped file →", tree.search(value))
+    os.remove(path)
+    print()
+
+    benchmark()
+
+    print("\n========== Important Notes ==========")
+    print("1. Keys are fixed-width int64, the shape costs 2 bits + a small rank table per node.")
+    print("2. Searches read the mapping directly: no Python nodes are rebuilt on start-up.")
+    print("3. Only the pages a search touches are read from disk (cold start ∝ pages touched).")
+    print("4. The file is read-only; rebuild and re-dump it to apply changes.\n")
@@ -48,6 +48,125 @@ print("--- Important Note ---")
 print("Traversal is the foundation of working with trees. Preorder is used for copying trees,")
 print("Inorder is used in BSTs to get sorted order, Postorder is used for deletion.\n")
 
+# ================================================================
+# STREAMING TRAVERSALS (EXPLICIT STACK, NO RECURSION)
+# ================================================================
+# The functions above build a new list at every level (O(n) temporaries per
+# level) and recurse once per level, so a degenerate tree of a few thousand
+# nodes already hits the recursion limit. These generators yield one value
+# at a time and keep at most O(height) nodes on their own stack.
+def iter_preorder(root):
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node.value
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def iter_inorder(root):
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.value
+        node = node.right
+
+def iter_postorder(root):
+    stack = []
+    node = root
+    lastVisited = None
+    while stack or node:
+        if node:
+            stack.append(node)
+            node = node.left
+        else:
+            top = stack[-1]
+            if top.right and top.right is not lastVisited:
+                node = top.right  # right subtree not done yet
+            else:
+                yield top.value
+                lastVisited = stack.pop()
+
+# ================================================================
+# MORRIS TRAVERSALS (O(1) EXTRA MEMORY)
+# ================================================================
+# Instead of a stack, Morris traversal temporarily points the right link of
+# each node's inorder predecessor back at the node ("thread") and removes the
+# thread on the second visit. The tree is restored once the walk finishes;
+# if the consumer stops early, the remaining walk runs silently to unthread it.
+def _morrisFinish(node):
+    while node:
+        if node.left is None:
+            node = node.right
+        else:
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+            if pred.right is None:
+                pred.right = node
+                node = node.left
+            else:
+                pred.right = None
+                node = node.right
+
+def morris_inorder(root):
+    node = root
+    try:
+        while node:
+            if node.left is None:
+                value, node = node.value, node.right
+                yield value
+            else:
+                pred = node.left
+                while pred.right and pred.right is not node:
+                    pred = pred.right
+                if pred.right is None:
+                    pred.right = node  # create thread, go left
+                    node = node.left
+                else:
+                    pred.right = None  # remove thread, left side done
+                    value, node = node.value, node.right
+                    yield value
+    finally:
+        _morrisFinish(node)
+
+def morris_preorder(root):
+    node = root
+    try:
+        while node:
+            if node.left is None:
+                value, node = node.value, node.right
+                yield value
+            else:
+                pred = node.left
+                while pred.right and pred.right is not node:
+                    pred = pred.right
+                if pred.right is None:
+                    pred.right = node  # create thread, visit node, go left
+                    value, node = node.value, node.left
+                    yield value
+                else:
+                    pred.right = None  # remove thread, left side done
+                    node = node.right
+    finally:
+        _morrisFinish(node)
+
+print("=== Streaming Traversals (same tree) ===")
+print("iter_preorder   :", list(iter_preorder(root)))
+print("iter_inorder    :", list(iter_inorder(root)))
+print("iter_postorder  :", list(iter_postorder(root)))
+print("morris_inorder  :", list(morris_inorder(root)))
+print("morris_preorder :", list(morris_preorder(root)), "\n")
+
+print("--- Important Note ---")
+print("✅ Generators stream values: no intermediate lists, no recursion limit.")
+print("✅ Morris traversal needs O(1) extra memory but briefly modifies the tree (not thread-safe).\n")
+
 # ================================================================
 # BINARY SEARCH TREE (BST)
 # ================================================================
@@ -197,3 +316,63 @@ Trees (BST / AVL):
 # END OF DEMO
 # ================================================================
 print("\n🎯 Demo Complete: Trees in Python (Binary Tree, BST, AVL Tree)\n")
+
+# ================================================================
+# TRAVERSAL TIMINGS (run this file directly)
+# ================================================================
+def benchmarkTraversals(n=1_000_000):
+    import time
+    from collections import deque
+
+    def buildBalanced(values):
+        # Iterative build: (node, lo, hi) ranges still waiting for children
+        if not values:
+            return None
+        mid = (len(values) - 1) // 2
+        tree = TreeNode(values[mid])
+        pending = [(tree, 0, len(values) - 1, mid)]
+        while pending:
+            node, lo, hi, mid = pending.pop()
+            if lo <= mid - 1:
+                m = (lo + mid - 1) // 2
+                node.left = TreeNode(values[m])
+                pending.append((node.left, lo, mid - 1, m))
+            if mid + 1 <= hi:
+                m = (mid + 1 + hi) // 2
+                node.right = TreeNode(values[m])
+                pending.append((node.right, mid + 1, hi, m))
+        return tree
+
+    def buildSkewed(count):
+        # What BST.insert produces for sorted input: a right-leaning chain
+        tree = None
+        for v in range(count - 1, -1, -1):
+            node = TreeNode(v)
+            node.right = tree
+            tree = node
+        return tree
+
+    traversals = [
+        ("preorder (recursive lists)", preorder),
+        ("inorder (recursive lists)", inorder),
+        ("postorder (recursive lists)", postorder),
+        ("iter_preorder", iter_preorder),
+        ("iter_inorder", iter_inorder),
+        ("iter_postorder", iter_postorder),
+        ("morris_preorder", morris_preorder),
+        ("morris_inorder", morris_inorder),
+    ]
+    for shape, tree in (("balanced", buildBalanced(range(n))), ("skewed", buildSkewed(n))):
+        print(f"Traversal timings on a {n:,}-node {shape} tree:")
+        for name, traversal in traversals:
+            start = time.perf_counter()
+            try:
+                deque(traversal(tree), maxlen=0)  # consume without storing
+                result = f"{time.perf_counter() - start:8.3f} s"
+            except RecursionError:
+                result = "RecursionError"
+            print(f"  {name:28}: {result}")
+        print()
+
+if __name__ == "__main__":
+    benchmarkTraversals()
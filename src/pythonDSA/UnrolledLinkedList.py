@@ -0,0 +1,277 @@
+# ================================================================
+# UNROLLED LINKED LIST - DEMONSTRATION PROGRAM
+# ================================================================
+# traverseAndPrint / findLowestValue in LinkedList.py follow one
+# pointer per element. Every hop is a Python-level step to a node
+# that may live anywhere in memory.
+#
+# An unrolled linked list stores a small array ("chunk") of up to B
+# elements in every node:
+#   - scans run over whole chunks at C speed (min/max/sum per chunk)
+#   - finding position i skips whole chunks: O(n/B) hops instead of O(n)
+#   - insert into a full chunk splits it in two; a delete that leaves a
+#     chunk less than half full merges it with (or borrows from) the next
+#   - append fills the tail chunk: O(1) amortized
+#
+# Chunks are Python lists, or array.array when a typecode is given
+# (e.g. 'q' or 'd'), which stores numbers without per-element objects.
+# ================================================================
+
+from array import array
+
+
+class Chunk:
+    """Unrolled list node: a small array of elements plus the next pointer"""
+    __slots__ = ("items", "next")
+
+    def __init__(self, items):
+        self.items = items
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """Singly linked list of fixed-capacity chunks, with a tail pointer"""
+
+    def __init__(self, iterable=(), capacity=64, typecode=None):
+        if capacity < 2:
+            raise ValueError("chunk capacity must be at least 2")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.head = self.tail = Chunk(self._newItems())
+        self.size = 0
+        self.extend(iterable)
+
+    def _newItems(self, values=()):
+        return array(self.typecode, values) if self.typecode else list(values)
+
+    # -------------------------------------------------
+    # Positional access
+    # -------------------------------------------------
+    def _seek(self, index):
+        """(chunk, offset) holding position index, skipping whole chunks: O(n/B)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+        chunk = self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.next
+        return chunk, index
+
+    def __getitem__(self, index):
+        chunk, offset = self._seek(index)
+        return chunk.items[offset]
+
+    def __setitem__(self, index, value):
+        chunk, offset = self._seek(index)
+        chunk.items[offset] = value
+
+    # -------------------------------------------------
+    # Insertion
+    # -------------------------------------------------
+    def append(self, value):
+        tail = self.tail
+        if len(tail.items) == self.capacity:
+            tail.next = self.tail = tail = Chunk(self._newItems())
+        tail.items.append(value)
+        self.size += 1
+
+    def extend(self, iterable):
+        """Append many values, filling chunks a slice at a time"""
+        values = self._newItems(iterable)
+        start = 0
+        while start < len(values):
+            tail = self.tail
+            if len(tail.items) == self.capacity:
+                tail.next = self.tail = tail = Chunk(self._newItems())
+            room = self.capacity - len(tail.items)
+            tail.items.extend(values[start:start + room])
+            start += room
+        self.size += len(values)
+
+    def _split(self, chunk):
+        """Move the upper half of a full chunk into a new chunk right after it"""
+        half = len(chunk.items) // 2
+        new = Chunk(chunk.items[half:])
+        del chunk.items[half:]
+        new.next = chunk.next
+        chunk.next = new
+        if self.tail is chunk:
+            self.tail = new
+
+    def insert(self, index, value):
+        """Insert before position index (index == len appends)"""
+        if index < 0:
+            index = max(0, index + self.size)
+        if index >= self.size:
+            self.append(value)
+            return
+        chunk, offset = self._seek(index)
+        if len(chunk.items) == self.capacity:
+            self._split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next
+        chunk.items.insert(offset, value)
+        self.size += 1
+
+    # -------------------------------------------------
+    # Deletion
+    # -------------------------------------------------
+    def _rebalance(self, chunk, previous):
+        """Keep chunks at least half full: merge with or borrow from the next chunk"""
+        half = self.capacity // 2
+        following = chunk.next
+        if len(chunk.items) >= half:
+            return
+        if following is not None:
+            if len(chunk.items) + len(following.items) <= self.capacity:
+                chunk.items.extend(following.items)  # merge
+                chunk.next = following.next
+                if self.tail is following:
+                    self.tail = chunk
+            else:
+                take = half - len(chunk.items)  # borrow from the front of the next chunk
+                chunk.items.extend(following.items[:take])
+                del following.items[:take]
+        elif not chunk.items and previous is not None:
+            previous.next = None  # drop an empty tail chunk
+            self.tail = previous
+
+    def pop(self, index=-1):
+        """Remove and return the element at index (default: last)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("pop index out of range")
+        previous, chunk = None, self.head
+        while index >= len(chunk.items):
+            index -= len(chunk.items)
+            previous, chunk = chunk, chunk.next
+        value = chunk.items.pop(index)
+        self.size -= 1
+        self._rebalance(chunk, previous)
+        return value
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    # -------------------------------------------------
+    # Scans: one C-level pass per chunk
+    # -------------------------------------------------
+    def chunks(self):
+        chunk = self.head
+        while chunk is not None:
+            yield chunk.items
+            chunk = chunk.next
+
+    def min(self):
+        if not self.size:
+            raise ValueError("min() of an empty list")
+        return min(min(items) for items in self.chunks() if items)
+
+    def max(self):
+        if not self.size:
+            raise ValueError("max() of an empty list")
+        return max(max(items) for items in self.chunks() if items)
+
+    def sum(self):
+        return sum(sum(items) for items in self.chunks())
+
+    def __iter__(self):
+        for items in self.chunks():
+            yield from items
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return " -> ".join(str(list(items)) for items in self.chunks()) + " -> null"
+
+
+# -------------------------------------------------
+# Benchmark: unrolled list vs LinkedList.Node (one pointer per element)
+# -------------------------------------------------
+def benchmark(n=2_000_000, capacity=64, seeks=1_000, seed=4):
+    import os
+    import random
+    import time
+    from contextlib import redirect_stdout
+
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        import LinkedList  # runs its demo on import, silenced here
+
+    rng = random.Random(seed)
+    values = [rng.randrange(10**9) for _ in range(n)]
+    positions = [rng.randrange(n) for _ in range(seeks)]
+
+    def timed(action):
+        start = time.perf_counter()
+        result = action()
+        return time.perf_counter() - start, result
+
+    def buildSingly():
+        head = tail = LinkedList.Node(values[0])
+        for value in values[1:]:
+            tail.next = LinkedList.Node(value)
+            tail = tail.next
+        return head
+
+    def sumSingly():
+        total, node = 0, head
+        while node:
+            total += node.data
+            node = node.next
+        return total
+
+    def seekSingly(index):
+        node = head
+        for _ in range(index):
+            node = node.next
+        return node.data
+
+    sample = max(1, seeks // 50)  # pointer-chasing seeks are slow: time a few and scale
+    buildTime, head = timed(buildSingly)
+    rows = {"LinkedList.Node": (
+        buildTime,
+        timed(lambda: LinkedList.findLowestValue(head)),
+        timed(sumSingly),
+        timed(lambda: [seekSingly(i) for i in positions[:sample]])[0] * seeks / sample,
+    )}
+    del head
+
+    for label, typecode in (("Unrolled, list chunks", None), ("Unrolled, array('q')", 'q')):
+        buildTime, ull = timed(lambda: UnrolledLinkedList(values, capacity, typecode))
+        rows[label] = (buildTime, timed(ull.min), timed(ull.sum), timed(lambda: [ull[i] for i in positions])[0])
+
+    print(f"Benchmark with {n:,} integers (chunk capacity {capacity}):")
+    print(f"  {'':24} {'build s':>8} {'min s':>8} {'sum s':>8} {f'{seeks:,} seeks s':>14}")
+    results = set()
+    for label, (build, (minTime, low), (sumTime, total), seekTime) in rows.items():
+        results.add((low, total))
+        print(f"  {label:24} {build:8.3f} {minTime:8.3f} {sumTime:8.3f} {seekTime:14.3f}")
+    assert len(results) == 1
+    print("  (LinkedList.Node seeks scaled from a sample)")
+
+
+if __name__ == "__main__":
+    print("\n============================")
+    print(" UNROLLED LINKED LIST ")
+    print("============================\n")
+
+    ull = UnrolledLinkedList([7, 11, 3, 2, 9, 15, 4], capacity=4)
+    print("Chunks:", ull)
+    ull.insert(2, 97)  # first chunk is full → split
+    print("After insert(2, 97):", ull)
+    del ull[0]
+    del ull[0]
+    print("After deleting 2 elements (merge/borrow keeps chunks ≥ half full):", ull)
+    print(f"ull[4] = {ull[4]} | min = {ull.min()} | max = {ull.max()} | sum = {ull.sum()}\n")
+
+    benchmark()
+
+    print("\n--- Important Note ---")
+    print("✅ One pointer hop per chunk of B elements: seeks skip B elements at a time.")
+    print("✅ min/max/sum run in C over each chunk instead of one Python step per node.")
+    print("❌ Inserting inside a chunk shifts up to B elements (cheap for small B).\n")